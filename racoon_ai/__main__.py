@@ -6,13 +6,14 @@
 from configparser import ConfigParser
 from logging import DEBUG, INFO, FileHandler, Formatter, Logger, StreamHandler, getLogger, shutdown
 from subprocess import Popen
-from time import sleep
 from typing import Callable, Optional
 
-from .game import Game
+from .game import Game, create_timer
+from .models.robot import SimCommands
 from .movement import Controls, create_controls
-from .networks.sender import CommandSender, create_sender
-from .observer import Observer, create_observer
+from .networks.receiver import MWSupervisor, PacketSource
+from .networks.sender import AsyncSender, CommandSender, create_sender
+from .observer import Observer, create_observer, create_receiver
 
 
 class RacoonMain:
@@ -29,11 +30,20 @@ class RacoonMain:
 
         self.__logger: Logger = logger
 
-        self.__racoon_mw: Optional[Popen[bytes]] = self.exec_mw() if with_mw else None
-
-        sleep(2.5)
-
-        self.__observer: Observer = create_observer(self.__conf, self.__logger)
+        # NOTE: Wait for the first packet of MW instead of a fixed delay; MW is restarted if it dies or goes silent
+        receiver: PacketSource = create_receiver(self.__conf, self.__logger)
+        self.__racoon_mw: Optional[MWSupervisor] = None
+        if with_mw and not conf.get("mw_receiver", "replay", fallback=""):
+            self.__racoon_mw = MWSupervisor(
+                receiver,
+                self.exec_mw,
+                ready_timeout=conf.getfloat("racoon_mw", "ready_timeout", fallback=10),
+                stall_timeout=conf.getfloat("racoon_mw", "stall_timeout", fallback=3),
+            )
+            receiver = self.__racoon_mw
+            self.__racoon_mw.wait_ready()
+
+        self.__observer: Observer = create_observer(self.__conf, self.__logger, receiver)
 
         self.__controls: Controls = create_controls(self.__conf, self.__logger, self.__observer)
 
@@ -45,13 +55,25 @@ class RacoonMain:
             self.__observer.is_team_yellow,
         )
 
+        # NOTE: Pipeline: receive (thread of MWReceiver) -> decide (this thread) -> send (thread of AsyncSender)
+        self.__async_sender: Optional[AsyncSender] = None
+        send: Callable[[SimCommands], None] = self.__sender.send
+        # NOTE: With the radio transmitter, `send` only hands the commands over already
+        if conf.getboolean("pipeline", "enabled", fallback=False) and not self.__sender.is_transmitting:
+            self.__async_sender = AsyncSender(self.__sender.send)
+            send = self.__async_sender.put
+
         self.__game: Game = Game(
             self.__observer,
             self.__controls,
-            self.__sender.send,
+            send,
             show_gui=conf.getboolean("commons", "showGui"),
+            gui_process=conf.getboolean("gui", "use_process", fallback=True),
             use_test_rule=conf.getboolean("commons", "useTestRule"),
             keeper_id=conf.getint("role", "keeper_id"),
+            timer=create_timer(self.__conf, self.__logger),
+            rate=conf.getfloat("scheduler", "rate", fallback=0),
+            max_stale=conf.getint("scheduler", "max_stale", fallback=6),
         )
 
         self.__game.main()
@@ -64,6 +86,9 @@ class RacoonMain:
         del self.__racoon_mw
         del self.__observer
         del self.__controls
+        if self.__async_sender:
+            self.__async_sender.close()
+        del self.__async_sender
         del self.__sender
         del self.__game
 
@@ -97,15 +122,19 @@ class RacoonMain:
 
     def __kill_mw(self) -> None:
         if self.__racoon_mw:
-            self.__logger.info("Killing MW...")
-            self.__racoon_mw.kill()
+            self.__racoon_mw.close()
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
     from sys import exit as sys_exit
 
     from . import __version__
 
+    arg_parser = ArgumentParser(prog="racoon_ai")
+    arg_parser.add_argument("-c", "--config", default="racoon_ai/config.ini", help="path to the config file")
+    args = arg_parser.parse_args()
+
     logo: str = """
         ######     ###      ####    #####    #####   ##   ##             ###     ######
         ##  ##   ## ##    ##  ##  ### ###  ### ###  ###  ##            ## ##      ##
@@ -136,7 +165,7 @@ if __name__ == "__main__":
     log.info("Running v%s", __version__)
 
     parser = ConfigParser()
-    parser.read("racoon_ai/config.ini")
+    parser.read(args.config)
 
     racoon: RacoonMain = RacoonMain(parser, log, parser.getboolean("commons", "withMW"))
     sys_exit(0)
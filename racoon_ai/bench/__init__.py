@@ -0,0 +1,21 @@
+#!/usr/bin/env python3.10
+
+"""bench
+
+    This module contains the benchmarks (no sockets, no GUI).
+        - controls (PID of Controls)
+        - cycle (`python -m racoon_ai.bench`)
+        - fanout (UDP send stage over loopback)
+        - generator (synthetic MW over UDP)
+        - lookup
+        - mpc (sampling MPC against its budget)
+        - sender (serialization of the commands)
+        - startup (cold start to the first command)
+        - synthetic
+"""
+
+from . import synthetic
+
+__all__ = [
+    "synthetic",
+]
@@ -0,0 +1,10 @@
+#!/usr/bin/env python3.10
+
+"""
+    Run the end-to-end cycle benchmark.
+"""
+
+from .cycle import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3.10
+
+"""controls.py
+
+    Micro-benchmark of Controls: per-robot `pid` and `avoid_*` against the batched `pid_all` and `avoid_all`.
+
+    Usage:
+        python -m racoon_ai.bench.controls [-n NUMBER]
+"""
+
+from argparse import ArgumentParser, Namespace
+from timeit import timeit
+from typing import Callable
+
+from numpy import float64
+from numpy.random import default_rng
+from numpy.typing import NDArray
+
+from racoon_ai.models.coordinate import Point, Pose
+from racoon_ai.models.robot import Robot, RobotCommand
+from racoon_ai.movement import Controls
+from racoon_ai.observer import Observer
+
+from .synthetic import StaticSource, make_packet
+
+
+def _compare(reference: Callable[[], None], batched: Callable[[], None], number: int) -> None:
+    """compare
+
+    Print the time per cycle of the per-robot and the batched function, and the speedup.
+    """
+    reference_time: float = timeit(reference, number=number)
+    batched_time: float = timeit(batched, number=number)
+    print(f"{reference.__name__:>14s}: {reference_time / number * 1e6:8.1f} us/cycle")
+    print(f"{batched.__name__:>14s}: {batched_time / number * 1e6:8.1f} us/cycle")
+    print(f"{'speedup':>14s}: {reference_time / batched_time:8.1f}x")
+
+
+def _bench_pid(controls: Controls, observer: Observer, n_bots: int, number: int) -> None:
+    """bench_pid"""
+    ids: list[int] = list(range(n_bots))
+    targets: NDArray[float64] = default_rng(0).uniform(-3000, 3000, (n_bots, 3))
+    poses: list[Pose] = [Pose(x, y, theta) for x, y, theta in targets.tolist()]
+    bots: list[Robot] = [observer.our_robots[i] for i in ids]
+
+    def pid() -> None:
+        for pose, bot in zip(poses, bots):
+            controls.pid(pose, bot)
+
+    def pid_all() -> None:
+        controls.pid_all(targets, ids)
+
+    _compare(pid, pid_all, number)
+
+
+def _bench_avoid(controls: Controls, observer: Observer, n_bots: int, number: int) -> None:
+    """bench_avoid"""
+    ids: list[int] = list(range(n_bots))
+    targets: NDArray[float64] = default_rng(0).uniform(-3000, 3000, (n_bots, 3))
+    bots: list[Robot] = [observer.our_robots[i] for i in ids]
+    points: list[Point] = [Point(x, y) for x, y, _ in targets.tolist()]
+    cmds: list[RobotCommand] = [RobotCommand(i) for i in ids]
+
+    def avoid() -> None:
+        for cmd, bot, point in zip(cmds, bots, points):
+            controls.avoid_enemy(cmd, bot, point)
+            controls.avoid_ball(cmd, bot, point)
+            controls.avoid_penalty_area(cmd, bot)
+
+    def avoid_all() -> None:
+        controls.avoid_all(cmds, targets, ball_distance=500, penalty_distance=350)
+
+    _compare(avoid, avoid_all, number)
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Benchmark the PID and the avoidance of Controls")
+    parser.add_argument("-n", "--number", type=int, default=5000, help="repetitions of a full cycle of commands")
+    args: Namespace = parser.parse_args()
+
+    observer = Observer(set(range(11)), set(), receiver=StaticSource([make_packet(11, 11)]))
+    controls = Controls(observer)
+
+    for n_bots in (6, 11):
+        print(f"{n_bots:2d} robots:")
+        _bench_pid(controls, observer, n_bots, args.number)
+        _bench_avoid(controls, observer, n_bots, args.number)
+
+
+if __name__ == "__main__":
+    main()
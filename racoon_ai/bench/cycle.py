@@ -0,0 +1,177 @@
+#!/usr/bin/env python3.10
+
+"""cycle.py
+
+    End-to-end benchmark of a control cycle of Game (no sockets, no GUI).
+
+    Each cycle runs the same stages as `Game.main`:
+        observer (Observer.main) -> role (Role.update) -> subrole (Strategy.update_subrole)
+        -> rule (Game._handle_ref_command and its callback) -> proto (SimCommands.to_proto)
+
+    Usage:
+        python -m racoon_ai.bench [-n CYCLES] [-w WARMUP] [--replay LOG] [-c COMMAND ...]
+"""
+
+from argparse import ArgumentParser, Namespace
+from logging import Logger, getLogger
+from time import perf_counter_ns
+from typing import Callable, Final, Sequence
+
+from numpy import array, float64, percentile
+from numpy.typing import NDArray
+
+from racoon_ai.game import Game
+from racoon_ai.game.rules import RULE_ARG_TYPE, rule_handler
+from racoon_ai.models.referee import REF_COMMAND
+from racoon_ai.models.robot import RobotCommand, SimCommands
+from racoon_ai.movement import Controls
+from racoon_ai.networks.receiver import PacketReplayer, PacketSource, find_logs
+from racoon_ai.observer import Observer
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
+
+from .synthetic import StaticSource, make_packet
+
+STAGES: Final[tuple[str, ...]] = ("observer", "role", "subrole", "rule", "proto")
+
+
+def synthetic_packets(
+    commands: Sequence["REF_COMMAND.V"],
+    frames: int,
+    n_our: int = 11,
+    n_enemy: int = 11,
+) -> list[RacoonMW_Packet]:
+    """synthetic_packets
+
+    Args:
+        commands (Sequence[REF_COMMAND.V]): Referee commands to play in turn, `frames` packets each
+        frames (int): Packets per command
+        n_our (int, optional): Number of our robots (default: 11)
+        n_enemy (int, optional): Number of enemy robots (default: 11)
+
+    Returns:
+        list[RacoonMW_Packet]: Packets seeded by their index (same on every run)
+    """
+    return [
+        make_packet(n_our, n_enemy, seed=(i * frames + j), command=command)
+        for i, command in enumerate(commands)
+        for j in range(frames)
+    ]
+
+
+def _cycle(game: Game, logger: Logger) -> tuple[tuple[int, ...], str]:
+    """cycle
+
+    Args:
+        game (Game): Game whose observer reads a PacketSource without sockets
+        logger (Logger): Logger of the rule callbacks
+
+    Returns:
+        tuple[tuple[int, ...], str]: Latencies (ns) per stage and name of the rule callback
+    """
+    observer: Observer = game.observer
+    func: Callable[[Logger, RULE_ARG_TYPE], list[RobotCommand]]
+    args: RULE_ARG_TYPE
+
+    t_0: int = perf_counter_ns()
+    observer.main()
+    t_1: int = perf_counter_ns()
+    game.role.update()
+    t_2: int = perf_counter_ns()
+    game.strategy.update_subrole()
+    t_3: int = perf_counter_ns()
+    func, args = game._handle_ref_command()  # pylint: disable=W0212
+    sim_cmds = SimCommands(observer.is_team_yellow, rule_handler(func, logger, args))
+    t_4: int = perf_counter_ns()
+    sim_cmds.to_proto()
+    t_5: int = perf_counter_ns()
+
+    return (t_1 - t_0, t_2 - t_1, t_3 - t_2, t_4 - t_3, t_5 - t_4), func.__name__
+
+
+def run(game: Game, cycles: int, warmup: int = 0) -> tuple[dict[str, NDArray[float64]], dict[str, int], int]:
+    """run
+
+    Args:
+        game (Game): Game whose observer reads a PacketSource without sockets
+        cycles (int): Cycles to measure
+        warmup (int, optional): Cycles to run before measuring (default: 0)
+
+    Returns:
+        tuple[dict[str, NDArray[float64]], dict[str, int], int]:
+            Latencies (ns) per stage (and "cycle"), calls per rule callback and wall time (ns)
+    """
+    logger: Logger = getLogger(__name__)
+    samples: dict[str, list[int]] = {stage: [] for stage in (*STAGES, "cycle")}
+    callbacks: dict[str, int] = {}
+
+    started: int = perf_counter_ns()
+    for i in range(warmup + cycles):
+        if i == warmup:
+            started = perf_counter_ns()
+
+        latencies, callback = _cycle(game, logger)
+
+        if i < warmup:
+            continue
+        for stage, elapsed in zip(samples.values(), latencies):
+            stage.append(elapsed)
+        samples["cycle"].append(sum(latencies))
+        callbacks[callback] = callbacks.get(callback, 0) + 1
+
+    wall: int = perf_counter_ns() - started
+    return {stage: array(values, dtype=float64) for stage, values in samples.items()}, callbacks, wall
+
+
+def report(latencies: dict[str, NDArray[float64]], callbacks: dict[str, int], wall: int) -> str:
+    """report
+
+    Args:
+        latencies (dict[str, NDArray[float64]]): Latencies (ns) per stage
+        callbacks (dict[str, int]): Calls per rule callback
+        wall (int): Wall time of the measured cycles (ns)
+
+    Returns:
+        str: Table of p50/p95/p99/max (us) per stage and the throughput
+    """
+    lines: list[str] = [f"{'stage':>10s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'max':>9s}  (us)"]
+    for stage, values in latencies.items():
+        p50, p95, p99 = percentile(values, (50, 95, 99)) / 1e3
+        lines.append(f"{stage:>10s} {p50:9.1f} {p95:9.1f} {p99:9.1f} {values.max() / 1e3:9.1f}")
+
+    cycles: int = len(latencies["cycle"])
+    lines.append(f"{cycles} cycles in {wall / 1e9:.3f} s: {cycles / (wall / 1e9):.1f} cycles/s")
+    lines.extend(f"  {name}: {count}" for name, count in sorted(callbacks.items()))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Benchmark a control cycle of Game on recorded or synthetic packets")
+    parser.add_argument("-n", "--cycles", type=int, default=2000, help="cycles to measure (default: 2000)")
+    parser.add_argument("-w", "--warmup", type=int, default=100, help="cycles to skip first (default: 100)")
+    parser.add_argument("--replay", default="", help="log file (or directory) recorded by PacketRecorder")
+    parser.add_argument(
+        "-c",
+        "--command",
+        action="append",
+        choices=REF_COMMAND.keys(),
+        help="referee command of the synthetic packets; repeat to play several in turn (default: NORMAL_START)",
+    )
+    parser.add_argument("--frames", type=int, default=60, help="synthetic packets per command (default: 60)")
+    parser.add_argument("--our", type=int, default=11, help="number of our robots (default: 11)")
+    parser.add_argument("--enemy", type=int, default=11, help="number of enemy robots (default: 11)")
+    parser.add_argument("--yellow", action="store_true", help="play as the yellow team")
+    parser.add_argument("--keeper", type=int, default=0, help="keeper id (default: 0)")
+    args: Namespace = parser.parse_args()
+
+    source: PacketSource
+    if args.replay:
+        source = PacketReplayer(find_logs(args.replay), speed=0, loop=True)
+    else:
+        commands: list["REF_COMMAND.V"] = [REF_COMMAND.Value(name) for name in (args.command or ["NORMAL_START"])]
+        source = StaticSource(synthetic_packets(commands, args.frames, args.our, args.enemy))
+
+    observer = Observer(set(range(args.our)), set(), is_team_yellow=args.yellow, receiver=source)
+    game = Game(observer, Controls(observer), lambda _: None, keeper_id=args.keeper)
+
+    print(report(*run(game, args.cycles, args.warmup)))
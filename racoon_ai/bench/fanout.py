@@ -0,0 +1,127 @@
+#!/usr/bin/env python3.10
+
+"""fanout.py
+
+    Micro-benchmark of the send stage of CommandSender over loopback UDP:
+    the former loop (copy of the destinations, blocking `sendto`, a log call per destination)
+    against UdpFanout, in a loop and batched with sendmmsg (where available).
+
+    Usage:
+        python -m racoon_ai.bench.fanout [-n NUMBER]
+"""
+
+from argparse import ArgumentParser, Namespace
+from logging import Logger, getLogger
+from socket import AF_INET, SOCK_DGRAM, socket
+from timeit import timeit
+from typing import Callable
+
+from racoon_ai.models.network import IPNetAddr
+from racoon_ai.networks.sender import UdpFanout
+
+
+def _drain(sinks: list[socket]) -> int:
+    """drain
+
+    Returns:
+        int: Datagrams received
+    """
+    received: int = 0
+    for sink in sinks:
+        try:
+            while sink.recv(2048):
+                received += 1
+        except BlockingIOError:
+            continue
+    return received
+
+
+def _sinks(count: int) -> list[socket]:
+    """sinks
+
+    Returns:
+        list[socket]: Non-blocking sockets bound to loopback
+    """
+    sinks: list[socket] = []
+    for _ in range(count):
+        sink = socket(AF_INET, SOCK_DGRAM)
+        sink.bind(("127.0.0.1", 0))
+        sink.setblocking(False)
+        sinks.append(sink)
+    return sinks
+
+
+def _former(dists: list[IPNetAddr], packet: bytes) -> Callable[[], None]:
+    """former
+
+    The former send loop of CommandSender (kept here as the reference).
+    """
+    logger: Logger = getLogger(__name__)
+    dist_set: set[IPNetAddr] = set(dists)
+    blocking = socket(AF_INET, SOCK_DGRAM)
+
+    def former() -> None:
+        for dist in set(dist_set):
+            logger.debug("Sending to %s:%d (%s)", dist.host, dist.port, "real")
+            try:
+                blocking.sendto(packet, (dist.host, dist.port))
+            except OSError as err:
+                logger.error("Failed to send packet to %s:%d\t(%s)", dist.host, dist.port, err.strerror)
+
+    return former
+
+
+def _measure(case: Callable[[], None], sinks: list[socket], number: int) -> None:
+    """measure
+
+    Print the time per cycle of the case and the datagrams received by the sinks.
+    """
+    # NOTE: Cycles per chunk, drained between the chunks so that the buffers of the sinks never fill up
+    chunk: int = 50
+    _drain(sinks)
+    elapsed: float = 0
+    received: int = 0
+    for _ in range(number // chunk):
+        elapsed += timeit(case, number=chunk)
+        received += _drain(sinks)
+    cycles: int = number // chunk * chunk
+    print(f"{case.__name__:>14s}: {elapsed / cycles * 1e6:8.2f} us/cycle, {received}/{cycles * len(sinks)} received")
+
+
+def _bench(sinks: list[socket], packet: bytes, number: int) -> None:
+    """bench
+
+    Print the measures of the former loop and of UdpFanout, to one destination per sink.
+    """
+    dists: list[IPNetAddr] = [IPNetAddr(*sink.getsockname()) for sink in sinks]
+    datagrams: list[tuple[int, bytes]] = [(index, packet) for index in range(len(dists))]
+    loop = UdpFanout(socket(AF_INET, SOCK_DGRAM), dists)
+    batch = UdpFanout(socket(AF_INET, SOCK_DGRAM), dists, batch=True)
+
+    def fanout_loop() -> None:
+        loop.send(datagrams)
+
+    def fanout_batch() -> None:
+        batch.send(datagrams)
+
+    print(f"{len(dists):2d} destinations:")
+    cases: list[Callable[[], None]] = [_former(dists, packet), fanout_loop] + ([fanout_batch] if batch.batched else [])
+    for case in cases:
+        _measure(case, sinks, number)
+    errors: int = sum(loop.errors.values()) + sum(batch.errors.values())
+    print(f"{'errors':>14s}: {errors}")
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Benchmark the UDP fan-out of the commands")
+    parser.add_argument("-n", "--number", type=int, default=2000, help="cycles per case")
+    args: Namespace = parser.parse_args()
+
+    sinks: list[socket] = _sinks(11)
+    for n_dists in (1, 6, 11):
+        _bench(sinks[:n_dists], bytes(46), args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3.10
+
+"""generator.py
+
+    Local stand-in of RACOON-MW: sends synthetic packets with moving robots over UDP.
+
+    Usage:
+        python -m racoon_ai.bench.generator [--profile PROFILE] [--rate HZ] [--our N] [--enemy N] [--churn SEC]
+
+    This module contains
+        - PROFILES
+        - SyntheticWorld
+        - Generator
+"""
+
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass
+from logging import INFO, basicConfig, getLogger
+from socket import AF_INET, IPPROTO_UDP, SOCK_DGRAM, socket
+from time import perf_counter, sleep
+from typing import Final, Optional, Sequence
+
+from numpy import arctan2, array, clip, cos, float64, hypot, minimum, pi, sin, zeros
+from numpy.random import Generator as RandomGenerator
+from numpy.random import default_rng
+from numpy.typing import NDArray
+
+from racoon_ai.models.referee import REF_COMMAND
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
+
+from .synthetic import FIELD_LENGTH, FIELD_WIDTH, make_packet
+
+MAX_ROBOTS: Final[int] = 16
+
+# Robots (mm/s, mm/s^2, rad/s) and ball (mm/s, 1/s)
+ROBOT_MAX_SPEED: Final[float] = 3000
+ROBOT_MAX_ACCEL: Final[float] = 4000
+ROBOT_MAX_ANGULAR: Final[float] = 2 * pi
+BALL_KICK_SPEED: Final[tuple[float, float]] = (1500, 6000)
+BALL_FRICTION: Final[float] = 0.8
+
+CHURN_COMMANDS: Final[tuple["REF_COMMAND.V", ...]] = (
+    REF_COMMAND.STOP,
+    REF_COMMAND.PREPARE_KICKOFF_BLUE,
+    REF_COMMAND.NORMAL_START,
+    REF_COMMAND.DIRECT_FREE_YELLOW,
+    REF_COMMAND.BALL_PLACEMENT_BLUE,
+    REF_COMMAND.FORCE_START,
+    REF_COMMAND.PREPARE_PENALTY_YELLOW,
+    REF_COMMAND.NORMAL_START,
+    REF_COMMAND.INDIRECT_FREE_BLUE,
+    REF_COMMAND.HALT,
+)
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Profile
+
+    Attributes:
+        rate (float): Packets per second
+        n_our (int): Number of our robots
+        n_enemy (int): Number of enemy robots
+        churn (float): Seconds between referee commands (0 for NORMAL_START only)
+    """
+
+    rate: float
+    n_our: int
+    n_enemy: int
+    churn: float = 0
+
+
+PROFILES: Final[dict[str, Profile]] = {
+    "lab": Profile(60, 6, 6),
+    "match": Profile(60, 11, 11),
+    "fast": Profile(120, 11, 11),
+    "max": Profile(240, MAX_ROBOTS, MAX_ROBOTS),
+    "churn": Profile(120, 11, 11, churn=0.5),
+}
+
+
+class SyntheticWorld:  # pylint: disable=R0902
+    """SyntheticWorld
+
+    Robots drive to random waypoints (speed and acceleration limited),
+    the ball rolls with friction, bounces on the field lines and is kicked when it stops.
+
+    Args:
+        n_our (int, optional): Number of our robots (default: 11)
+        n_enemy (int, optional): Number of enemy robots (default: 11)
+        seed (int, optional): Seed of the world (default: 0)
+        commands (Sequence[REF_COMMAND.V], optional): Referee commands to play in turn (default: NORMAL_START)
+        churn (float, optional): Seconds between referee commands (default: 0, i.e. never change)
+    """
+
+    def __init__(
+        self,
+        n_our: int = 11,
+        n_enemy: int = 11,
+        seed: int = 0,
+        commands: Sequence["REF_COMMAND.V"] = (REF_COMMAND.NORMAL_START,),
+        churn: float = 0,
+    ) -> None:
+        if not (0 <= n_our <= MAX_ROBOTS and 0 <= n_enemy <= MAX_ROBOTS):
+            raise ValueError(f"Up to {MAX_ROBOTS} robots per side are supported")
+
+        self.__rand: RandomGenerator = default_rng(seed)
+        self.__commands: Sequence["REF_COMMAND.V"] = commands
+        self.__churn: float = churn
+        self.__elapsed: float = 0
+        self.__command_index: int = 0
+
+        self.__proto: RacoonMW_Packet = make_packet(n_our, n_enemy, seed=seed, command=commands[0])
+        self.__half: NDArray[float64] = array([FIELD_LENGTH / 2, FIELD_WIDTH / 2], dtype=float64)
+
+        bots = [*self.__proto.our_robots, *self.__proto.enemy_robots]
+        self.__pos: NDArray[float64] = array([[bot.x, bot.y] for bot in bots], dtype=float64).reshape(-1, 2)
+        self.__theta: NDArray[float64] = array([bot.theta for bot in bots], dtype=float64)
+        self.__vel: NDArray[float64] = zeros((len(bots), 2), dtype=float64)
+        self.__target: NDArray[float64] = self.__random_points(len(bots))
+
+        self.__ball: NDArray[float64] = array([self.__proto.ball.x, self.__proto.ball.y], dtype=float64)
+        self.__ball_vel: NDArray[float64] = zeros(2, dtype=float64)
+
+    @property
+    def proto(self) -> RacoonMW_Packet:
+        """proto"""
+        return self.__proto
+
+    def step(self, period: float) -> RacoonMW_Packet:
+        """step
+
+        Args:
+            period (float): Seconds since the previous step
+
+        Returns:
+            RacoonMW_Packet: Packet of the new state (reused on every step)
+        """
+        self.__elapsed += period
+        self.__step_robots(period)
+        self.__step_ball(period)
+        self.__step_referee()
+        self.__fill(period)
+        return self.__proto
+
+    def __step_robots(self, period: float) -> None:
+        """step_robots"""
+        to_target: NDArray[float64] = self.__target - self.__pos
+        distance: NDArray[float64] = hypot(to_target[:, 0], to_target[:, 1])[:, None]
+        wanted: NDArray[float64] = to_target / (distance + 1e-9) * minimum(distance * 2, ROBOT_MAX_SPEED)
+        self.__vel += clip(wanted - self.__vel, -ROBOT_MAX_ACCEL * period, ROBOT_MAX_ACCEL * period)
+        self.__pos = clip(self.__pos + self.__vel * period, -self.__half, self.__half)
+
+        heading: NDArray[float64] = arctan2(self.__vel[:, 1], self.__vel[:, 0])
+        turn: NDArray[float64] = (heading - self.__theta + pi) % (2 * pi) - pi
+        turn = clip(turn, -ROBOT_MAX_ANGULAR * period, ROBOT_MAX_ANGULAR * period)
+        self.__theta = (self.__theta + turn + pi) % (2 * pi) - pi
+
+        arrived = distance[:, 0] < 100
+        if arrived.any():
+            self.__target[arrived] = self.__random_points(int(arrived.sum()))
+
+    def __step_ball(self, period: float) -> None:
+        """step_ball"""
+        self.__ball += self.__ball_vel * period
+        self.__ball_vel *= max(0.0, 1 - BALL_FRICTION * period)
+
+        out = abs(self.__ball) > self.__half
+        self.__ball_vel[out] *= -1
+        self.__ball = clip(self.__ball, -self.__half, self.__half)
+
+        if hypot(*self.__ball_vel) < 50:
+            direction: float = self.__rand.uniform(-pi, pi)
+            self.__ball_vel[:] = (cos(direction), sin(direction))
+            self.__ball_vel *= self.__rand.uniform(*BALL_KICK_SPEED)
+
+    def __step_referee(self) -> None:
+        """step_referee"""
+        if not self.__churn or (self.__elapsed < self.__churn):
+            return
+        self.__elapsed = 0
+        previous: "REF_COMMAND.V" = self.__commands[self.__command_index]
+        self.__command_index = (self.__command_index + 1) % len(self.__commands)
+        self.__proto.referee.pre_command = previous
+        self.__proto.referee.command = self.__commands[self.__command_index]
+
+    def __fill(self, period: float) -> None:
+        """fill"""
+        ball = self.__proto.ball
+        ball_x, ball_y = (float(v) for v in self.__ball)
+        ball.diff_x, ball.diff_y = (float(v) * period for v in self.__ball_vel)
+        ball.x = ball.filtered_x = ball_x
+        ball.y = ball.filtered_y = ball_y
+        ball.speed = float(hypot(*self.__ball_vel))
+        ball.slope_radian = float(arctan2(self.__ball_vel[1], self.__ball_vel[0]))
+
+        for i, bot in enumerate([*self.__proto.our_robots, *self.__proto.enemy_robots]):
+            x, y = (float(v) for v in self.__pos[i])
+            diff_x, diff_y = (float(v) * period for v in self.__vel[i])
+            bot.diff_theta = (float(self.__theta[i]) - bot.theta + pi) % (2 * pi) - pi
+            bot.x, bot.y, bot.theta = x, y, float(self.__theta[i])
+            bot.diff_x, bot.diff_y = diff_x, diff_y
+            bot.speed = float(hypot(*self.__vel[i]))
+            bot.angular_velocity = bot.diff_theta / period
+            bot.distance_ball_robot = float(hypot(ball_x - x, ball_y - y))
+            bot.radian_ball_robot = float(arctan2(ball_y - y, ball_x - x))
+            bot.ball_catch = bot.distance_ball_robot < 100
+        self.__proto.info.secperframe = period
+
+    def __random_points(self, n: int) -> NDArray[float64]:
+        """random_points"""
+        return self.__rand.uniform(-self.__half, self.__half, (n, 2))
+
+
+class Generator:
+    """Generator
+
+    Sends the packets of a SyntheticWorld at a fixed rate.
+
+    Args:
+        world (SyntheticWorld): World to step
+        rate (float): Packets per second
+        host (str, optional): Destination host (default: 127.0.0.1)
+        port (int, optional): Destination port, i.e. the one MWReceiver binds (default: 30011)
+
+    Attributes:
+        sent (int): Packets sent
+        late (int): Packets sent later than one period after their schedule
+    """
+
+    def __init__(self, world: SyntheticWorld, rate: float, host: str = "127.0.0.1", port: int = 30011) -> None:
+
+        self.__logger = getLogger(__name__)
+
+        self.__world: SyntheticWorld = world
+        self.__period: float = 1 / rate
+        self.__dest: tuple[str, int] = (host, port)
+        self.__sock = socket(AF_INET, SOCK_DGRAM, IPPROTO_UDP)
+
+        self.__sent: int = 0
+        self.__late: int = 0
+
+    def __del__(self) -> None:
+        self.__sock.close()
+
+    @property
+    def sent(self) -> int:
+        """sent"""
+        return self.__sent
+
+    @property
+    def late(self) -> int:
+        """late"""
+        return self.__late
+
+    def run(self, duration: Optional[float] = None, report_every: float = 1) -> None:
+        """run
+
+        Args:
+            duration (float, optional): Seconds to run (default: until interrupted)
+            report_every (float, optional): Seconds between the rate reports (default: 1)
+        """
+        self.__logger.info("Sending to %s:%d at %.1f Hz", *self.__dest, 1 / self.__period)
+        started: float = perf_counter()
+        deadline: float = started
+        report_at: float = started + report_every
+        reported: tuple[float, int] = (started, 0)
+        while (duration is None) or (deadline - started < duration):
+            self.__sock.sendto(self.__world.step(self.__period).SerializeToString(), self.__dest)
+            self.__sent += 1
+
+            now: float = perf_counter()
+            deadline += self.__period
+            if now - deadline > self.__period:
+                # NOTE: Do not burst to catch up; the packets are stale already
+                self.__late += 1
+                deadline = now
+            elif deadline > now:
+                sleep(deadline - now)
+
+            if now >= report_at:
+                self.__logger.info(
+                    "%.1f packets/s (sent: %d, late: %d)",
+                    (self.__sent - reported[1]) / (now - reported[0]),
+                    self.__sent,
+                    self.__late,
+                )
+                reported = (now, self.__sent)
+                report_at = now + report_every
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Send synthetic MW packets over UDP")
+    parser.add_argument("--profile", choices=PROFILES.keys(), default="match", help="stress profile (default: match)")
+    parser.add_argument("--rate", type=float, help="packets per second (overrides the profile)")
+    parser.add_argument("--our", type=int, help="number of our robots (overrides the profile)")
+    parser.add_argument("--enemy", type=int, help="number of enemy robots (overrides the profile)")
+    parser.add_argument("--churn", type=float, help="seconds between referee commands (overrides the profile)")
+    parser.add_argument("--duration", type=float, help="seconds to run (default: until interrupted)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the world (default: 0)")
+    parser.add_argument("--host", default="127.0.0.1", help="destination host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=30011, help="destination port (default: 30011)")
+    args: Namespace = parser.parse_args()
+
+    basicConfig(level=INFO, format="[%(levelname)s] %(asctime)s %(message)s", datefmt="%H:%M:%S")
+
+    profile: Profile = PROFILES[args.profile]
+    churn: float = profile.churn if args.churn is None else args.churn
+    world = SyntheticWorld(
+        profile.n_our if args.our is None else args.our,
+        profile.n_enemy if args.enemy is None else args.enemy,
+        seed=args.seed,
+        commands=(CHURN_COMMANDS if churn else (REF_COMMAND.NORMAL_START,)),
+        churn=churn,
+    )
+    generator = Generator(world, profile.rate if args.rate is None else args.rate, args.host, args.port)
+    try:
+        generator.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    print(f"Sent {generator.sent} packets ({generator.late} late)")
+
+
+if __name__ == "__main__":
+    main()
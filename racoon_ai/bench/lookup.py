@@ -0,0 +1,127 @@
+#!/usr/bin/env python3.10
+
+"""lookup.py
+
+    Micro-benchmark of the robot lookups (and available robot sets) of Observer on a full 11v11 frame.
+
+    Usage:
+        python -m racoon_ai.bench.lookup [-n NUMBER]
+"""
+
+from argparse import ArgumentParser, Namespace
+from logging import Logger, getLogger
+from timeit import timeit
+from typing import Callable, Optional
+
+from racoon_ai.models.robot import Robot
+from racoon_ai.observer import Observer
+
+from .synthetic import StaticSource, make_packet
+
+
+def _binary_search(  # pylint: disable=R0911
+    observer: Observer,
+    logger: Logger,
+    target_id: int,
+    minimum: int,
+    maximum: int,
+    search_enemy: bool,
+    only_online: bool,
+    only_visible: bool,
+) -> Optional[Robot]:
+    """binary_search
+
+    The former recursive lookup of Observer (kept here as the reference).
+    """
+    logger.debug(
+        "Search robot (only_online: %s, only_visible: %s, search_enemy: %s): target=%d, min=%d, max=%d",
+        only_online,
+        only_visible,
+        search_enemy,
+        target_id,
+        minimum,
+        maximum,
+    )
+    if maximum < minimum:
+        return None
+
+    bots: list[Robot] = observer.our_robots if (not search_enemy) else observer.enemy_robots
+    mid = (minimum + maximum) // 2
+    if mid == target_id:
+        bot: Robot = bots[mid]
+        if only_online and (not bot.is_online):
+            return None
+        if only_visible and (not bot.is_visible):
+            return None
+        return bot
+
+    if mid < target_id:
+        return _binary_search(observer, logger, target_id, mid + 1, maximum, search_enemy, only_online, only_visible)
+    return _binary_search(observer, logger, target_id, minimum, mid - 1, search_enemy, only_online, only_visible)
+
+
+def _robots_available(observer: Observer, logger: Logger) -> tuple[set[Robot], set[Robot]]:
+    """robots_available
+
+    The former per-access rebuild of the available robot sets (kept here as the reference).
+    """
+    our: set[Robot] = set()
+    for bid in observer.target_ids:
+        if bot := _binary_search(observer, logger, bid, 0, 16, False, True, True):
+            our.add(bot)
+    enemy: set[Robot] = set()
+    for bid in range(observer.num_of_enemy_vision_robots):
+        if bot := _binary_search(observer, logger, bid, 0, 16, True, False, True):
+            enemy.add(bot)
+    return our, enemy
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Benchmark the robot lookups of Observer")
+    parser.add_argument("-n", "--number", type=int, default=20000, help="repetitions of a full lookup sweep")
+    args: Namespace = parser.parse_args()
+
+    observer = Observer(set(range(11)), set(), receiver=StaticSource([make_packet(11, 11)]))
+    logger: Logger = getLogger("racoon_ai.observer.observer")
+    ids: range = range(11)
+
+    def sweep_reference() -> None:
+        for i in ids:
+            _binary_search(observer, logger, i, 0, 16, False, False, True)
+            _binary_search(observer, logger, i, 0, 16, False, True, True)
+            _binary_search(observer, logger, i, 0, 16, True, False, True)
+
+    def sweep_indexed() -> None:
+        for i in ids:
+            observer.get_our_by_id(i)
+            observer.get_our_by_id(i, True, True)
+            observer.get_enemy_by_id(i)
+
+    lookups: int = 3 * len(ids) * args.number
+    results: dict[str, float] = {}
+    sweep: Callable[[], None]
+    for name, sweep in (("binary search", sweep_reference), ("indexed", sweep_indexed)):
+        elapsed: float = timeit(sweep, number=args.number)
+        results[name] = elapsed
+        print(f"{name:>14s}: {elapsed / lookups * 1e9:8.1f} ns/lookup ({lookups} lookups)")
+
+    print(f"       speedup: {results['binary search'] / results['indexed']:8.1f}x")
+
+    # NOTE: Controls.avoid_enemy alone reads `enemy_robots_available` once per robot per cycle
+    def available_reference() -> None:
+        _robots_available(observer, logger)
+
+    def available_cached() -> None:
+        _ = (observer.our_robots_available, observer.enemy_robots_available)
+
+    for name, sweep in (("rebuilt sets", available_reference), ("cached sets", available_cached)):
+        elapsed = timeit(sweep, number=args.number)
+        results[name] = elapsed
+        print(f"{name:>14s}: {elapsed / args.number * 1e9:8.1f} ns/access ({args.number} accesses)")
+
+    print(f"       speedup: {results['rebuilt sets'] / results['cached sets']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3.10
+
+"""mpc.py
+
+    Benchmark of the sampling MPC of the ball approach against its time budget per robot.
+
+    Usage:
+        python -m racoon_ai.bench.mpc [-n NUMBER] [-b BUDGET_MS] [-s SAMPLES] [--horizon HORIZON]
+"""
+
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+
+from numpy import array, float64, percentile
+from numpy.typing import NDArray
+
+from racoon_ai.models.coordinate import Point
+from racoon_ai.models.robot import Robot
+from racoon_ai.movement import Controls, SamplingMPC
+from racoon_ai.observer import Observer
+
+from .synthetic import StaticSource, make_packet
+
+
+def _measure(controls: Controls, bots: list[Robot], target: Point, number: int) -> NDArray[float64]:
+    """measure
+
+    Args:
+        controls (Controls): Controls using the MPC
+        bots (list[Robot]): Robots to command each cycle
+        target (Point): Target of the ball
+        number (int): Cycles
+
+    Returns:
+        NDArray[float64]: Time of each call (ms), alternating `ball_around` and `to_front_ball`
+    """
+    times: list[float] = []
+    for k in range(number):
+        for bot in bots:
+            start: float = perf_counter()
+            if k % 2:
+                controls.to_front_ball(target, bot, leave_distance=500)
+            else:
+                controls.ball_around(target, bot)
+            times.append(perf_counter() - start)
+    per_call: NDArray[float64] = array(times, dtype=float64) * 1e3
+    return per_call
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Benchmark the sampling MPC of the ball approach")
+    parser.add_argument("-n", "--number", type=int, default=200, help="cycles per number of robots")
+    parser.add_argument("-b", "--budget", type=float, default=3, help="budget per robot and call (ms)")
+    parser.add_argument("-s", "--samples", type=int, default=256, help="candidate sequences per call")
+    parser.add_argument("--horizon", type=int, default=10, help="steps of a sequence")
+    args: Namespace = parser.parse_args()
+
+    observer = Observer(set(range(11)), set(), receiver=StaticSource([make_packet(11, 11)]))
+    observer.main()
+    mpc = SamplingMPC(observer, samples=args.samples, horizon=args.horizon, seed=0)
+    controls = Controls(observer, mpc=mpc)
+    target = Point(6000, 0)
+
+    print(f"{args.samples} samples x {args.horizon} steps, budget {args.budget:.1f} ms per robot")
+    exceeded: bool = False
+    for n_bots in (1, 6, 11):
+        bots: list[Robot] = [observer.our_robots[i] for i in observer.our_available_ids[:n_bots]]
+        per_call: NDArray[float64] = _measure(controls, bots, target, args.number)
+        p50, p95 = percentile(per_call, [50, 95])
+        worst: float = float(per_call.max())
+        status: str = "OK" if p95 <= args.budget else "EXCEEDED"
+        exceeded |= p95 > args.budget
+        print(
+            f"{n_bots:2d} robots: p50 {p50:6.2f} ms, p95 {p95:6.2f} ms, max {worst:6.2f} ms per robot"
+            f" ({p50 * n_bots:6.2f} ms per cycle) {status}"
+        )
+
+    if exceeded:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3.10
+
+"""sender.py
+
+    Micro-benchmark of the serialization of CommandSender (no sockets):
+    a packet built anew per send (the former path) against the reused CommandPacket,
+    and the bytes sent to the real robots by a full packet for all against a packet per robot.
+
+    Usage:
+        python -m racoon_ai.bench.sender [-n NUMBER]
+"""
+
+from argparse import ArgumentParser, Namespace
+from timeit import timeit
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+from typing import Callable
+
+from numpy.random import Generator as RandomGenerator
+from numpy.random import default_rng
+
+from racoon_ai.models.robot import RobotCommand, SimCommands
+from racoon_ai.networks.sender.command_packet import CommandPacket
+from racoon_ai.proto.pb_gen.grSim_Commands_pb2 import grSim_Commands
+from racoon_ai.proto.pb_gen.grSim_Packet_pb2 import grSim_Packet
+
+
+def _build(sim_cmds: SimCommands) -> bytes:
+    """build
+
+    The former serialization of CommandSender.send (kept here as the reference).
+    """
+    send_data = grSim_Commands(
+        timestamp=sim_cmds.timestamp,
+        isteamyellow=sim_cmds.isteamyellow,
+        robot_commands=sim_cmds.to_proto(),
+    )
+    packet: bytes = grSim_Packet(commands=send_data).SerializeToString()
+    return packet
+
+
+def _peak_bytes(func: Callable[[], bytes]) -> int:
+    """peak_bytes
+
+    Returns:
+        int: Peak of the memory traced during a call, above the memory before it (bytes)
+    """
+    start()
+    func()
+    reset_peak()
+    before, _ = get_traced_memory()
+    func()
+    _, peak = get_traced_memory()
+    stop()
+    return peak - before
+
+
+def _commands(n_bots: int, rng: RandomGenerator) -> SimCommands:
+    """commands
+
+    Returns:
+        SimCommands: Commands of random velocities for robots 0 to n_bots - 1
+    """
+    robot_commands: list[RobotCommand] = [RobotCommand(i) for i in range(n_bots)]
+    for cmd, (fwd, sway, angular) in zip(robot_commands, rng.uniform(-2, 2, (n_bots, 3)).tolist()):
+        cmd.vel_fwd, cmd.vel_sway, cmd.vel_angular = fwd, sway, angular
+    return SimCommands(False, robot_commands)
+
+
+def _bench_serialize(sim_cmds: SimCommands, number: int) -> None:
+    """bench_serialize
+
+    Print the time and memory per send of a packet built anew and of the reused CommandPacket.
+    """
+    command_packet = CommandPacket()
+
+    def build() -> bytes:
+        return _build(sim_cmds)
+
+    def reuse() -> bytes:
+        return command_packet.serialize(sim_cmds)
+
+    assert build() == reuse(), "the reused packet must serialize to the same bytes"
+
+    times: list[float] = []
+    for func in (build, reuse):
+        times.append(timeit(func, number=number))
+        print(f"{func.__name__:>8s}: {times[-1] / number * 1e6:8.2f} us/send, {_peak_bytes(func):6d} B peak/send")
+    print(f"{'speedup':>8s}: {times[0] / times[1]:8.2f}x")
+
+
+def _bench_real(sim_cmds: SimCommands) -> None:
+    """bench_real
+
+    Print the bytes sent to the real robots: the full packet to each robot, or each robot its own command only.
+    """
+    robot_packets: list[CommandPacket] = [CommandPacket() for _ in sim_cmds.robot_commands]
+    full: int = len(CommandPacket().serialize(sim_cmds)) * len(sim_cmds.robot_commands)
+    trimmed: int = sum(
+        len(packet.serialize_one(sim_cmds, cmd)) for packet, cmd in zip(robot_packets, sim_cmds.robot_commands)
+    )
+    print(f"{'real':>8s}: {full:6d} B/cycle full, {trimmed:6d} B/cycle trimmed ({full / trimmed:.1f}x less)")
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Benchmark the serialization of the commands")
+    parser.add_argument("-n", "--number", type=int, default=20000, help="sends per case")
+    args: Namespace = parser.parse_args()
+
+    rng: RandomGenerator = default_rng(0)
+    for n_bots in (6, 11):
+        sim_cmds: SimCommands = _commands(n_bots, rng)
+        print(f"{n_bots:2d} robots:")
+        _bench_serialize(sim_cmds, args.number)
+        _bench_real(sim_cmds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3.10
+
+"""startup.py
+
+    Startup-time benchmark: cold start of `python -m racoon_ai` until its first command is sent.
+
+    The AI runs without MW, fed by the synthetic generator, and sends its commands to a local socket.
+
+    Usage:
+        python -m racoon_ai.bench.startup [-n RUNS] [--gui]
+"""
+
+from argparse import ArgumentParser, Namespace
+from os import path
+from socket import AF_INET, SOCK_DGRAM, socket
+from statistics import median
+from subprocess import DEVNULL, Popen
+from sys import executable
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+
+from .generator import Generator, SyntheticWorld
+
+CONFIG: str = """
+[DEFAULT]
+withMW=False
+showGui={show_gui}
+isTeamYellow=False
+isOurCourtNegative=True
+isReal=False
+useTestRule=False
+isHalfCourtTest=False
+targetIds=0,1,2,3,4,5,6,7,8,9,10
+
+[commons]
+use_imu=False
+
+[role]
+keeper_id=0
+
+[mw_receiver]
+use_custom_addr=True
+host=127.0.0.1
+port={mw_port}
+
+[command_sender]
+use_custom_addr=True
+host=127.0.0.1
+port={cmd_port}
+"""
+
+
+def measure(config_path: str, cmd_sock: socket, timeout: float) -> float:
+    """measure
+
+    Args:
+        config_path (str): Config to run the AI with
+        cmd_sock (socket): Socket the commands are sent to
+        timeout (float): Seconds to wait for the first command
+
+    Returns:
+        float: Seconds from the launch to the first command
+    """
+    started: float = perf_counter()
+    with Popen([executable, "-m", "racoon_ai", "--config", config_path], stdout=DEVNULL, stderr=DEVNULL) as proc:
+        try:
+            cmd_sock.settimeout(timeout)
+            cmd_sock.recv(4096)
+            return perf_counter() - started
+        finally:
+            proc.kill()
+
+
+def main() -> None:
+    """main"""
+    parser = ArgumentParser(description="Measure the time from `python -m racoon_ai` to the first command")
+    parser.add_argument("-n", "--runs", type=int, default=3, help="number of launches (default: 3)")
+    parser.add_argument("--gui", action="store_true", help="launch with showGui=True")
+    parser.add_argument("--mw-port", type=int, default=30111, help="port of the synthetic MW (default: 30111)")
+    parser.add_argument("--cmd-port", type=int, default=20111, help="port to receive the commands (default: 20111)")
+    parser.add_argument("--timeout", type=float, default=30, help="seconds to wait per launch (default: 30)")
+    args: Namespace = parser.parse_args()
+
+    generator = Generator(SyntheticWorld(11, 11), 60, port=args.mw_port)
+    Thread(target=generator.run, name="Generator", daemon=True).start()
+
+    with TemporaryDirectory() as tmp_dir, socket(AF_INET, SOCK_DGRAM) as cmd_sock:
+        cmd_sock.bind(("127.0.0.1", args.cmd_port))
+        config_path: str = path.join(tmp_dir, "config.ini")
+        with open(config_path, "w", encoding="utf-8") as file:
+            file.write(CONFIG.format(show_gui=args.gui, mw_port=args.mw_port, cmd_port=args.cmd_port))
+
+        results: list[float] = []
+        for i in range(args.runs):
+            results.append(measure(config_path, cmd_sock, args.timeout))
+            print(f"run {i + 1}: {results[-1]:.3f} s")
+            # NOTE: Drop the commands of the killed process
+            cmd_sock.setblocking(False)
+            try:
+                while cmd_sock.recv(4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    print(f"first command after {median(results):.3f} s (median of {len(results)}, min {min(results):.3f} s)")
+
+
+if __name__ == "__main__":
+    main()
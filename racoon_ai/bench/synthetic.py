@@ -0,0 +1,129 @@
+#!/usr/bin/env python3.10
+
+"""synthetic.py
+
+    This module contains
+        - make_packet
+        - StaticSource
+"""
+
+from itertools import cycle
+from random import Random
+from typing import Iterator, Optional, Sequence
+
+from racoon_ai.models.referee import REF_COMMAND
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet, Robot_Infos
+
+# Division A field (mm)
+FIELD_LENGTH: int = 12000
+FIELD_WIDTH: int = 9000
+
+
+def make_packet(
+    n_our: int = 11,
+    n_enemy: int = 11,
+    *,
+    seed: int = 0,
+    command: "REF_COMMAND.V" = REF_COMMAND.NORMAL_START,
+    attack_direction: int = 1,
+    sec_per_frame: float = 1 / 60,
+) -> RacoonMW_Packet:
+    """make_packet
+
+    Build a complete packet with robots scattered on a Division A field.
+
+    Args:
+        n_our (int, optional): Number of our robots (default: 11)
+        n_enemy (int, optional): Number of enemy robots (default: 11)
+        seed (int, optional): Seed of the random placement (default: 0)
+        command (REF_COMMAND.V, optional): Referee command (default: NORMAL_START)
+        attack_direction (int, optional): Attack direction (default: 1)
+        sec_per_frame (float, optional): Seconds per frame (default: 1/60)
+
+    Returns:
+        RacoonMW_Packet
+    """
+    rand: Random = Random(seed)
+    proto = RacoonMW_Packet()
+
+    proto.geometry.field_length = FIELD_LENGTH
+    proto.geometry.field_width = FIELD_WIDTH
+    proto.geometry.goal_width = 1800
+    proto.geometry.goal_depth = 180
+    proto.geometry.boundary_width = 300
+    proto.geometry.goal_x = -(FIELD_LENGTH / 2) * attack_direction
+    proto.geometry.goal_y = 0
+
+    ball_x: float = rand.uniform(-FIELD_LENGTH / 2, FIELD_LENGTH / 2)
+    ball_y: float = rand.uniform(-FIELD_WIDTH / 2, FIELD_WIDTH / 2)
+    proto.ball.x = proto.ball.filtered_x = ball_x
+    proto.ball.y = proto.ball.filtered_y = ball_y
+    proto.ball.z = 0
+    proto.ball.diff_x = proto.ball.diff_y = 0
+    proto.ball.slope_radian = proto.ball.slope = proto.ball.intercept = proto.ball.speed = 0
+
+    proto.referee.command = command
+    proto.referee.stage = 1  # NORMAL_FIRST_HALF
+    proto.referee.yellow_cards = 0
+    proto.referee.red_cards = 0
+
+    proto.info.num_of_cameras = 4
+    proto.info.num_of_our_robots = n_our
+    proto.info.num_of_enemy_robots = n_enemy
+    proto.info.secperframe = sec_per_frame
+    proto.info.is_vision_recv = True
+    proto.info.attack_direction = attack_direction
+
+    for robot_id in range(n_our):
+        _fill_robot(proto.our_robots.add(), robot_id, rand, ball_x, ball_y)
+    for robot_id in range(n_enemy):
+        _fill_robot(proto.enemy_robots.add(), robot_id, rand, ball_x, ball_y)
+    return proto
+
+
+def _fill_robot(dbot: Robot_Infos, robot_id: int, rand: Random, ball_x: float, ball_y: float) -> None:
+    """fill_robot
+
+    Args:
+        dbot (Robot_Infos): Message to fill
+        robot_id (int): Robot ID
+        rand (Random): Random generator
+        ball_x (float): x of the ball
+        ball_y (float): y of the ball
+    """
+    dbot.robot_id = robot_id
+    dbot.x = rand.uniform(-FIELD_LENGTH / 2, FIELD_LENGTH / 2)
+    dbot.y = rand.uniform(-FIELD_WIDTH / 2, FIELD_WIDTH / 2)
+    dbot.theta = rand.uniform(-3.14, 3.14)
+    dbot.diff_x = dbot.diff_y = dbot.diff_theta = 0
+    dbot.distance_ball_robot = ((ball_x - dbot.x) ** 2 + (ball_y - dbot.y) ** 2) ** 0.5
+    dbot.radian_ball_robot = 0
+    dbot.speed = dbot.slope = dbot.intercept = dbot.angular_velocity = 0
+    dbot.visible = True
+    dbot.online = True
+    dbot.ball_catch = False
+    dbot.battery_voltage = 16.0
+
+
+class StaticSource:  # pylint: disable=R0903
+    """StaticSource
+
+    PacketSource which cycles through the given packets (no sockets).
+
+    Args:
+        packets (Sequence[RacoonMW_Packet]): Packets to serve
+    """
+
+    def __init__(self, packets: Sequence[RacoonMW_Packet]) -> None:
+        self.__packets: Iterator[RacoonMW_Packet] = cycle(packets)
+
+    def recv(self, timeout: Optional[float] = None) -> RacoonMW_Packet:  # pylint: disable=W0613
+        """recv
+
+        Args:
+            timeout (float, optional): Ignored; a packet is always available
+
+        Returns:
+            RacoonMW_Packet: The next packet
+        """
+        return next(self.__packets)
@@ -9,6 +9,11 @@
 from math import atan2, floor, pi, sqrt
 from typing import Final
 
+from numpy import float64
+from numpy import floor as floor_array
+from numpy import where
+from numpy.typing import NDArray
+
 from racoon_ai.models.coordinate import Point, Pose
 
 
@@ -120,6 +125,22 @@ class MathUtils:
             return cls.div_safe(ret)
         return ret
 
+    @classmethod
+    def radian_normalize_array(cls, angles: NDArray[float64], center: float = 0) -> NDArray[float64]:
+        """radian_normalize_array
+
+        Element-wise `radian_normalize` (safe).
+
+        Args:
+            angles (NDArray[float64]): angles
+            center (float, optional): center angle
+
+        Returns:
+            NDArray[float64]: normalized angles
+        """
+        ret: NDArray[float64] = angles - (cls.TWO_PI * floor_array((angles + cls.PI - center) / cls.TWO_PI))
+        return where(ret == 0, 1e-10, ret)
+
     @classmethod
     def radian_reduce(cls, obj1: (Pose | float), obj2: (Pose | float), center: float = 0) -> float:
         """radian_reduce
@@ -1,8 +1,46 @@
 #!/usr/bin/env python3.10
 # pylint: disable=C0111
 
+from configparser import ConfigParser
+from logging import Logger
+from signal import Signals, signal
+from threading import current_thread, main_thread
+from typing import Optional
+
 from .game import Game
+from .scheduler import FixedRateScheduler
+from .timing import CycleTimer, RollingWindow
+
+
+def create_timer(config: ConfigParser, logger: Logger) -> CycleTimer:
+    """create_timer
+
+    Args:
+        config: ConfigParser
+        logger: Logger
+
+    Returns:
+        CycleTimer
+    """
+    window: int = config.getint("timing", "window", fallback=1024)
+    budget_ms: float = config.getfloat("timing", "budget_ms", fallback=0)
+    dump_interval: float = config.getfloat("timing", "dump_interval", fallback=0)
+    logger.info("Cycle timing: budget %.1f ms, dump every %.1f s", budget_ms, dump_interval)
+
+    timer = CycleTimer(window, budget_ms, dump_interval)
+
+    # NOTE: SIGUSR1 is not available on Windows
+    dump_signal: Optional[Signals] = getattr(Signals, "SIGUSR1", None)
+    if dump_signal and (current_thread() is main_thread()):
+        signal(dump_signal, lambda *_: timer.request_dump())
+        logger.info("Send %s to dump the cycle timing", dump_signal.name)
+    return timer
+
 
 __all__ = [
+    "create_timer",
+    "CycleTimer",
+    "FixedRateScheduler",
     "Game",
+    "RollingWindow",
 ]
@@ -7,12 +7,12 @@
 """
 
 from logging import Logger, getLogger
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-from racoon_ai.gui.view import Gui
+from racoon_ai.gui.process import GuiProcess
 from racoon_ai.models.referee import REF_COMMAND
 from racoon_ai.models.robot import RobotCommand, SimCommands
-from racoon_ai.movement import Controls
+from racoon_ai.movement import Controls, halt_all
 from racoon_ai.observer import Observer
 from racoon_ai.strategy import Strategy
 from racoon_ai.strategy.role import Role
@@ -35,6 +35,11 @@ from .rules.on_prep_penalty import on_prep_penalty_our_cbf, on_prep_penalty_thei
 from .rules.on_stop import on_stop_cbf
 from .rules.on_test import test_cbf
 from .rules.on_timeout import on_timeout_our_cbf, on_timeout_their_cbf
+from .scheduler import FixedRateScheduler
+from .timing import CycleTimer
+
+if TYPE_CHECKING:
+    from racoon_ai.gui.view import Gui
 
 
 class Game:  # pylint: disable=R0903
@@ -45,7 +50,16 @@ class Game:  # pylint: disable=R0903
         controles (Controls): Controls instance.
         send (Callable[[SimCommands], None]): Function to send SimCommands to the simulator.
         show_gui (bool, optional): Show GUI. (defauls: False)
+        gui_process (bool, optional): Run the GUI in its own process. (defaults: True)
         keeper_id (int, optional): Keeper ID. (defaults: 0)
+        timer (CycleTimer, optional): Timer of the stages of each cycle. (defaults: CycleTimer())
+        rate (float, optional): Cycles per second; 0 to run a cycle per packet. (defaults: 0)
+        max_stale (int, optional): Cycles to resend the last commands without a new packet. (defaults: 6)
+
+    NOTE:
+        With a rate, the cycles no longer wait for the packets (use the receive thread of the observer):
+        - a cycle without a new packet resends the last commands (and halts after `max_stale` of them)
+        - a cycle which overruns makes the next ticks be skipped (counted as missed)
     """
 
     def __init__(
@@ -55,8 +69,12 @@ class Game:  # pylint: disable=R0903
         send: Callable[[SimCommands], None],
         *,
         show_gui: bool = False,
+        gui_process: bool = True,
         use_test_rule: bool = False,
         keeper_id: int = 0,
+        timer: Optional[CycleTimer] = None,
+        rate: float = 0,
+        max_stale: int = 6,
     ) -> None:
 
         self.__logger: Logger = getLogger(__name__)
@@ -73,7 +91,14 @@ class Game:  # pylint: disable=R0903
 
         self.__is_show_gui: bool = show_gui
 
-        self.__gui: Gui = Gui(show_gui, self.__observer, self.__role)
+        # NOTE: The GUI stack (PySide6, pyqtgraph) is only imported when shown
+        self.__gui: Optional[Union["Gui", GuiProcess]] = None
+        if show_gui and gui_process:
+            self.__gui = GuiProcess(self.__observer, self.__role)
+        elif show_gui:
+            from racoon_ai.gui import view  # pylint: disable=C0415
+
+            self.__gui = view.Gui(show_gui, self.__observer, self.__role)
 
         self.__strategy: Strategy = Strategy(self.__observer, self.__role, controls)
 
@@ -81,26 +106,117 @@ class Game:  # pylint: disable=R0903
 
         self.__is_inplay: bool = False
 
+        self.__timer: CycleTimer = timer if (timer is not None) else CycleTimer()
+
+        self.__scheduler: Optional[FixedRateScheduler] = FixedRateScheduler(rate) if (rate > 0) else None
+
+        self.__max_stale: int = max_stale
+
+    @property
+    def observer(self) -> Observer:
+        """observer"""
+        return self.__observer
+
+    @property
+    def role(self) -> Role:
+        """role"""
+        return self.__role
+
+    @property
+    def strategy(self) -> Strategy:
+        """strategy"""
+        return self.__strategy
+
+    @property
+    def timer(self) -> CycleTimer:
+        """timer"""
+        return self.__timer
+
+    @property
+    def scheduler(self) -> Optional[FixedRateScheduler]:
+        """scheduler"""
+        return self.__scheduler
+
     def main(self) -> None:
         """Main"""
         self.__logger.info("Starting main roop...")
+        if self.__scheduler:
+            self.__main_fixed_rate(self.__scheduler)
+            return
+
+        timer: CycleTimer = self.__timer
         while True:
+            # NOTE: The observer stage includes waiting for the packet
+            timer.start()
             self.__observer.main()
-            self.__role.update()
-            self.__strategy.update_subrole()
-            self.__gui.update()
+            timer.lap("observer")
 
-            args: tuple[
-                Callable[[Logger, RULE_ARG_TYPE], list[RobotCommand]],
-                RULE_ARG_TYPE,
-            ] = self._handle_ref_command()
-            sim_cmds = SimCommands(
-                self.__observer.is_team_yellow,
-                rule_handler(args[0], self.__logger, args[1]),
-            )
+            sim_cmds: SimCommands = self.__decide()
+
+            self.__logger.debug(sim_cmds)
+            self.__send(sim_cmds)
+            timer.lap("send")
+            timer.end()
+
+    def __main_fixed_rate(self, scheduler: FixedRateScheduler) -> None:
+        """main_fixed_rate
+
+        Args:
+            scheduler (FixedRateScheduler): Pace of the cycles
+        """
+        timer: CycleTimer = self.__timer
+        halt: SimCommands = SimCommands(self.__observer.is_team_yellow, halt_all(self.__observer.target_ids))
+        sim_cmds: SimCommands = halt
+        stale: int = 0
+        while True:
+            if missed := scheduler.wait():
+                self.__logger.warning("Missed %d tick(s): %s", missed, scheduler.summary())
+
+            timer.start()
+            if self.__observer.main(timeout=0):
+                timer.lap("observer")
+                stale = 0
+                sim_cmds = self.__decide()
+            else:
+                timer.lap("observer")
+                stale += 1
+                if stale == self.__max_stale + 1:
+                    self.__logger.warning("No packet for %d cycles, halting", stale)
+                if stale > self.__max_stale:
+                    sim_cmds = halt
 
             self.__logger.debug(sim_cmds)
             self.__send(sim_cmds)
+            timer.lap("send")
+            timer.end()
+
+    def __decide(self) -> SimCommands:
+        """decide
+
+        Run the decision stages on the current state of the observer.
+
+        Returns:
+            SimCommands: Commands to send
+        """
+        timer: CycleTimer = self.__timer
+        self.__role.update()
+        timer.lap("role")
+        self.__strategy.update_subrole()
+        timer.lap("subrole")
+        if self.__gui:
+            self.__gui.update()
+            timer.lap("gui")
+
+        args: tuple[
+            Callable[[Logger, RULE_ARG_TYPE], list[RobotCommand]],
+            RULE_ARG_TYPE,
+        ] = self._handle_ref_command()
+        sim_cmds = SimCommands(
+            self.__observer.is_team_yellow,
+            rule_handler(args[0], self.__logger, args[1]),
+        )
+        timer.lap("rule", args[0].__name__)
+        return sim_cmds
 
     def _handle_ref_command(  # pylint: disable=R0911,R0912,R0915
         self,
@@ -112,7 +228,7 @@ class Game:  # pylint: disable=R0903
 
         cmd: "REF_COMMAND.V" = self.__observer.referee.command
 
-        if self.__use_test_rule and self.__is_show_gui:
+        if self.__use_test_rule and self.__gui:
             cmd = self.__gui.get_command()
             self.__observer.referee._Referee__placement_designated_point = (  # type: ignore  # pylint: disable=W0212
                 self.__gui.get_placement()
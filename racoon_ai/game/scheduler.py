@@ -0,0 +1,103 @@
+#!/usr/bin/env python3.10
+
+"""scheduler.py
+
+    This module contains:
+        - FixedRateScheduler
+"""
+
+from logging import Logger, getLogger
+from time import perf_counter_ns, sleep
+
+from .timing import RollingWindow
+
+
+class FixedRateScheduler:
+    """FixedRateScheduler
+
+    Paces a loop at a fixed rate on absolute deadlines (so the error does not accumulate).
+    A cycle which overruns skips the ticks it missed instead of running them in a burst.
+
+    Args:
+        rate (float): Cycles per second
+        window (int, optional): Samples of the jitter window (default: 1024)
+
+    Attributes:
+        period (int): Period (ns)
+        ticks (int): Ticks run so far
+        missed (int): Ticks skipped because a cycle overran
+        jitter (RollingWindow): Lateness of the ticks (ns)
+    """
+
+    def __init__(self, rate: float, window: int = 1024) -> None:
+
+        self.__logger: Logger = getLogger(__name__)
+
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+
+        self.__period: int = int(1e9 / rate)
+        self.__deadline: int = 0
+        self.__ticks: int = 0
+        self.__missed: int = 0
+        self.__jitter: RollingWindow = RollingWindow(window)
+
+        self.__logger.info("Running at %.1f Hz (period: %.2f ms)", rate, self.__period / 1e6)
+
+    @property
+    def period(self) -> int:
+        """period"""
+        return self.__period
+
+    @property
+    def ticks(self) -> int:
+        """ticks"""
+        return self.__ticks
+
+    @property
+    def missed(self) -> int:
+        """missed"""
+        return self.__missed
+
+    @property
+    def jitter(self) -> RollingWindow:
+        """jitter"""
+        return self.__jitter
+
+    def wait(self) -> int:
+        """wait
+
+        Sleep until the next tick.
+
+        Returns:
+            int: Ticks missed since the previous call (0 if on time)
+        """
+        now: int = perf_counter_ns()
+        if not self.__ticks:
+            self.__deadline = now
+
+        missed: int = 0
+        if now > self.__deadline + self.__period:
+            # NOTE: The previous cycle overran; realign on the next tick from now
+            missed = (now - self.__deadline) // self.__period
+            self.__deadline += missed * self.__period
+            self.__missed += missed
+        elif self.__deadline > now:
+            sleep((self.__deadline - now) / 1e9)
+
+        self.__jitter.add(max(0, perf_counter_ns() - self.__deadline))
+        self.__deadline += self.__period
+        self.__ticks += 1
+        return missed
+
+    def summary(self) -> str:
+        """summary
+
+        Returns:
+            str: Ticks, misses and jitter (ms)
+        """
+        p50, p95, p99, max_ = self.__jitter.summary()
+        return (
+            f"{self.__ticks} ticks, {self.__missed} missed, "
+            f"jitter p50={p50:.3f} p95={p95:.3f} p99={p99:.3f} max={max_:.3f} (ms)"
+        )
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3.10
+
+"""timing.py
+
+    This module contains:
+        - RollingWindow
+        - CycleTimer
+"""
+
+from logging import Logger, getLogger
+from time import perf_counter_ns
+from typing import Optional
+
+from numpy import int64, percentile, zeros
+from numpy.typing import NDArray
+
+
+class RollingWindow:
+    """RollingWindow
+
+    Ring buffer of the latest samples (ns).
+
+    Args:
+        size (int, optional): Number of samples to keep (default: 1024)
+
+    Attributes:
+        count (int): Samples added so far (including the ones rolled out)
+        last (int): Latest sample
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        self.__values: NDArray[int64] = zeros(size, dtype=int64)
+        self.__size: int = size
+        self.__index: int = 0
+        self.__count: int = 0
+        self.__last: int = 0
+
+    @property
+    def count(self) -> int:
+        """count"""
+        return self.__count
+
+    @property
+    def last(self) -> int:
+        """last"""
+        return self.__last
+
+    def add(self, value: int) -> None:
+        """add
+
+        Args:
+            value (int): Sample (ns)
+        """
+        self.__values[self.__index] = value
+        self.__index = (self.__index + 1) % self.__size
+        self.__count += 1
+        self.__last = value
+
+    def summary(self) -> tuple[float, float, float, float]:
+        """summary
+
+        Returns:
+            tuple[float, float, float, float]: p50, p95, p99 and max of the window (ms)
+        """
+        values: NDArray[int64] = self.__values[: min(self.__count, self.__size)]
+        if not values.size:
+            return (0.0, 0.0, 0.0, 0.0)
+        p50, p95, p99 = percentile(values, (50, 95, 99)) / 1e6
+        return (float(p50), float(p95), float(p99), float(values.max()) / 1e6)
+
+
+class CycleTimer:  # pylint: disable=R0902
+    """CycleTimer
+
+    Times the stages of each cycle with perf_counter_ns, keeping rolling windows per stage
+    and per detail (e.g. the rule callback), and warns as soon as a cycle exceeds the budget.
+
+    Usage:
+        timer.start(); ...; timer.lap("observer"); ...; timer.lap("rule", func.__name__); ...; timer.end()
+
+    Args:
+        window (int, optional): Samples per rolling window (default: 1024)
+        budget_ms (float, optional): Budget of a cycle; 0 to disable the warnings (default: 0)
+        dump_interval (float, optional): Seconds between periodic dumps to the log; 0 to disable (default: 0)
+
+    Attributes:
+        cycles (int): Cycles timed so far
+        overruns (int): Cycles which exceeded the budget
+    """
+
+    WARN_INTERVAL_NS: int = 1_000_000_000
+
+    def __init__(self, window: int = 1024, budget_ms: float = 0, dump_interval: float = 0) -> None:
+
+        self.__logger: Logger = getLogger(__name__)
+
+        self.__window: int = window
+        self.__budget: int = int(budget_ms * 1e6)
+        self.__dump_interval: int = int(dump_interval * 1e9)
+
+        self.__cycle: RollingWindow = RollingWindow(window)
+        self.__stages: dict[str, RollingWindow] = {}
+        self.__details: dict[str, RollingWindow] = {}
+
+        self.__started: int = 0
+        self.__lapped: int = 0
+        self.__overruns: int = 0
+        self.__suppressed: int = 0
+        self.__warned_at: int = 0
+        self.__dump_at: int = perf_counter_ns() + self.__dump_interval
+        self.__dump_requested: bool = False
+
+    @property
+    def cycles(self) -> int:
+        """cycles"""
+        return self.__cycle.count
+
+    @property
+    def overruns(self) -> int:
+        """overruns"""
+        return self.__overruns
+
+    @property
+    def stages(self) -> dict[str, RollingWindow]:
+        """stages"""
+        return self.__stages
+
+    @property
+    def details(self) -> dict[str, RollingWindow]:
+        """details"""
+        return self.__details
+
+    def start(self) -> None:
+        """start"""
+        self.__started = self.__lapped = perf_counter_ns()
+
+    def lap(self, stage: str, detail: Optional[str] = None) -> None:
+        """lap
+
+        Args:
+            stage (str): Stage which has just finished
+            detail (str, optional): Also record the stage under this name (e.g. the rule callback)
+        """
+        now: int = perf_counter_ns()
+        elapsed: int = now - self.__lapped
+        self.__lapped = now
+
+        if (window := self.__stages.get(stage)) is None:
+            window = self.__stages[stage] = RollingWindow(self.__window)
+        window.add(elapsed)
+
+        if detail is not None:
+            if (window := self.__details.get(detail)) is None:
+                window = self.__details[detail] = RollingWindow(self.__window)
+            window.add(elapsed)
+
+    def end(self) -> None:
+        """end
+
+        Close the cycle: check the budget and dump if periodic or requested.
+        """
+        now: int = perf_counter_ns()
+        elapsed: int = now - self.__started
+        self.__cycle.add(elapsed)
+
+        if self.__budget and (elapsed > self.__budget):
+            self.__overruns += 1
+            if now - self.__warned_at < self.WARN_INTERVAL_NS:
+                self.__suppressed += 1
+            else:
+                self.__logger.warning(
+                    "Cycle took %.2f ms (budget: %.2f ms, %d more overrun(s) since the last warning): %s",
+                    elapsed / 1e6,
+                    self.__budget / 1e6,
+                    self.__suppressed,
+                    ", ".join(f"{stage}={window.last / 1e6:.2f}" for stage, window in self.__stages.items()),
+                )
+                self.__suppressed = 0
+                self.__warned_at = now
+
+        if self.__dump_requested or (self.__dump_interval and (now >= self.__dump_at)):
+            self.__dump_requested = False
+            self.__dump_at = now + self.__dump_interval
+            self.dump()
+
+    def request_dump(self) -> None:
+        """request_dump
+
+        Dump at the end of the current cycle (safe to call from a signal handler).
+        """
+        self.__dump_requested = True
+
+    def summary(self) -> str:
+        """summary
+
+        Returns:
+            str: p50/p95/p99/max (ms) of the cycle, each stage and each detail
+        """
+        lines: list[str] = [
+            f"{self.cycles} cycles, {self.overruns} overrun(s)",
+            f"{'':>28s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s} (ms)",
+        ]
+        rows: list[tuple[str, RollingWindow]] = [
+            ("cycle", self.__cycle),
+            *self.__stages.items(),
+            *((f"  {name}", window) for name, window in sorted(self.__details.items())),
+        ]
+        for name, window in rows:
+            p50, p95, p99, max_ = window.summary()
+            lines.append(f"{name:>28s} {p50:8.2f} {p95:8.2f} {p99:8.2f} {max_:8.2f}")
+        return "\n".join(lines)
+
+    def dump(self) -> None:
+        """dump"""
+        self.__logger.info("Cycle timing:\n%s", self.summary())
@@ -1,8 +1,28 @@
 #!/usr/bin/env python3.10
 # pylint: disable=C0111
 
-from .view import Gui
+from typing import TYPE_CHECKING, Any
+
+from .process import GuiProcess
+from .snapshot import RoleView, WorldSnapshot, WorldView
+
+if TYPE_CHECKING:
+    from .view import Gui
+
+
+def __getattr__(name: str) -> Any:
+    # NOTE: Gui imports Qt; only load it when asked for
+    if name == "Gui":
+        from .view import Gui  # pylint: disable=C0415,W0621
+
+        return Gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Gui",
+    "GuiProcess",
+    "RoleView",
+    "WorldSnapshot",
+    "WorldView",
 ]
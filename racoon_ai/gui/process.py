@@ -0,0 +1,163 @@
+#!/usr/bin/env python3.10
+
+"""process.py
+
+    This module contains
+        - GuiProcess
+
+    NOTE: No Qt here either; the GUI stack is only imported in the child process.
+"""
+
+from logging import Logger, getLogger
+from multiprocessing import get_context
+from multiprocessing.context import SpawnProcess
+from multiprocessing.queues import Queue
+from queue import Empty, Full
+from typing import TYPE_CHECKING, cast
+
+from numpy import empty, float64
+
+from racoon_ai.models.coordinate import Point
+from racoon_ai.models.referee import REF_COMMAND
+
+from .snapshot import N_VALUES, RoleView, WorldSnapshot, WorldView
+
+if TYPE_CHECKING:
+    from racoon_ai.observer import Observer
+    from racoon_ai.strategy.role import Role
+
+# NOTE: (command, placement x, placement y) set on the game control of the GUI
+Override = tuple[int, int, int]
+
+
+class GuiProcess:
+    """GuiProcess
+
+    Runs the GUI in a child process so that the control loop never waits on Qt.
+    Same interface as Gui: `update` publishes the world to a shared-memory snapshot,
+    `get_command` / `get_placement` return the latest overrides set on the GUI.
+
+    Args:
+        observer (Observer): Observer instance
+        role (Role): Role instance
+        interval_ms (int, optional): Redraw interval of the GUI (default: 16)
+    """
+
+    def __init__(self, observer: "Observer", role: "Role", interval_ms: int = 16) -> None:
+
+        self.__logger: Logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        self.__observer: "Observer" = observer
+        self.__role: "Role" = role
+
+        self.__snapshot: WorldSnapshot = WorldSnapshot()
+        self.__snapshot.write(observer, role)
+
+        # NOTE: Qt must not inherit the state of a forked process
+        ctx = get_context("spawn")
+        self.__overrides: "Queue[Override]" = ctx.Queue(maxsize=64)
+        self.__command: "REF_COMMAND.V" = REF_COMMAND.HALT
+        self.__placement: Point = Point(0, 0)
+
+        self.__process: SpawnProcess = ctx.Process(
+            target=run_gui,
+            args=(self.__snapshot.name, self.__overrides, interval_ms),
+            name="RacoonGui",
+            daemon=True,
+        )
+        self.__process.start()
+        self.__logger.info("GUI process started (pid: %s)", self.__process.pid)
+
+    def __del__(self) -> None:
+        self.close()
+
+    def update(self) -> None:
+        """update
+
+        Publish the current world and take the overrides sent since the last call (never blocks).
+        """
+        self.__snapshot.write(self.__observer, self.__role)
+        try:
+            while True:
+                command, x, y = self.__overrides.get_nowait()
+                self.__command = cast("REF_COMMAND.V", command)
+                self.__placement = Point(x, y)
+        except Empty:
+            pass
+
+    def get_command(self) -> "REF_COMMAND.V":
+        """get referee command"""
+        return self.__command
+
+    def get_placement(self) -> Point:
+        """get placement value"""
+        return self.__placement
+
+    def close(self) -> None:
+        """close"""
+        if self.__process.is_alive():
+            self.__process.terminate()
+            self.__process.join(timeout=1)
+        self.__snapshot.close()
+
+
+def run_gui(name: str, overrides: "Queue[Override]", interval_ms: int) -> None:  # pylint: disable=R0914
+    """run_gui
+
+    Entry point of the GUI process.
+
+    Args:
+        name (str): Shared memory of the snapshot
+        overrides (Queue[Override]): Queue to send the game control overrides to
+        interval_ms (int): Redraw interval
+    """
+    # pylint: disable=C0415
+    from PySide6.QtCore import QTimer  # pylint: disable=E0611
+    from PySide6.QtWidgets import QApplication  # pylint: disable=E0611
+
+    from .modules import Back, Chart, Game, Main, Robot, Vision
+
+    logger: Logger = getLogger(__name__)
+    snapshot: WorldSnapshot = WorldSnapshot(name)
+    values = empty(N_VALUES, dtype=float64)
+    world: WorldView = WorldView()
+    role: RoleView = RoleView()
+
+    snapshot.read(values)
+    world.update(values)
+    role.update(values)
+
+    app = QApplication()
+    main = Main(world, role)  # type: ignore[arg-type]
+    _chart = Chart(main, world)  # type: ignore[arg-type]  # noqa: F841
+    Vision(main)
+    Robot(main)
+    Back(main)
+    game = Game(main)
+    main.show()
+
+    sent: list[Override] = []
+
+    def tick() -> None:
+        if snapshot.read(values):
+            world.update(values)
+            role.update(values)
+        main.update()
+
+        placement: Point = game.update_placement()
+        override: Override = (int(game.update_command()), int(placement.x), int(placement.y))
+        if sent and (sent[-1] == override):
+            return
+        try:
+            overrides.put_nowait(override)
+            sent[:] = [override]
+        except Full:
+            logger.debug("Override queue is full")
+
+    timer = QTimer(main)
+    timer.timeout.connect(tick)
+    timer.start(interval_ms)
+
+    app.exec()
+    snapshot.close()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3.10
+
+"""snapshot.py
+
+    This module contains
+        - WorldSnapshot
+        - WorldView
+        - RoleView
+
+    NOTE: No Qt here; the control process imports this module.
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Optional
+
+from numpy import float64, ndarray, uint64
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from racoon_ai.observer import Observer
+    from racoon_ai.strategy.role import Role
+
+MAX_ROBOTS: int = 16
+
+# NOTE: Layout of the float64 array following the sequence counter
+BALL: slice = slice(0, 3)  # x, y, speed
+GEOMETRY: slice = slice(3, 7)  # field_length, field_width, goal_width, goal_depth
+REFEREE: slice = slice(7, 11)  # command, stage, placement x, placement y
+KEEPER: int = 11
+OFFENSE: slice = slice(12, 12 + MAX_ROBOTS)
+DEFENSE: slice = slice(OFFENSE.stop, OFFENSE.stop + MAX_ROBOTS)
+OUR: slice = slice(DEFENSE.stop, DEFENSE.stop + MAX_ROBOTS * 4)  # (x, y, theta, visible) per id
+ENEMY: slice = slice(OUR.stop, OUR.stop + MAX_ROBOTS * 4)
+N_VALUES: int = ENEMY.stop
+
+
+class WorldSnapshot:
+    """WorldSnapshot
+
+    Fixed-layout snapshot of the world in shared memory, guarded by a seqlock:
+    the writer makes the sequence odd while writing, and a reader retries until it copies
+    the values between two reads of the same even sequence. The writer never waits.
+
+    Args:
+        name (str, optional): Shared memory to attach to; None to create one (default: None)
+
+    Attributes:
+        name (str): Name of the shared memory (to attach from the other process)
+        sequence (int): Sequence of the latest write (even)
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+
+        self.__is_owner: bool = name is None
+        self.__shm: SharedMemory = SharedMemory(name, create=self.__is_owner, size=8 * (1 + N_VALUES))
+
+        self.__seq: NDArray[uint64] = ndarray((1,), dtype=uint64, buffer=self.__shm.buf)
+        self.__values: NDArray[float64] = ndarray((N_VALUES,), dtype=float64, buffer=self.__shm.buf, offset=8)
+        if self.__is_owner:
+            self.__seq[0] = 0
+            self.__values[:] = 0
+
+    def __del__(self) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """name"""
+        return self.__shm.name
+
+    @property
+    def sequence(self) -> int:
+        """sequence"""
+        return int(self.__seq[0])
+
+    def write(self, observer: "Observer", role: "Role") -> None:
+        """write
+
+        Args:
+            observer (Observer): Source of the robots, ball, geometry and referee
+            role (Role): Source of the roles
+        """
+        seq: int = int(self.__seq[0])
+        self.__seq[0] = seq + 1
+
+        values: NDArray[float64] = self.__values
+        ball = observer.ball
+        values[BALL] = (ball.x, ball.y, ball.speed)
+        geometry = observer.geometry
+        values[GEOMETRY] = (geometry.field_length, geometry.field_width, geometry.goal_width, geometry.goal_depth)
+        referee = observer.referee
+        placement = referee.placement_designated_point
+        values[REFEREE] = (
+            referee.command,
+            referee.stage,
+            placement.x if placement else 0,
+            placement.y if placement else 0,
+        )
+
+        values[KEEPER] = role.keeper_id
+        self.__write_ids(values[OFFENSE], role.offense_id_list)
+        self.__write_ids(values[DEFENSE], role.defense_id_list)
+
+        for target, states in ((values[OUR], observer.our_states), (values[ENEMY], observer.enemy_states)):
+            size: int = min(states.size, MAX_ROBOTS)
+            robots: NDArray[float64] = target.reshape(MAX_ROBOTS, 4)
+            robots[:size, :3] = states.pose[:size]
+            robots[:size, 3] = states.is_visible[:size]
+
+        self.__seq[0] = seq + 2
+
+    def read(self, out: NDArray[float64], retries: int = 100) -> int:
+        """read
+
+        Args:
+            out (NDArray[float64]): Array of N_VALUES to copy the values into
+            retries (int, optional): Attempts before giving up on a consistent copy (default: 100)
+
+        Returns:
+            int: Sequence of the copy; 0 if nothing consistent has been written yet
+        """
+        for _ in range(retries):
+            seq: int = int(self.__seq[0])
+            if seq & 1:
+                continue
+            out[:] = self.__values
+            if int(self.__seq[0]) == seq:
+                return seq
+        return 0
+
+    def close(self) -> None:
+        """close
+
+        Detach (and free, if created here) the shared memory.
+        """
+        if self.__shm.buf is None:
+            return
+        # NOTE: The views must be released before the buffer
+        del self.__seq, self.__values
+        self.__shm.close()
+        if self.__is_owner:
+            self.__shm.unlink()
+
+    @staticmethod
+    def __write_ids(target: NDArray[float64], ids: list[int]) -> None:
+        """write_ids
+
+        Args:
+            target (NDArray[float64]): Slots of the ids
+            ids (list[int]): Ids to write (the rest of the slots are set to -1)
+        """
+        count: int = min(len(ids), MAX_ROBOTS)
+        target[:count] = ids[:count]
+        target[count:] = -1
+
+
+class _RobotView:  # pylint: disable=R0903
+    """_RobotView"""
+
+    def __init__(self) -> None:
+        self.x: float = 0
+        self.y: float = 0
+        self.theta: float = 0
+        self.is_visible: bool = False
+
+
+class _BallView:  # pylint: disable=R0903
+    """_BallView"""
+
+    def __init__(self) -> None:
+        self.x: float = 0
+        self.y: float = 0
+        self.speed: float = 0
+
+
+class _GeometryView:  # pylint: disable=R0903
+    """_GeometryView"""
+
+    def __init__(self) -> None:
+        self.field_length: float = 0
+        self.field_width: float = 0
+        self.goal_width: float = 0
+        self.goal_depth: float = 0
+
+
+class WorldView:  # pylint: disable=R0903
+    """WorldView
+
+    Observer-like view of a snapshot, for the GUI modules.
+
+    Attributes:
+        our_robots (list): Our robots (x, y, theta, is_visible)
+        enemy_robots (list): Enemy robots (x, y, theta, is_visible)
+        ball: Ball (x, y, speed)
+        geometry: Geometry (field_length, field_width, goal_width, goal_depth)
+        referee_command (int): Referee command
+        referee_stage (int): Referee stage
+    """
+
+    def __init__(self) -> None:
+        self.our_robots: list[_RobotView] = [_RobotView() for _ in range(MAX_ROBOTS)]
+        self.enemy_robots: list[_RobotView] = [_RobotView() for _ in range(MAX_ROBOTS)]
+        self.ball: _BallView = _BallView()
+        self.geometry: _GeometryView = _GeometryView()
+        self.referee_command: int = 0
+        self.referee_stage: int = 0
+
+    def update(self, values: NDArray[float64]) -> None:
+        """update
+
+        Args:
+            values (NDArray[float64]): Values copied by WorldSnapshot.read
+        """
+        ball, geometry = self.ball, self.geometry
+        ball.x, ball.y, ball.speed = values[BALL].tolist()
+        geometry.field_length, geometry.field_width, geometry.goal_width, geometry.goal_depth = values[
+            GEOMETRY
+        ].tolist()
+        self.referee_command, self.referee_stage = (int(v) for v in values[REFEREE][:2])
+
+        for robots, rows in ((self.our_robots, values[OUR]), (self.enemy_robots, values[ENEMY])):
+            for robot, (x, y, theta, visible) in zip(robots, rows.reshape(MAX_ROBOTS, 4).tolist()):
+                robot.x, robot.y, robot.theta, robot.is_visible = x, y, theta, bool(visible)
+
+
+class RoleView:  # pylint: disable=R0903
+    """RoleView
+
+    Role-like view of a snapshot, for the GUI modules.
+
+    Attributes:
+        keeper_id (int): Keeper id
+        offense_id_list (list[int]): Offense ids
+        defense_id_list (list[int]): Defense ids
+    """
+
+    def __init__(self) -> None:
+        self.keeper_id: int = 0
+        self.offense_id_list: list[int] = []
+        self.defense_id_list: list[int] = []
+
+    def update(self, values: NDArray[float64]) -> None:
+        """update
+
+        Args:
+            values (NDArray[float64]): Values copied by WorldSnapshot.read
+        """
+        self.keeper_id = int(values[KEEPER])
+        self.offense_id_list = [int(i) for i in values[OFFENSE] if i >= 0]
+        self.defense_id_list = [int(i) for i in values[DEFENSE] if i >= 0]
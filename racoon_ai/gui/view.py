@@ -31,15 +31,16 @@ class Gui:  # pylint: disable=R0903
     def __init__(self, is_gui_view: bool, observer: Observer, role: Role):
         self.__logger = getLogger(__name__)
         self.__logger.debug("create logger")
-        self.__app = QApplication()
         self.__is_gui_view = is_gui_view
         self.__logger.info("GUI: %s", is_gui_view)
         if self.__is_gui_view:
+            self.__app = QApplication()
             self.__setup(observer, role)
 
     def __del__(self) -> None:
         """__del__"""
-        self.__app.exit(0)
+        if self.__is_gui_view:
+            self.__app.exit(0)
 
     def __setup(self, observer: Observer, role: Role) -> None:
         """setup"""
@@ -7,6 +7,8 @@ from typing import Optional
 
 BUFFSIZE: int = 2048
 
+MAX_BUFFSIZE: int = 65536
+
 
 @dataclass(frozen=True)
 class IPNetAddr:
@@ -4,11 +4,13 @@
 from .commands import RobotCommand, RobotCustomCommand, SimCommands
 from .custom_feedback import RobotCustomFeedback
 from .robot import Robot
+from .states import RobotStates
 
 __all__ = [
     "Robot",
     "RobotCommand",
     "RobotCustomCommand",
     "RobotCustomFeedback",
+    "RobotStates",
     "SimCommands",
 ]
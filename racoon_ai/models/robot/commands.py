@@ -84,6 +84,21 @@ class RobotCommand:
             grSim_Robot_Command: grSim_Robot_Command
         """
         proto = grSim_Robot_Command()
+        self.write_proto(proto)
+        return proto
+
+    def write_proto(self, proto: grSim_Robot_Command) -> None:
+        """write_proto
+
+        Update the fields of an existing message in place (e.g. a slot of a reused packet).
+
+        Args:
+            proto (grSim_Robot_Command): Message to update
+        """
+        # NOTE: Drop the wheels left by a former command of the message
+        if proto.wheelsspeed and not self.use_wheels_speed:
+            for name in ("wheel1", "wheel2", "wheel3", "wheel4"):
+                proto.ClearField(name)
 
         # Required
         proto.id = self.robot_id
@@ -102,8 +117,6 @@ class RobotCommand:
             proto.wheel3 = self.wheels[2]
             proto.wheel4 = self.wheels[3]
 
-        return proto
-
 
 @dataclass()
 class RobotCustomCommand:
@@ -6,12 +6,18 @@
         - Robot
 """
 
+from math import isnan
 from typing import Optional
 
+from numpy import bool_, float64
+from numpy.typing import NDArray
+
 from racoon_ai.common import MathUtils as MU
 from racoon_ai.models.coordinate import Pose
 from racoon_ai.proto.pb_gen.to_racoonai_pb2 import Robot_Infos
 
+from .states import RobotStates
+
 
 class Robot(Pose):
     """
@@ -22,6 +28,8 @@ class Robot(Pose):
 
         is_imu_enabled (bool): is imu enabled
 
+        states (RobotStates, optional): team states to view (the row `robot_id` is used)
+
     Attributes:
         robot_id (int): robot id
 
@@ -54,24 +62,19 @@ class Robot(Pose):
         is_visible (bool) : is robot visible
 
         battery_voltage (float, optional) : battery voltage
+
+    NOTE:
+        This is a thin view of a row of `RobotStates`; it holds no state of its own.
     """
 
-    def __init__(self, robot_id: int, is_imu_enabled: bool = False) -> None:
+    def __init__(self, robot_id: int, is_imu_enabled: bool = False, *, states: Optional[RobotStates] = None) -> None:
         super().__init__(0, 0)  # x, y, theta, z
         self.__robot_id: int = robot_id
         self.__is_imu_enabled: bool = is_imu_enabled
-        self.__diff: Pose = Pose(0, 0)
-        self.__distance_ball_robot: float = float(0)
-        self.__radian_ball_robot: float = float(0)
-        self.__sec_par_frame: float = float(0)
-        self.__speed: float = float(0)
-        self.__speed_slope: float = float(0)
-        self.__speed_intercept: float = float(0)
-        self.__vel_angular: float = float(0)
-        self.__is_ball_catched: bool = False
-        self.__is_online: bool = False
-        self.__is_visible: bool = False
-        self.__battery_voltage: Optional[float] = None
+        self.__states: RobotStates = states if (states is not None) else RobotStates(1)
+        self.__index: int = robot_id if (states is not None) else 0
+        self.__data: NDArray[float64] = self.__states.data
+        self.__flags: NDArray[bool_] = self.__states.flags
 
     def __str__(self) -> str:
         msg: str = "("
@@ -104,15 +107,47 @@ class Robot(Pose):
     def __hash__(self) -> int:
         return hash(id(self))
 
+    @property
+    def x(self) -> float:
+        """x"""
+        return float(self.__data.item(self.__index, RobotStates.X))
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self.__data[self.__index, RobotStates.X] = x
+
+    @property
+    def y(self) -> float:
+        """y"""
+        return float(self.__data.item(self.__index, RobotStates.Y))
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self.__data[self.__index, RobotStates.Y] = y
+
+    @property
+    def theta(self) -> float:
+        """theta"""
+        return float(self.__data.item(self.__index, RobotStates.THETA))
+
+    @theta.setter
+    def theta(self, theta: float) -> None:
+        self.__data[self.__index, RobotStates.THETA] = theta
+
+    @property
+    def states(self) -> RobotStates:
+        """states"""
+        return self.__states
+
     @property
     def distance_ball_robot(self) -> float:
         """distance_ball_robot"""
-        return self.__distance_ball_robot
+        return float(self.__data.item(self.__index, RobotStates.DISTANCE_BALL_ROBOT))
 
     @property
     def radian_ball_robot(self) -> float:
         """radian_ball_robot"""
-        return self.__radian_ball_robot
+        return float(self.__data.item(self.__index, RobotStates.RADIAN_BALL_ROBOT))
 
     @property
     def robot_id(self) -> int:
@@ -132,7 +167,12 @@ class Robot(Pose):
 
         NOTE: `diff.z` is not available now (always 0)
         """
-        return self.__diff
+        return Pose(
+            self.__data.item(self.__index, RobotStates.DIFF_X),
+            self.__data.item(self.__index, RobotStates.DIFF_Y),
+            self.__data.item(self.__index, RobotStates.DIFF_THETA),
+            0,
+        )
 
     @property
     def velocity(self) -> Pose:
@@ -143,10 +183,11 @@ class Robot(Pose):
         Returns:
             Pose: velocity of robot
         """
+        sec_per_frame: float = MU.div_safe(self.__states.sec_per_frame)
         return Pose(
-            self.diff.x / MU.div_safe(self.__sec_par_frame),
-            self.diff.y / MU.div_safe(self.__sec_par_frame),
-            self.diff.theta / MU.div_safe(self.__sec_par_frame),
+            self.__data.item(self.__index, RobotStates.DIFF_X) / sec_per_frame,
+            self.__data.item(self.__index, RobotStates.DIFF_Y) / sec_per_frame,
+            self.__data.item(self.__index, RobotStates.DIFF_THETA) / sec_per_frame,
             0,
         )
 
@@ -159,7 +200,7 @@ class Robot(Pose):
         Returns:
             float
         """
-        return self.__speed
+        return float(self.__data.item(self.__index, RobotStates.SPEED))
 
     @property
     def speed_slope(self) -> float:  # pylint: disable=R0801
@@ -170,7 +211,7 @@ class Robot(Pose):
         Returns:
             float
         """
-        return self.__speed_slope
+        return float(self.__data.item(self.__index, RobotStates.SPEED_SLOPE))
 
     @property
     def speed_intercept(self) -> float:  # pylint: disable=R0801
@@ -181,32 +222,33 @@ class Robot(Pose):
         Returns:
             float
         """
-        return self.__speed_intercept
+        return float(self.__data.item(self.__index, RobotStates.SPEED_INTERCEPT))
 
     @property
     def vel_angular(self) -> float:
         """vel_angular"""
-        return self.__vel_angular
+        return float(self.__data.item(self.__index, RobotStates.VEL_ANGULAR))
 
     @property
     def is_ball_catched(self) -> bool:
         """is_ball_catched"""
-        return self.__is_ball_catched
+        return bool(self.__flags.item(self.__index, RobotStates.BALL_CATCHED))
 
     @property
     def is_online(self) -> bool:
         """is_online"""
-        return self.__is_online
+        return bool(self.__flags.item(self.__index, RobotStates.ONLINE))
 
     @property
     def is_visible(self) -> bool:
         """is_visible"""
-        return self.__is_visible
+        return bool(self.__flags.item(self.__index, RobotStates.VISIBLE))
 
     @property
     def battery_voltage(self) -> Optional[float]:
         """battery_voltage"""
-        return self.__battery_voltage
+        voltage: float = float(self.__data.item(self.__index, RobotStates.BATTERY_VOLTAGE))
+        return None if isnan(voltage) else voltage
 
     def update(self, drobot: Robot_Infos, sec_par_frame: float) -> None:
         """
@@ -215,29 +257,7 @@ class Robot(Pose):
         Args:
             drobot (Robot_Infos): Robot_Infos
         """
-        self.__from_proto(drobot)
-        self.__sec_par_frame = sec_par_frame
-
-    def __from_proto(self, dbot: Robot_Infos) -> None:
-        """from_proto
-
-        Args:
-            drobot (Robot_Infos): Robot_Infos
-        """
-        self.x = dbot.x
-        self.y = dbot.y
-        self.theta = dbot.theta
-        self.__diff = Pose(dbot.diff_x, dbot.diff_y, dbot.diff_theta, 0)
-        self.__distance_ball_robot = dbot.distance_ball_robot
-        self.__radian_ball_robot = dbot.radian_ball_robot
-        self.__speed = dbot.speed
-        self.__speed_slope = dbot.slope
-        self.__speed_intercept = dbot.intercept
-        self.__vel_angular = dbot.angular_velocity
-        self.__is_ball_catched = dbot.ball_catch
-        self.__is_online = dbot.online
-        self.__is_visible = dbot.visible
-        self.__battery_voltage = dbot.battery_voltage
+        self.__states.update_one(self.__index, drobot, sec_par_frame)
 
     def to_pose(self) -> Pose:
         """to_pose
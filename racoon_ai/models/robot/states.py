@@ -0,0 +1,178 @@
+#!/usr/bin/env python3.10
+
+"""states.py
+
+    This module contains
+        - RobotStates
+"""
+
+from typing import Final, Iterable
+
+from numpy import bool_, float64, nan, zeros
+from numpy.typing import NDArray
+
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import Robot_Infos
+
+
+class RobotStates:
+    """RobotStates
+
+    Struct-of-arrays storage of a team, indexed by robot id.
+    Each attribute below is a view into the shared matrices, so it reflects the latest packet.
+
+    Args:
+        size (int, optional): Number of robot ids to hold (default: 16)
+
+    Attributes:
+        size (int): Number of robot ids held
+        sec_per_frame (float): Seconds per frame of the latest update
+        data (NDArray[float64]): (size, N_FIELDS) matrix of the numerical fields
+        flags (NDArray[bool_]): (size, N_FLAGS) matrix of the boolean fields
+        x (NDArray[float64]): x coordinates
+        y (NDArray[float64]): y coordinates
+        theta (NDArray[float64]): orientations (radian)
+        pose (NDArray[float64]): (size, 3) view of x, y and theta
+        diff (NDArray[float64]): (size, 3) view of the differences of x, y and theta
+        speed (NDArray[float64]): speeds (absolute value)
+        is_visible (NDArray[bool_]): visibility
+        is_online (NDArray[bool_]): online status
+        is_ball_catched (NDArray[bool_]): ball-catch status
+    """
+
+    X: Final[int] = 0
+    Y: Final[int] = 1
+    THETA: Final[int] = 2
+    DIFF_X: Final[int] = 3
+    DIFF_Y: Final[int] = 4
+    DIFF_THETA: Final[int] = 5
+    DISTANCE_BALL_ROBOT: Final[int] = 6
+    RADIAN_BALL_ROBOT: Final[int] = 7
+    SPEED: Final[int] = 8
+    SPEED_SLOPE: Final[int] = 9
+    SPEED_INTERCEPT: Final[int] = 10
+    VEL_ANGULAR: Final[int] = 11
+    BATTERY_VOLTAGE: Final[int] = 12
+    N_FIELDS: Final[int] = 13
+
+    VISIBLE: Final[int] = 0
+    ONLINE: Final[int] = 1
+    BALL_CATCHED: Final[int] = 2
+    N_FLAGS: Final[int] = 3
+
+    def __init__(self, size: int = 16) -> None:
+        self.__size: int = size
+        self.__sec_per_frame: float = float(0)
+
+        self.__data: NDArray[float64] = zeros((size, self.N_FIELDS), dtype=float64)
+        self.__data[:, self.BATTERY_VOLTAGE] = nan
+        self.__flags: NDArray[bool_] = zeros((size, self.N_FLAGS), dtype=bool_)
+
+        self.x: NDArray[float64] = self.__data[:, self.X]
+        self.y: NDArray[float64] = self.__data[:, self.Y]
+        self.theta: NDArray[float64] = self.__data[:, self.THETA]
+        self.pose: NDArray[float64] = self.__data[:, self.X : (self.THETA + 1)]
+        self.diff: NDArray[float64] = self.__data[:, self.DIFF_X : (self.DIFF_THETA + 1)]
+        self.speed: NDArray[float64] = self.__data[:, self.SPEED]
+        self.is_visible: NDArray[bool_] = self.__flags[:, self.VISIBLE]
+        self.is_online: NDArray[bool_] = self.__flags[:, self.ONLINE]
+        self.is_ball_catched: NDArray[bool_] = self.__flags[:, self.BALL_CATCHED]
+
+    def __str__(self) -> str:
+        msg: str = "("
+        msg += ", ".join(
+            f"id={i:2d}: pose=(x={row[self.X]:.1E}, y={row[self.Y]:.1E}, theta={row[self.THETA]:.1E})"
+            for i, row in enumerate(self.__data)
+            if self.__flags[i, self.VISIBLE]
+        )
+        msg += ")"
+        return msg
+
+    @property
+    def size(self) -> int:
+        """size"""
+        return self.__size
+
+    @property
+    def sec_per_frame(self) -> float:
+        """sec_per_frame"""
+        return self.__sec_per_frame
+
+    @property
+    def data(self) -> NDArray[float64]:
+        """data"""
+        return self.__data
+
+    @property
+    def flags(self) -> NDArray[bool_]:
+        """flags"""
+        return self.__flags
+
+    def update(self, protos: Iterable[Robot_Infos], sec_per_frame: float) -> list[int]:
+        """update
+
+        Fill the rows of the robots in the packet (in a single pass).
+        Robots absent from the packet keep their last state.
+
+        Args:
+            protos (Iterable[Robot_Infos]): Robot infos of the packet
+            sec_per_frame (float): Seconds per frame
+
+        Returns:
+            list[int]: Robot ids which could not be set (out of range)
+        """
+        self.__sec_per_frame = sec_per_frame
+
+        ids: list[int] = []
+        rows: list[tuple[float, ...]] = []
+        flags: list[tuple[bool, bool, bool]] = []
+        rejected: list[int] = []
+        for dbot in protos:
+            if dbot.robot_id >= self.__size:
+                rejected.append(dbot.robot_id)
+                continue
+            ids.append(dbot.robot_id)
+            rows.append(self.__to_row(dbot))
+            flags.append((dbot.visible, dbot.online, dbot.ball_catch))
+
+        if ids:
+            self.__data[ids] = rows
+            self.__flags[ids] = flags
+        return rejected
+
+    def update_one(self, index: int, dbot: Robot_Infos, sec_per_frame: float) -> None:
+        """update_one
+
+        Args:
+            index (int): Row to fill
+            dbot (Robot_Infos): Robot_Infos
+            sec_per_frame (float): Seconds per frame
+        """
+        self.__sec_per_frame = sec_per_frame
+        self.__data[index] = self.__to_row(dbot)
+        self.__flags[index] = (dbot.visible, dbot.online, dbot.ball_catch)
+
+    @staticmethod
+    def __to_row(dbot: Robot_Infos) -> tuple[float, ...]:
+        """to_row
+
+        Args:
+            dbot (Robot_Infos): Robot_Infos
+
+        Returns:
+            tuple[float, ...]: Numerical fields in the column order
+        """
+        return (
+            dbot.x,
+            dbot.y,
+            dbot.theta,
+            dbot.diff_x,
+            dbot.diff_y,
+            dbot.diff_theta,
+            dbot.distance_ball_robot,
+            dbot.radian_ball_robot,
+            dbot.speed,
+            dbot.slope,
+            dbot.intercept,
+            dbot.angular_velocity,
+            dbot.battery_voltage,
+        )
@@ -3,11 +3,15 @@
 
 from configparser import ConfigParser
 from logging import Logger
+from typing import Optional
 
 from racoon_ai.observer import Observer
 
 from .basics import halt_all, move2pose, reset_all_imu
 from .controls import Controls
+from .mpc import SamplingMPC
+from .planner import PathPlanner
+from .trajectory import BangBangTrajectory
 
 
 def create_controls(config: ConfigParser, logger: Logger, observer: Observer) -> Controls:
@@ -18,20 +22,90 @@ def create_controls(config: ConfigParser, logger: Logger, observer: Observer) ->
         logger: Logger
         observer: Observer
     """
+    # Jump of a target (mm) taken as a new target, which resets the PID state of the robot
+    reset_distance: float = config.getfloat("pid_gains", "reset_distance", fallback=500)
+    planner: Optional[PathPlanner] = create_planner(config, logger, observer)
+    # Limits of the time-optimal trajectories (m/s^2, rad/s^2)
+    max_accel: float = config.getfloat("trajectory", "max_accel", fallback=3)
+    max_angular_accel: float = config.getfloat("trajectory", "max_angular_accel", fallback=12.5)
+    mpc: Optional[SamplingMPC] = create_mpc(config, logger, observer)
+
     if not config.getboolean("pid_gains", "use_custom_gains", fallback=False):
-        return Controls(observer)
+        return Controls(
+            observer,
+            reset_distance=reset_distance,
+            planner=planner,
+            max_accel=max_accel,
+            max_angular_accel=max_angular_accel,
+            mpc=mpc,
+        )
 
     kp: float = float(config.get("pid_gains", "kp") or 1)
     ki: float = float(config.get("pid_gains", "ki") or 0)
     kd: float = float(config.get("pid_gains", "kd") or 0)
     custom_gains: tuple[float, float, float] = (kp, kd, ki)
     logger.info("Using custom PID gains (kp, kd, ki): %s", custom_gains)
-    return Controls(observer, k_gain=custom_gains)
+    return Controls(
+        observer,
+        k_gain=custom_gains,
+        reset_distance=reset_distance,
+        planner=planner,
+        max_accel=max_accel,
+        max_angular_accel=max_angular_accel,
+        mpc=mpc,
+    )
+
+
+def create_mpc(config: ConfigParser, logger: Logger, observer: Observer) -> Optional[SamplingMPC]:
+    """create_mpc
+
+    Args:
+        config: ConfigParser
+        logger: Logger
+        observer: Observer
+
+    Returns:
+        Optional[SamplingMPC]: None if disabled (default)
+    """
+    if not config.getboolean("mpc", "enabled", fallback=False):
+        return None
+
+    samples: int = config.getint("mpc", "samples", fallback=256)
+    horizon: int = config.getint("mpc", "horizon", fallback=10)
+    logger.info("MPC of the ball approach: %d samples of %d steps", samples, horizon)
+    return SamplingMPC(observer, samples=samples, horizon=horizon)
+
+
+def create_planner(config: ConfigParser, logger: Logger, observer: Observer) -> Optional[PathPlanner]:
+    """create_planner
+
+    Args:
+        config: ConfigParser
+        logger: Logger
+        observer: Observer
+
+    Returns:
+        Optional[PathPlanner]: None if disabled
+    """
+    if not config.getboolean("planner", "enabled", fallback=True):
+        logger.info("Path planner disabled")
+        return None
+
+    cell_size: float = config.getfloat("planner", "cell_size", fallback=100)
+    clearance: float = config.getfloat("planner", "clearance", fallback=250)
+    budget_ms: float = config.getfloat("planner", "budget_ms", fallback=2)
+    logger.info("Path planner: %.0f mm cells, %.0f mm clearance, %.1f ms per cycle", cell_size, clearance, budget_ms)
+    return PathPlanner(observer, cell_size=cell_size, clearance=clearance, budget_ms=budget_ms)
 
 
 __all__ = [
+    "BangBangTrajectory",
     "Controls",
+    "PathPlanner",
+    "SamplingMPC",
     "create_controls",
+    "create_mpc",
+    "create_planner",
     "halt_all",
     "move2pose",
     "reset_all_imu",
@@ -8,6 +8,7 @@
 """
 
 from math import cos, sin
+from typing import Iterable
 
 from racoon_ai.common import MathUtils as MU
 from racoon_ai.models.coordinate import Pose
@@ -60,11 +61,11 @@ def _reset_imu(bot: Robot) -> RobotCommand:
     return cmd
 
 
-def reset_all_imu(our_available_bots: set[Robot]) -> list[RobotCommand]:
+def reset_all_imu(our_available_bots: Iterable[Robot]) -> list[RobotCommand]:
     """reset_all_imu
 
     Args:
-        target_ids (set[int])
+        our_available_bots (Iterable[Robot])
 
     Returns:
         list[RobotCommand]
@@ -7,9 +7,13 @@
 
 from logging import getLogger
 from math import cos, sin, sqrt
-from typing import Tuple
+from typing import Iterable, Mapping, Optional, Sequence, Tuple, cast
 
-from numpy import array, divide, dot, float64, multiply, sign, subtract, zeros
+from numpy import absolute, arctan2, array, bool_, clip
+from numpy import cos as cos_array
+from numpy import divide, dot, float64, full, hypot, inf, int64, isnan, multiply, nan, ones, repeat, sign
+from numpy import sin as sin_array
+from numpy import stack, subtract, tile, where, zeros
 from numpy.typing import NDArray
 
 from racoon_ai.common import MathUtils as MU
@@ -17,32 +21,70 @@ from racoon_ai.models.coordinate import Point, Pose
 from racoon_ai.models.robot import Robot, RobotCommand
 from racoon_ai.observer import Observer
 
+from .mpc import SamplingMPC
+from .planner import PathPlanner
+from .trajectory import BangBangTrajectory
+
 
 class Controls:
     """Controls
     Args:
         observer (Observer): Observer instance
         k_gain (Tuple[float, float, float]): PID gain (kp, ki, kd)
+        reset_distance (float, optional): Jump of the target (mm) taken as a new target (default: 500)
+        planner (PathPlanner, optional): Path planner used by `move` (default: None, head straight to the target)
+        max_accel (float, optional): Acceleration limit of the trajectories (m/s^2) (default: 3)
+        max_angular_accel (float, optional): Angular acceleration limit of the trajectories (rad/s^2) (default: 12.5)
+        mpc (SamplingMPC, optional): Controller of `ball_around` and `to_front_ball` (default: None, potential fields)
 
     Attributes:
         send_cmds (list[RobotCommand]): RobotCommand list.
+
+    NOTE:
+        The PID state is kept per robot id (as many as the Observer handles) and is reset (see `reset`)
+        when the robot gets a new target or assignment, or goes out of sight, so that neither
+        the derivative of the jump nor the integral of the former target drives the robot.
+        A reset state (NaN) is seeded with the current poses at the next call.
     """
 
-    def __init__(self, observer: Observer, k_gain: Tuple[float, float, float] = (1, 0, 0)) -> None:
+    def __init__(
+        self,
+        observer: Observer,
+        k_gain: Tuple[float, float, float] = (1, 0, 0),
+        *,
+        reset_distance: float = 500,
+        planner: Optional[PathPlanner] = None,
+        max_accel: float = 3,
+        max_angular_accel: float = 12.5,
+        mpc: Optional[SamplingMPC] = None,
+    ) -> None:
         self.__logger = getLogger(__name__)
         self.__observer: Observer = observer
         self.__dtaime: float = self.__observer.sec_per_frame
         self.__k_gain: NDArray[float64] = array(k_gain, dtype=float64)
-        self.__pre_target_pose: NDArray[float64] = zeros((11, 3), dtype=float64)
-        self.__pre_bot_pose: NDArray[float64] = zeros((11, 3), dtype=float64)
-        self.__accumulations: NDArray[float64] = zeros((11, 3), dtype=float64)
-        self.__pre_target_theta: NDArray[float64] = zeros((11,), dtype=float64)
-        self.__pre_bot_theta: NDArray[float64] = zeros((11,), dtype=float64)
-        self.__theta_accumulation: NDArray[float64] = zeros((11,), dtype=float64)
+        size: int = self.__observer.our_states.size
+        self.__pre_target_pose: NDArray[float64] = full((size, 3), nan, dtype=float64)
+        self.__pre_bot_pose: NDArray[float64] = full((size, 3), nan, dtype=float64)
+        self.__accumulations: NDArray[float64] = zeros((size, 3), dtype=float64)
+        self.__pre_target_theta: NDArray[float64] = full((size,), nan, dtype=float64)
+        self.__pre_bot_theta: NDArray[float64] = full((size,), nan, dtype=float64)
+        self.__theta_accumulation: NDArray[float64] = zeros((size,), dtype=float64)
+        self.__is_imu_enabled: NDArray[bool_] = array(
+            [bot.is_imu_enabled for bot in self.__observer.our_robots], dtype=bool_
+        )
+        self.__reset_distance: float = reset_distance / 1000
+        self.__assignments: dict[int, str] = {}
+        self.__available_ids: tuple[int, ...] = ()
+        # NOTE: mm -> m for x and y (theta is kept in radian)
+        self.__pose_scale: NDArray[float64] = array([1e-3, 1e-3, 1], dtype=float64)
         self.__standard_distance_enemy: float = 500**2
         # self.__standard_distance_penalty: float = 350**2
         # self.__max_robot_radius: float = 90
         self.__attack_direction: float = self.__observer.attack_direction
+        self.__planner: Optional[PathPlanner] = planner
+        self.__max_accel: float = max_accel
+        self.__max_angular_accel: float = max_angular_accel
+        self.__mpc: Optional[SamplingMPC] = mpc
 
     def pid(self, target: Pose, bot: Robot, limiter: float = 0.3) -> RobotCommand:  # pylint: disable=R0914
         """pid
@@ -62,6 +104,14 @@ class Controls:
         bot_pose: NDArray[float64] = array([bot.x / 1000, bot.y / 1000, bot.theta], dtype=float64)
         target_pose: NDArray[float64] = array([target.x / 1000, target.y / 1000, target.theta], dtype=float64)
 
+        pre_x, pre_y = self.__pre_target_pose[bot_id, :2].tolist()
+        if sqrt((target_pose[0] - pre_x) ** 2 + (target_pose[1] - pre_y) ** 2) > self.__reset_distance:
+            self.reset((bot_id,))
+        if isnan(self.__pre_bot_pose[bot_id, 0]):
+            # NOTE: Reset state; seed it with the current poses
+            self.__pre_bot_pose[bot_id] = bot_pose
+            self.__pre_target_pose[bot_id] = target_pose
+
         bot_speed: NDArray[float64] = divide(
             subtract(bot_pose, self.__pre_bot_pose[bot_id], dtype=float64), self.__dtaime, dtype=float64
         )
@@ -103,6 +153,244 @@ class Controls:
         self.__logger.debug("cmd: %s", cmd)
         return cmd
 
+    def pid_all(  # pylint: disable=R0914
+        self, targets: NDArray[float64], bot_ids: Sequence[int], limiter: float = 0.3
+    ) -> list[RobotCommand]:
+        """pid_all
+
+        Apply PID control to several robots at once (same result as `pid` for each robot).
+
+        Args:
+            targets (NDArray[float64]): (n, 3) target poses (x, y, theta)
+            bot_ids (Sequence[int]): ids of our robots, without duplicates (n)
+            limiter (float, optional): speed limit (default: 0.3, nolimit: -1)
+
+        Returns:
+            list[RobotCommand]: RobotCommands in the order of `bot_ids`
+        """
+        ids: NDArray[int64] = array(bot_ids, dtype=int64)
+        dtime: float = self.__dtaime
+        kp, kd, ki = self.__k_gain.tolist()
+
+        states = self.__observer.our_states
+        bot_pose: NDArray[float64] = states.pose[ids] * self.__pose_scale
+        target_pose: NDArray[float64] = targets * self.__pose_scale
+        bot_theta: NDArray[float64] = bot_pose[:, 2]
+        target_theta: NDArray[float64] = target_pose[:, 2]
+
+        pre_target_pose: NDArray[float64] = self.__pre_target_pose[ids]
+        jumped: NDArray[bool_] = (
+            hypot(target_pose[:, 0] - pre_target_pose[:, 0], target_pose[:, 1] - pre_target_pose[:, 1])
+            > self.__reset_distance
+        )
+        if jumped.any():
+            self.reset(ids[jumped].tolist())
+            pre_target_pose = self.__pre_target_pose[ids]
+        pre_target_pose = where(isnan(pre_target_pose), target_pose, pre_target_pose)
+        pre_bot_pose: NDArray[float64] = self.__pre_bot_pose[ids]
+        pre_bot_pose = where(isnan(pre_bot_pose), bot_pose, pre_bot_pose)
+
+        diff_pose: NDArray[float64] = target_pose - bot_pose
+        diff_pose[:, 2] = MU.radian_normalize_array(diff_pose[:, 2])
+        diff_speed: NDArray[float64] = ((target_pose - pre_target_pose) - (bot_pose - pre_bot_pose)) / dtime
+
+        self.__pre_bot_pose[ids] = bot_pose
+        self.__pre_target_pose[ids] = target_pose
+        self.__accumulations[ids] += diff_pose * dtime
+
+        bvel: NDArray[float64] = kp * diff_pose + kd * diff_speed + ki * self.__accumulations[ids]
+        cos_theta: NDArray[float64] = cos_array(bot_theta)
+        sin_theta: NDArray[float64] = sin_array(bot_theta)
+        vel_fwd: NDArray[float64] = bvel[:, 0] * cos_theta + bvel[:, 1] * sin_theta
+        vel_sway: NDArray[float64] = bvel[:, 1] * cos_theta - bvel[:, 0] * sin_theta
+
+        # NOTE: As `pid_radian`; without the IMU, `pid` calls it twice and the D term of the second call is zero
+        pre_target_theta: NDArray[float64] = self.__pre_target_theta[ids]
+        pre_bot_theta: NDArray[float64] = self.__pre_bot_theta[ids]
+        e_theta: NDArray[float64] = (target_theta - where(isnan(pre_target_theta), target_theta, pre_target_theta)) - (
+            bot_theta - where(isnan(pre_bot_theta), bot_theta, pre_bot_theta)
+        )
+        self.__theta_accumulation[ids] += e_theta * dtime
+        self.__pre_target_theta[ids] = target_theta
+        self.__pre_bot_theta[ids] = bot_theta
+        use_imu: NDArray[bool_] = self.__is_imu_enabled[ids]
+        vel_angular: NDArray[float64] = clip(
+            kp * MU.radian_normalize_array(target_theta - bot_theta)
+            + where(use_imu, kd * e_theta / dtime, 0)
+            + ki * self.__theta_accumulation[ids],
+            -MU.PI,
+            MU.PI,
+        )
+
+        if limiter > 0:
+            speed: NDArray[float64] = hypot(vel_fwd, vel_sway)
+            scale: NDArray[float64] = ones(ids.size, dtype=float64)
+            over: NDArray[bool_] = speed > limiter
+            scale[over] = limiter / speed[over]
+            vel_fwd *= scale
+            vel_sway *= scale
+
+        return self.__to_commands(ids, vel_fwd, vel_sway, vel_angular, targets)
+
+    def trajectory(self, target: Pose, bot: Robot, limiter: float = 0.3) -> RobotCommand:
+        """trajectory
+
+        Follow the time-optimal trajectory to the target pose (see `trajectory_all`).
+
+        Args:
+            target (Pose): Target pose
+            bot (Robot): Robot instance
+            limiter (float, optional): speed limit (default: 0.3, nolimit: -1)
+
+        Returns:
+            RobotCommand: RobotCommand instance
+        """
+        targets: NDArray[float64] = array([[target.x, target.y, target.theta]], dtype=float64)
+        return self.trajectory_all(targets, (int(bot.robot_id),), limiter)[0]
+
+    def trajectory_all(
+        self, targets: NDArray[float64], bot_ids: Sequence[int], limiter: float = 0.3
+    ) -> list[RobotCommand]:
+        """trajectory_all
+
+        Follow time-optimal (bang-bang) trajectories from the current poses and velocities to the targets
+        (see BangBangTrajectory), solved again every cycle. Each robot is commanded the velocity of its trajectory
+        one frame ahead, so that it brakes in time and stops on the target instead of overshooting.
+
+        Args:
+            targets (NDArray[float64]): (n, 3) target poses (x, y, theta)
+            bot_ids (Sequence[int]): ids of our robots (n)
+            limiter (float, optional): speed limit (default: 0.3, nolimit: -1)
+
+        Returns:
+            list[RobotCommand]: RobotCommands in the order of `bot_ids`
+        """
+        ids: NDArray[int64] = array(bot_ids, dtype=int64)
+        bot_pose: NDArray[float64] = self.__observer.our_states.pose[ids] * self.__pose_scale
+        trajectories: BangBangTrajectory = self.__trajectories(bot_pose, ids, targets * self.__pose_scale, limiter)
+
+        # NOTE: The velocity at the end of the frame keeps the acceleration of the trajectory
+        #       (the mean velocity over the frame would only reach half of it); the last frame closes the gap
+        next_pose, vel = trajectories.state(self.__dtaime)
+        last_move: NDArray[float64] = next_pose - bot_pose
+        last_move[:, 2] = MU.radian_normalize_array(last_move[:, 2])
+        arrived: NDArray[bool_] = trajectories.duration <= self.__dtaime
+        vel[arrived] = last_move[arrived] / self.__dtaime
+
+        cos_theta: NDArray[float64] = cos_array(bot_pose[:, 2])
+        sin_theta: NDArray[float64] = sin_array(bot_pose[:, 2])
+        vel_fwd: NDArray[float64] = vel[:, 0] * cos_theta + vel[:, 1] * sin_theta
+        vel_sway: NDArray[float64] = vel[:, 1] * cos_theta - vel[:, 0] * sin_theta
+        return self.__to_commands(ids, vel_fwd, vel_sway, clip(vel[:, 2], -MU.PI, MU.PI), targets)
+
+    def time_to_arrival(
+        self, targets: NDArray[float64], bot_ids: Sequence[int], limiter: float = 0.3
+    ) -> NDArray[float64]:
+        """time_to_arrival
+
+        Predicted time for each robot to reach (and stop at) each target, along its time-optimal trajectory;
+        e.g. as the cost of assigning the targets to the robots.
+
+        Args:
+            targets (NDArray[float64]): (m, 2) target points (x, y), in mm
+            bot_ids (Sequence[int]): ids of our robots (n)
+            limiter (float, optional): speed limit (default: 0.3, nolimit: -1)
+
+        Returns:
+            NDArray[float64]: (n, m) times (seconds)
+        """
+        ids: NDArray[int64] = array(bot_ids, dtype=int64)
+        n_targets: int = targets.shape[0]
+        bot_pose: NDArray[float64] = repeat(self.__observer.our_states.pose[ids] * self.__pose_scale, n_targets, axis=0)
+        target_pose: NDArray[float64] = bot_pose.copy()
+        target_pose[:, :2] = tile(targets[:, :2] * 1e-3, (ids.size, 1))
+        trajectories: BangBangTrajectory = self.__trajectories(bot_pose, repeat(ids, n_targets), target_pose, limiter)
+        return trajectories.duration_xy.reshape(ids.size, n_targets)
+
+    def __trajectories(
+        self, bot_pose: NDArray[float64], ids: NDArray[int64], target_pose: NDArray[float64], limiter: float
+    ) -> BangBangTrajectory:
+        """trajectories
+
+        Args:
+            bot_pose (NDArray[float64]): (n, 3) poses of the robots (m, radian)
+            ids (NDArray[int64]): ids of our robots (n)
+            target_pose (NDArray[float64]): (n, 3) target poses (m, radian)
+            limiter (float): speed limit (nolimit: -1)
+
+        Returns:
+            BangBangTrajectory: Trajectories from the current poses and velocities
+        """
+        velocity: NDArray[float64] = self.__observer.our_states.diff[ids] * self.__pose_scale
+        velocity[:, 2] = MU.radian_normalize_array(velocity[:, 2])
+        velocity /= self.__dtaime
+        return BangBangTrajectory(
+            bot_pose,
+            velocity,
+            target_pose,
+            limiter if (limiter > 0) else inf,
+            self.__max_accel,
+            max_angular_speed=MU.PI,
+            max_angular_accel=self.__max_angular_accel,
+        )
+
+    def __to_commands(
+        self,
+        ids: NDArray[int64],
+        vel_fwd: NDArray[float64],
+        vel_sway: NDArray[float64],
+        vel_angular: NDArray[float64],
+        targets: NDArray[float64],
+    ) -> list[RobotCommand]:
+        """to_commands
+
+        Args:
+            ids (NDArray[int64]): ids of our robots (n)
+            vel_fwd (NDArray[float64]): Forward velocities (n)
+            vel_sway (NDArray[float64]): Sideways velocities (n)
+            vel_angular (NDArray[float64]): Angular velocities (n)
+            targets (NDArray[float64]): (n, 3) target poses (x, y, theta)
+
+        Returns:
+            list[RobotCommand]: RobotCommands in the order of `ids`
+        """
+        cmds: list[RobotCommand] = []
+        for bot_id, imu, fwd, sway, angular, target in zip(
+            ids.tolist(),
+            self.__is_imu_enabled[ids].tolist(),
+            vel_fwd.tolist(),
+            vel_sway.tolist(),
+            vel_angular.tolist(),
+            targets.tolist(),
+        ):
+            cmd: RobotCommand = RobotCommand(bot_id, use_imu=imu)
+            cmd.vel_fwd = fwd
+            cmd.vel_sway = sway
+            cmd.vel_angular = angular
+            cmd.target_pose = Pose(*target)
+            cmds.append(cmd)
+        self.__logger.debug("cmds: %s", cmds)
+        return cmds
+
+    def move(self, target: Pose, bot: Robot, limiter: float = 0.3, *, avoid_penalty: bool = True) -> RobotCommand:
+        """move
+
+        PID toward the next waypoint of the path planned to the target (see PathPlanner);
+        same as `pid` if no planner is given.
+
+        Args:
+            target (Pose): Target pose
+            bot (Robot): Robot instance
+            limiter (float, optional): speed limit (default: 0.3)
+            avoid_penalty (bool, optional): Plan around the penalty areas (default: True)
+
+        Returns:
+            RobotCommand: RobotCommand instance
+        """
+        if self.__planner is None:
+            return self.pid(target, bot, limiter)
+        return self.pid(self.__planner.waypoint(target, bot, avoid_penalty=avoid_penalty), bot, limiter)
+
     def pid_radian(self, target_theta: float, bot: Robot) -> float:
         """pid_radian
 
@@ -116,9 +404,11 @@ class Controls:
         ki: float = float(self.__k_gain[2])
         bot_id: int = int(bot.robot_id)
 
-        e_bot: float = bot.theta - self.__pre_bot_theta[bot_id]
-        e_target: float = target_theta - self.__pre_target_theta[bot_id]
-        self.__theta_accumulation += (e_target - e_bot) * self.__dtaime
+        pre_bot_theta: float = float(self.__pre_bot_theta[bot_id])
+        pre_target_theta: float = float(self.__pre_target_theta[bot_id])
+        e_bot: float = 0 if isnan(pre_bot_theta) else (bot.theta - pre_bot_theta)
+        e_target: float = 0 if isnan(pre_target_theta) else (target_theta - pre_target_theta)
+        self.__theta_accumulation[bot_id] += (e_target - e_bot) * self.__dtaime
 
         vel_angular += kp * (MU.radian_normalize(target_theta - bot.theta))
         vel_angular += kd * ((e_target / self.__dtaime) - (e_bot / self.__dtaime))
@@ -135,6 +425,50 @@ class Controls:
         self.__logger.debug("vel_angular: %s", vel_angular)
         return vel_angular
 
+    def reset(self, bot_ids: Iterable[int]) -> None:
+        """reset
+
+        Drop the PID state (history and integral) of the robots, and the warm start of the MPC (if any).
+
+        Args:
+            bot_ids (Iterable[int]): ids of our robots
+        """
+        ids: list[int] = list(bot_ids)
+        self.__logger.debug("Reset the PID state of %s", ids)
+        self.__pre_target_pose[ids] = nan
+        self.__pre_bot_pose[ids] = nan
+        self.__accumulations[ids] = 0
+        self.__pre_target_theta[ids] = nan
+        self.__pre_bot_theta[ids] = nan
+        self.__theta_accumulation[ids] = 0
+        if self.__mpc is not None:
+            for bot_id in ids:
+                self.__mpc.reset(bot_id)
+
+    def update(self, assignments: Mapping[int, str]) -> None:
+        """update
+
+        Reset the robots whose assignment changed, or which are no longer available, since the last call.
+        Call once per cycle, before the commands are made.
+
+        Args:
+            assignments (Mapping[int, str]): Assignment (e.g. role) of each robot id
+        """
+        changed: set[int] = {
+            bot_id
+            for bot_id in (assignments.keys() | self.__assignments.keys())
+            if assignments.get(bot_id) != self.__assignments.get(bot_id)
+        }
+        self.__assignments = dict(assignments)
+
+        # NOTE: The observer keeps the same tuple until the availability changes
+        if (available_ids := self.__observer.our_available_ids) is not self.__available_ids:
+            changed.update(set(self.__available_ids) - set(available_ids))
+            self.__available_ids = available_ids
+
+        if changed:
+            self.reset(changed)
+
     @staticmethod
     def speed_limiter(cmd: RobotCommand, limiter: float = 0.3) -> RobotCommand:
         """speed_limiter"""
@@ -149,6 +483,157 @@ class Controls:
         cmd.vel_fwd = (cmd.vel_fwd / MU.div_safe(adjustment)) * limiter
         return cmd
 
+    def avoid_all(  # pylint: disable=R0913,R0914
+        self,
+        cmds: Sequence[RobotCommand],
+        targets: NDArray[float64],
+        *,
+        enemy: bool = True,
+        teammate: bool = False,
+        ball_distance: float = 0,
+        penalty_distance: float = 0,
+    ) -> Sequence[RobotCommand]:
+        """avoid_all
+
+        Add the repulsion of the obstacles to the commands of several robots at once.
+        The fields of `avoid_enemy`, `avoid_ball` and `avoid_penalty_area`, evaluated for every pair
+        of robot and obstacle as array operations; our other robots repel like the enemies.
+
+        Args:
+            cmds (Sequence[RobotCommand]): Commands of our robots (modified in place)
+            targets (NDArray[float64]): (n, 2) target points (x, y) of the robots (further columns are ignored)
+            enemy (bool, optional): Avoid the enemies (default: True)
+            teammate (bool, optional): Avoid our other robots (default: False)
+            ball_distance (float, optional): Avoid the ball within this distance; 0 to disable (default: 0)
+            penalty_distance (float, optional): Distance to keep from the penalty areas; 0 to disable (default: 0)
+
+        Returns:
+            Sequence[RobotCommand]: cmds
+        """
+        ids: NDArray[int64] = array([cmd.robot_id for cmd in cmds], dtype=int64)
+        states = self.__observer.our_states
+        bots: NDArray[float64] = states.pose[ids, :2]
+        target_points: NDArray[float64] = targets[:, :2]
+        to_target: NDArray[float64] = target_points - bots
+        radian_target: NDArray[float64] = arctan2(to_target[:, 1], to_target[:, 0])
+        distance_target: NDArray[float64] = hypot(to_target[:, 0], to_target[:, 1])
+        field: NDArray[float64] = zeros((ids.size, 2), dtype=float64)
+
+        obstacles: NDArray[float64]
+        to_obstacle: NDArray[float64]
+        if enemy:
+            obstacles = self.__observer.enemy_states.pose[list(self.__observer.enemy_available_ids), :2]
+            # NOTE: Only the obstacles closer to the target than the robot
+            to_obstacle = obstacles[None, :, :] - target_points[:, None, :]
+            field += self.__repulsion(
+                bots,
+                radian_target,
+                obstacles,
+                self.__standard_distance_enemy,
+                hypot(to_obstacle[..., 0], to_obstacle[..., 1]) < distance_target[:, None],
+            )
+
+        if teammate:
+            mate_ids: list[int] = list(self.__observer.our_available_ids)
+            obstacles = states.pose[mate_ids, :2]
+            to_obstacle = obstacles[None, :, :] - target_points[:, None, :]
+            field += self.__repulsion(
+                bots,
+                radian_target,
+                obstacles,
+                self.__standard_distance_enemy,
+                (hypot(to_obstacle[..., 0], to_obstacle[..., 1]) < distance_target[:, None])
+                & (ids[:, None] != array(mate_ids, dtype=int64)[None, :]),
+            )
+
+        if ball_distance > 0:
+            obstacles = array([[self.__observer.ball.x, self.__observer.ball.y]], dtype=float64)
+            to_obstacle = obstacles - bots
+            field += (
+                self.__repulsion(
+                    bots,
+                    radian_target,
+                    obstacles,
+                    ball_distance**2,
+                    (hypot(to_obstacle[:, 0], to_obstacle[:, 1]) < ball_distance)[:, None],
+                )
+                * (distance_target / 1000)[:, None]
+            )
+
+        if penalty_distance > 0:
+            field += self.__penalty_field(bots, penalty_distance**2)
+
+        bot_theta: NDArray[float64] = states.theta[ids]
+        cos_theta: NDArray[float64] = cos_array(bot_theta)
+        sin_theta: NDArray[float64] = sin_array(bot_theta)
+        vel_fwd: NDArray[float64] = field[:, 0] * cos_theta + field[:, 1] * sin_theta
+        vel_sway: NDArray[float64] = field[:, 1] * cos_theta - field[:, 0] * sin_theta
+        for cmd, fwd, sway in zip(cmds, vel_fwd.tolist(), vel_sway.tolist()):
+            cmd.vel_fwd += fwd
+            cmd.vel_sway += sway
+        return cmds
+
+    @staticmethod
+    def __repulsion(
+        bots: NDArray[float64],
+        radian_target: NDArray[float64],
+        obstacles: NDArray[float64],
+        gain: float,
+        mask: NDArray[bool_],
+    ) -> NDArray[float64]:
+        """repulsion
+
+        Args:
+            bots (NDArray[float64]): (n, 2) positions of the robots
+            radian_target (NDArray[float64]): (n,) directions from the robots to their targets
+            obstacles (NDArray[float64]): (m, 2) positions of the obstacles
+            gain (float): Repulsion at the unit distance
+            mask (NDArray[bool_]): (n, m) pairs to evaluate
+
+        Returns:
+            NDArray[float64]: (n, 2) sum of `gain / distance**2` for each robot, each pointing to the obstacle
+                turned by 90 degrees away from the side of the target
+        """
+        to_obstacle: NDArray[float64] = obstacles[None, :, :] - bots[:, None, :]
+        radian_obstacle: NDArray[float64] = arctan2(to_obstacle[..., 1], to_obstacle[..., 0])
+        distance_sq: NDArray[float64] = to_obstacle[..., 0] ** 2 + to_obstacle[..., 1] ** 2
+        magnitude: NDArray[float64] = where(mask, gain / where(distance_sq > 0, distance_sq, 1e-20), 0)
+        angle: NDArray[float64] = radian_obstacle - MU.HALF_PI * sign(
+            MU.radian_normalize_array(radian_obstacle - radian_target[:, None])
+        )
+        return stack(((magnitude * cos_array(angle)).sum(axis=1), (magnitude * sin_array(angle)).sum(axis=1)), axis=1)
+
+    def __penalty_field(self, bots: NDArray[float64], gain: float) -> NDArray[float64]:
+        """penalty_field
+
+        Args:
+            bots (NDArray[float64]): (n, 2) positions of the robots
+            gain (float): Square of the distance to keep
+
+        Returns:
+            NDArray[float64]: (n, 2) repulsion of both penalty areas (as `avoid_penalty_area`)
+        """
+        geometry = self.__observer.geometry
+        field: NDArray[float64] = zeros(bots.shape, dtype=float64)
+        for goal, other, direction in (
+            (geometry.goal, geometry.their_goal, 1),
+            (geometry.their_goal, geometry.goal, -1),
+        ):
+            to_bot: NDArray[float64] = bots - array([goal.x, goal.y], dtype=float64)
+            theta: NDArray[float64] = MU.radian_normalize_array(
+                arctan2(to_bot[:, 1], to_bot[:, 0]) - MU.radian(other, goal)
+            )
+            robot_dis: NDArray[float64] = hypot(to_bot[:, 0], to_bot[:, 1])
+            distance_robot_penalty: NDArray[float64] = where(
+                absolute(theta) < (MU.PI / 4),
+                robot_dis - geometry.goal_width / cos_array(theta),
+                robot_dis - absolute(geometry.goal_width / sin_array(theta)),
+            )
+            adjustment: NDArray[float64] = direction * self.__attack_direction * gain / distance_robot_penalty**2
+            field[:, 0] += adjustment * cos_array(theta)
+            field[:, 1] += adjustment * sin_array(theta)
+        return field
+
     def avoid_enemy(self, cmd: RobotCommand, bot: Robot, target_point: Point) -> RobotCommand:
         """avoid_enemy"""
         radian_target_robot = MU.radian(target_point, bot)
@@ -250,6 +735,11 @@ class Controls:
 
     def ball_around(self, target: Point, bot: Robot) -> RobotCommand:
         """ball_around"""
+        if self.__mpc is not None:
+            contact: float = (self.__observer.geometry.max_robot_radius or 90) + 30
+            speed: float = min(max(bot.distance_ball_robot / 500, 0.2), 2)
+            return self.__mpc_command(bot, target, contact, MU.radian(target, bot), speed, 250)
+
         radian_target_robot: float = MU.radian_reduce(MU.radian(target, bot), bot.theta)
         adjustment: float = bot.distance_ball_robot / 2000
 
@@ -338,6 +828,9 @@ class Controls:
     def to_front_ball(self, target_point: Point, bot: Robot, leave_distance: float = 130) -> RobotCommand:
         """to_front_ball"""
         radian_point_ball = MU.radian(target_point, self.__observer.ball)
+        if self.__mpc is not None:
+            return self.__mpc_command(bot, target_point, leave_distance, radian_point_ball, 0.7, leave_distance * 1.2)
+
         target_pose = Pose(
             self.__observer.ball.x - leave_distance * cos(radian_point_ball),
             self.__observer.ball.y - leave_distance * sin(radian_point_ball),
@@ -348,6 +841,36 @@ class Controls:
         cmd = self.avoid_enemy(cmd, bot, target_pose)
         return cmd
 
+    def __mpc_command(  # pylint: disable=R0913
+        self, bot: Robot, target: Point, distance: float, theta: float, max_speed: float, ball_clearance: float
+    ) -> RobotCommand:
+        """mpc_command
+
+        Args:
+            bot (Robot): Robot instance
+            target (Point): Where the ball is to be pushed
+            distance (float): Distance behind the ball to reach (mm)
+            theta (float): Orientation to take
+            max_speed (float): speed limit
+            ball_clearance (float): Distance to keep from the ball, except from behind (mm)
+
+        Returns:
+            RobotCommand: RobotCommand instance
+        """
+        ball = self.__observer.ball
+        radian_target_ball: float = MU.radian(target, ball)
+        goal = Pose(ball.x - distance * cos(radian_target_ball), ball.y - distance * sin(radian_target_ball), theta)
+        vel_x, vel_y = cast(SamplingMPC, self.__mpc).velocity(
+            bot, goal, target, max_speed=max_speed, ball_clearance=ball_clearance
+        )
+
+        cmd: RobotCommand = RobotCommand(bot.robot_id, use_imu=bot.is_imu_enabled)
+        cmd.vel_fwd = vel_x * cos(bot.theta) + vel_y * sin(bot.theta)
+        cmd.vel_sway = vel_y * cos(bot.theta) - vel_x * sin(bot.theta)
+        cmd.vel_angular = self.pid_radian(theta, bot)
+        cmd.target_pose = goal
+        return cmd
+
     @staticmethod
     def avoid_point(cmd: RobotCommand, bot: Robot, target_point: Point, basic_distance: float) -> RobotCommand:
         """avoid_point"""
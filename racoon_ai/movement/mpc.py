@@ -0,0 +1,197 @@
+#!/usr/bin/env python3.10
+
+"""mpc.py
+
+    This module contains
+        - SamplingMPC
+"""
+
+from logging import getLogger
+from typing import Optional
+
+from numpy import argmin, array, concatenate, float64, hypot, int64, linspace, maximum, minimum, newaxis, zeros
+from numpy.random import Generator, default_rng
+from numpy.typing import NDArray
+
+from racoon_ai.models.coordinate import Point
+from racoon_ai.models.robot import Robot
+from racoon_ai.observer import Observer
+
+
+class SamplingMPC:  # pylint: disable=R0902
+    """SamplingMPC
+
+    Sampling-based model predictive control of the approach to the ball.
+
+    Each call samples candidate sequences of velocity commands around the best sequence of the previous call
+    (shifted by a step), rolls them all out at once with a kinematic model of the robot (velocity following
+    the command under an acceleration limit), scores them, and returns the first command of the best one.
+
+    The score adds up:
+        - the distance to the goal along the horizon (the end counts the most)
+        - the intrusion into the clearance of the ball, except from behind (the side away from the target),
+          so that the ball is only touched in the direction it is to be pushed
+        - the intrusion into the clearance of the other robots
+        - the changes of the command (smoothness)
+
+    Units are m, m/s and seconds inside; the arguments are in mm as elsewhere.
+
+    Args:
+        observer (Observer): Observer instance
+        samples (int, optional): Candidate sequences per call (default: 256)
+        horizon (int, optional): Steps of a sequence (default: 10)
+        step (float, optional): Seconds per step (default: 0.05)
+        max_accel (float, optional): Acceleration limit of the model (m/s^2) (default: 3)
+        noise (float, optional): Standard deviation of the sampled commands (m/s) (default: 0.4)
+        seed (int, optional): Seed of the sampling (default: None)
+
+    Attributes:
+        last_cost (float): Score of the sequence chosen by the last call
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        observer: Observer,
+        *,
+        samples: int = 256,
+        horizon: int = 10,
+        step: float = 0.05,
+        max_accel: float = 3,
+        noise: float = 0.4,
+        seed: Optional[int] = None,
+    ) -> None:
+
+        self.__logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        self.__observer: Observer = observer
+        self.__samples: int = samples
+        self.__horizon: int = horizon
+        self.__step: float = step
+        self.__max_delta_v: float = max_accel * step
+        self.__noise: float = noise
+        self.__rng: Generator = default_rng(seed)
+
+        # NOTE: Weights of the score
+        self.__goal_weights: NDArray[float64] = linspace(0.2, 1, horizon, dtype=float64)
+        self.__goal_weights[-1] *= 3
+        self.__ball_weight: float = 400
+        self.__obstacle_weight: float = 400
+        self.__smooth_weight: float = 0.05
+        self.__obstacle_radius: float = 0.2
+
+        # NOTE: Frame and best sequence of the last call for each robot id (warm start, if recent)
+        self.__sequences: dict[int, tuple[int, NDArray[float64]]] = {}
+        self.__max_age: int = 3
+        self.last_cost: float = 0
+
+    def velocity(  # pylint: disable=R0913,R0914
+        self,
+        bot: Robot,
+        goal: Point,
+        target: Point,
+        *,
+        max_speed: float,
+        ball_clearance: float,
+    ) -> tuple[float, float]:
+        """velocity
+
+        Args:
+            bot (Robot): Robot instance
+            goal (Point): Point to reach (mm)
+            target (Point): Where the ball is to be pushed (mm), which sets the side the ball may be touched from
+            max_speed (float): Speed limit (m/s)
+            ball_clearance (float): Distance to keep from the ball, except from behind (mm)
+
+        Returns:
+            tuple[float, float]: Velocity (m/s) on x and y of the field
+        """
+        bot_id: int = int(bot.robot_id)
+        step: float = self.__step
+        n_samples, horizon = self.__samples, self.__horizon
+
+        position: NDArray[float64] = array([bot.x, bot.y], dtype=float64) / 1000
+        sec_per_frame: float = self.__observer.sec_per_frame or step
+        diff = bot.diff
+        velocity: NDArray[float64] = array([diff.x, diff.y], dtype=float64) / 1000 / sec_per_frame
+        goal_xy: NDArray[float64] = array([goal.x, goal.y], dtype=float64) / 1000
+        ball = self.__observer.ball
+        ball_xy: NDArray[float64] = array([ball.x, ball.y], dtype=float64) / 1000
+        push: NDArray[float64] = array([target.x - ball.x, target.y - ball.y], dtype=float64)
+        push /= max(float(hypot(*push)), 1e-9)
+
+        # NOTE: Candidates around the warm start; plus a stop, and a straight run to the goal (slowing down near it)
+        frame: int = self.__observer.frame
+        mean: NDArray[float64] = zeros((horizon, 2), dtype=float64)
+        if (stored := self.__sequences.get(bot_id)) is not None and (frame - stored[0] <= self.__max_age):
+            mean = stored[1]
+        commands: NDArray[float64] = mean + self.__noise * self.__rng.standard_normal((n_samples, horizon, 2))
+        commands[0] = mean
+        commands[1] = 0
+        commands[2] = (goal_xy - position) / (step * horizon / 2)
+        speed: NDArray[float64] = hypot(commands[..., 0], commands[..., 1])
+        commands *= minimum(1, max_speed / maximum(speed, 1e-9))[..., newaxis]
+
+        # NOTE: Rollouts; the velocity follows the command within the acceleration limit
+        positions: NDArray[float64] = zeros((n_samples, horizon, 2), dtype=float64)
+        current: NDArray[float64] = position[newaxis, :].repeat(n_samples, axis=0)
+        moving: NDArray[float64] = velocity[newaxis, :].repeat(n_samples, axis=0)
+        for k in range(horizon):
+            delta: NDArray[float64] = commands[:, k] - moving
+            norm: NDArray[float64] = hypot(delta[:, 0], delta[:, 1])
+            moving = moving + delta * minimum(1, self.__max_delta_v / maximum(norm, 1e-9))[:, newaxis]
+            current = current + moving * step
+            positions[:, k] = current
+
+        cost: NDArray[float64] = hypot(*(positions - goal_xy).transpose(2, 0, 1)) @ self.__goal_weights
+
+        from_ball: NDArray[float64] = positions - ball_xy
+        distance: NDArray[float64] = hypot(from_ball[..., 0], from_ball[..., 1])
+        # NOTE: 0 behind the ball, 1 on the side of the target
+        front: NDArray[float64] = (1 + (from_ball @ push) / maximum(distance, 1e-9)) / 2
+        cost += self.__ball_weight * (maximum(ball_clearance / 1000 - distance, 0) ** 2 * front).sum(axis=1)
+
+        # NOTE: Only the robots within reach of the horizon
+        obstacles: NDArray[float64] = self.__obstacles(bot_id)
+        reach: float = (max(max_speed, float(hypot(*velocity))) * step * horizon) + self.__obstacle_radius
+        obstacles = obstacles[hypot(*(obstacles - position).T) < reach]
+        if obstacles.size:
+            gaps: NDArray[float64] = hypot(*(positions[:, :, newaxis, :] - obstacles).transpose(3, 0, 1, 2))
+            cost += self.__obstacle_weight * (maximum(self.__obstacle_radius - gaps, 0) ** 2).sum(axis=(1, 2))
+
+        changes: NDArray[float64] = commands[:, 1:] - commands[:, :-1]
+        cost += self.__smooth_weight * (changes**2).sum(axis=(1, 2))
+
+        best: int = int(argmin(cost))
+        self.last_cost = float(cost[best])
+        self.__sequences[bot_id] = (frame, concatenate([commands[best, 1:], commands[best, -1:]]))
+        return float(commands[best, 0, 0]), float(commands[best, 0, 1])
+
+    def reset(self, bot_id: int) -> None:
+        """reset
+
+        Drop the warm start of the robot.
+
+        Args:
+            bot_id (int): id of our robot
+        """
+        self.__sequences.pop(bot_id, None)
+
+    def __obstacles(self, bot_id: int) -> NDArray[float64]:
+        """obstacles
+
+        Args:
+            bot_id (int): Robot to exclude
+
+        Returns:
+            NDArray[float64]: (m, 2) positions of the other robots (m)
+        """
+        ours: NDArray[int64] = array([i for i in self.__observer.our_available_ids if i != bot_id], dtype=int64)
+        enemies: NDArray[int64] = array(self.__observer.enemy_available_ids, dtype=int64)
+        positions: NDArray[float64] = concatenate(
+            [
+                self.__observer.our_states.pose[ours, :2],
+                self.__observer.enemy_states.pose[enemies, :2],
+            ]
+        )
+        return positions / 1000
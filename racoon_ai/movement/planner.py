@@ -0,0 +1,487 @@
+#!/usr/bin/env python3.10
+
+"""planner.py
+
+    This module contains
+        - PathPlanner
+"""
+
+from heapq import heappop, heappush
+from logging import getLogger
+from math import ceil, sqrt
+from time import perf_counter_ns
+from typing import Optional
+
+from numpy import arange, bool_, float64, int64, ogrid, uint8, zeros
+from numpy.typing import NDArray
+
+from racoon_ai.models.coordinate import Pose
+from racoon_ai.models.robot import Robot
+from racoon_ai.observer import Observer
+
+SQRT2: float = sqrt(2)
+INF: float = float("inf")
+
+
+class _Path:  # pylint: disable=R0903
+    """_Path
+
+    Attributes:
+        goal (tuple[float, float]): Target the path was planned to (mm)
+        waypoints (list[tuple[float, float]]): Remaining waypoints (mm), ending with the goal; empty if none was found
+        retry (int): Frame from which a path is searched again, if none was found
+    """
+
+    def __init__(self, goal: tuple[float, float], waypoints: list[tuple[float, float]], retry: int = 0) -> None:
+        self.goal: tuple[float, float] = goal
+        self.waypoints: list[tuple[float, float]] = waypoints
+        self.retry: int = retry
+
+
+class PathPlanner:  # pylint: disable=R0902
+    """PathPlanner
+
+    A* on an occupancy grid of the field, built once per frame from the robots of the Observer
+    (inflated by the clearance), the field bounds and the penalty areas of the Geometry.
+
+    A path is kept per robot and reused while it is still free and leads to the same target;
+    otherwise the robot is replanned, as long as the planning time of the cycle is within the budget.
+    The robots left over are replanned in the next cycles (they head straight to the target meanwhile).
+
+    Usage:
+        controls.pid(planner.waypoint(target, bot), bot)
+
+    Args:
+        observer (Observer): Observer instance
+        cell_size (float, optional): Size of a cell of the grid (mm) (default: 100)
+        clearance (float, optional): Distance to keep from the center of the other robots (mm) (default: 250)
+        budget_ms (float, optional): Planning time per cycle (default: 2)
+
+    Attributes:
+        planned (int): Searches run so far
+        reused (int): Cycles a robot followed its former path
+        deferred (int): Replans put off because the budget of the cycle was spent
+    """
+
+    def __init__(
+        self,
+        observer: Observer,
+        *,
+        cell_size: float = 100,
+        clearance: float = 250,
+        budget_ms: float = 2,
+    ) -> None:
+
+        self.__logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        self.__observer: Observer = observer
+        self.__cell_size: float = cell_size
+        self.__budget: int = int(budget_ms * 1e6)
+        # NOTE: Frames before searching again for a robot that got no path (unreachable, or out of time)
+        self.__retry_frames: int = 30
+
+        radius: int = ceil(clearance / cell_size)
+        grid_x, grid_y = ogrid[-radius : (radius + 1), -radius : (radius + 1)]
+        self.__radius: int = radius
+        self.__disk: NDArray[uint8] = ((grid_x**2 + grid_y**2) <= radius**2).astype(uint8)
+
+        # NOTE: Grids are padded with a blocked cell on each side, so the search needs no bounds check
+        self.__field_dims: tuple[int, int] = (0, 0)
+        self.__shape: tuple[int, int] = (0, 0)
+        self.__origin: tuple[float, float] = (0, 0)
+        self.__bounds: NDArray[bool_] = zeros((0, 0), dtype=bool_)
+        self.__penalty: NDArray[bool_] = zeros((0, 0), dtype=bool_)
+        self.__robots: NDArray[uint8] = zeros((0, 0), dtype=uint8)
+        self.__centers: dict[int, tuple[int, int]] = {}
+        self.__samples: NDArray[int64] = zeros(0, dtype=int64)
+        self.__neighbors: list[tuple[int, float, int, int]] = []
+
+        self.__frame: int = -1
+        self.__spent: int = 0
+        self.__paths: dict[int, _Path] = {}
+
+        self.__planned: int = 0
+        self.__reused: int = 0
+        self.__deferred: int = 0
+
+    @property
+    def planned(self) -> int:
+        """planned"""
+        return self.__planned
+
+    @property
+    def reused(self) -> int:
+        """reused"""
+        return self.__reused
+
+    @property
+    def deferred(self) -> int:
+        """deferred"""
+        return self.__deferred
+
+    def waypoint(self, target: Pose, bot: Robot, *, avoid_penalty: bool = True) -> Pose:
+        """waypoint
+
+        Args:
+            target (Pose): Target pose
+            bot (Robot): Robot instance
+            avoid_penalty (bool, optional): Keep out of the penalty areas (default: True)
+
+        Returns:
+            Pose: Next waypoint toward the target (the target itself if nothing is in the way)
+        """
+        if not self.__update_grid():
+            return target
+
+        bot_id: int = int(bot.robot_id)
+        blocked: NDArray[bool_] = self.__blocked(bot_id, avoid_penalty)
+        start: tuple[float, float] = (bot.x, bot.y)
+        goal: tuple[float, float] = (target.x, target.y)
+
+        if self.__is_free(blocked, start, goal):
+            self.__paths.pop(bot_id, None)
+            return target
+
+        path: Optional[_Path] = self.__path(bot_id, blocked, start, goal)
+        if (path is None) or not path.waypoints:
+            return target
+        return Pose(*path.waypoints[0], target.theta)
+
+    def __path(
+        self, bot_id: int, blocked: NDArray[bool_], start: tuple[float, float], goal: tuple[float, float]
+    ) -> Optional[_Path]:
+        """path
+
+        The path kept for the robot if it still leads to the goal, else a new one.
+
+        Returns:
+            Optional[_Path]: Path of the robot (None if none was found)
+        """
+        path: Optional[_Path] = self.__paths.get(bot_id)
+        if (path is not None) and self.__is_same_goal(path, goal):
+            if not path.waypoints and (self.__frame < path.retry):
+                return path
+            if path.waypoints and self.__follow(blocked, start, goal, path):
+                self.__reused += 1
+                return path
+
+        if (path := self.__plan(blocked, start, goal)) is None:
+            self.__paths.pop(bot_id, None)
+            return None
+
+        self.__paths[bot_id] = path
+        return path
+
+    def __update_grid(self) -> bool:
+        """update_grid
+
+        Rebuild the occupancy of the robots once per frame (and the static grids on a new geometry).
+
+        Returns:
+            bool: False if the geometry is unknown yet
+        """
+        if self.__frame == self.__observer.frame:
+            return True
+
+        geometry = self.__observer.geometry
+        if not (geometry.field_length and geometry.field_width):
+            return False
+
+        if self.__field_dims != (geometry.field_length, geometry.field_width):
+            self.__build_static()
+
+        self.__frame = self.__observer.frame
+        self.__spent = 0
+        self.__robots[:] = 0
+        self.__centers = {}
+        for bot_id in self.__observer.our_available_ids:
+            bot: Robot = self.__observer.our_robots[bot_id]
+            self.__centers[bot_id] = center = self.__to_cell(bot.x, bot.y)
+            self.__stamp(center, 1)
+        for enemy in self.__observer.enemy_robots_available:
+            self.__stamp(self.__to_cell(enemy.x, enemy.y), 1)
+        return True
+
+    def __build_static(self) -> None:
+        """build_static"""
+        geometry = self.__observer.geometry
+        cell: float = self.__cell_size
+        half_length: float = geometry.field_length / 2 + geometry.boundary_width
+        half_width: float = geometry.field_width / 2 + geometry.boundary_width
+        n_x: int = ceil(2 * half_length / cell) + 2
+        n_y: int = ceil(2 * half_width / cell) + 2
+
+        self.__field_dims = (geometry.field_length, geometry.field_width)
+        self.__shape = (n_x, n_y)
+        self.__origin = (-half_length - cell, -half_width - cell)
+        self.__robots = zeros(self.__shape, dtype=uint8)
+        self.__samples = arange(1, 2 * max(n_x, n_y) + 1, dtype=int64)
+        # NOTE: (offset, cost, offsets of the cells beside a diagonal move, which must be free as well)
+        self.__neighbors = [
+            (d_x * n_y + d_y, SQRT2 if (d_x and d_y) else 1.0, d_x * n_y, d_y)
+            for d_x in (-1, 0, 1)
+            for d_y in (-1, 0, 1)
+            if d_x or d_y
+        ]
+
+        self.__bounds = zeros(self.__shape, dtype=bool_)
+        self.__bounds[0, :] = self.__bounds[-1, :] = True
+        self.__bounds[:, 0] = self.__bounds[:, -1] = True
+
+        # NOTE: Penalty areas (the goal width stands in if the MW does not send their size)
+        depth: float = geometry.penalty_area_depth or geometry.goal_width / 2
+        width: float = geometry.penalty_area_width or geometry.goal_width
+        centers_x: NDArray[float64] = arange(n_x) * cell + self.__origin[0] + cell / 2
+        centers_y: NDArray[float64] = arange(n_y) * cell + self.__origin[1] + cell / 2
+        in_x = abs(centers_x) >= (geometry.field_length / 2 - depth)
+        in_y = abs(centers_y) <= (width / 2)
+        self.__penalty = self.__bounds | (in_x[:, None] & in_y[None, :])
+        self.__logger.info("Occupancy grid: %d x %d cells of %.0f mm", n_x, n_y, cell)
+
+    def __blocked(self, bot_id: int, avoid_penalty: bool) -> NDArray[bool_]:
+        """blocked
+
+        Args:
+            bot_id (int): Robot to plan for (its own footprint is not an obstacle)
+            avoid_penalty (bool): Block the penalty areas
+
+        Returns:
+            NDArray[bool_]: Blocked cells
+        """
+        robots: NDArray[uint8] = self.__robots
+        if (center := self.__centers.get(bot_id)) is not None:
+            robots = robots.copy()
+            self.__stamp(center, -1, robots)
+        return (robots > 0) | (self.__penalty if avoid_penalty else self.__bounds)
+
+    def __stamp(self, center: tuple[int, int], value: int, grid: Optional[NDArray[uint8]] = None) -> None:
+        """stamp
+
+        Args:
+            center (tuple[int, int]): Cell of the robot
+            value (int): 1 to add the footprint of the robot, -1 to remove it
+            grid (NDArray[uint8], optional): Grid to stamp on (default: occupancy of the robots)
+        """
+        if grid is None:
+            grid = self.__robots
+        radius: int = self.__radius
+        n_x, n_y = self.__shape
+        x_0, x_1 = max(center[0] - radius, 0), min(center[0] + radius + 1, n_x)
+        y_0, y_1 = max(center[1] - radius, 0), min(center[1] + radius + 1, n_y)
+        if (x_0 >= x_1) or (y_0 >= y_1):
+            return
+        disk: NDArray[uint8] = self.__disk[
+            (x_0 - center[0] + radius) : (x_1 - center[0] + radius),
+            (y_0 - center[1] + radius) : (y_1 - center[1] + radius),
+        ]
+        if value > 0:
+            grid[x_0:x_1, y_0:y_1] += disk
+        else:
+            grid[x_0:x_1, y_0:y_1] -= disk
+
+    def __to_cell(self, x: float, y: float) -> tuple[int, int]:
+        """to_cell
+
+        Args:
+            x (float): x (mm)
+            y (float): y (mm)
+
+        Returns:
+            tuple[int, int]: Cell (clamped inside the padding)
+        """
+        n_x, n_y = self.__shape
+        c_x: int = int((x - self.__origin[0]) // self.__cell_size)
+        c_y: int = int((y - self.__origin[1]) // self.__cell_size)
+        return (min(max(c_x, 1), n_x - 2), min(max(c_y, 1), n_y - 2))
+
+    def __to_point(self, c_x: int, c_y: int) -> tuple[float, float]:
+        """to_point
+
+        Args:
+            c_x (int): Cell index on x
+            c_y (int): Cell index on y
+
+        Returns:
+            tuple[float, float]: Center of the cell (mm)
+        """
+        return (
+            self.__origin[0] + (c_x + 0.5) * self.__cell_size,
+            self.__origin[1] + (c_y + 0.5) * self.__cell_size,
+        )
+
+    def __is_free(self, blocked: NDArray[bool_], start: tuple[float, float], end: tuple[float, float]) -> bool:
+        """is_free
+
+        Args:
+            blocked (NDArray[bool_]): Blocked cells
+            start (tuple[float, float]): Start of the segment (mm); its own cell is not checked
+            end (tuple[float, float]): End of the segment (mm)
+
+        Returns:
+            bool: True if the segment crosses no blocked cell
+        """
+        c_start: tuple[int, int] = self.__to_cell(*start)
+        c_end: tuple[int, int] = self.__to_cell(*end)
+        d_x: int = c_end[0] - c_start[0]
+        d_y: int = c_end[1] - c_start[1]
+        # NOTE: Two samples per cell so that diagonal crossings are not skipped (rounded in integers)
+        n_samples: int = 2 * max(abs(d_x), abs(d_y))
+        if not n_samples:
+            return True
+        samples: NDArray[int64] = self.__samples[:n_samples]
+        samples_x: NDArray[int64] = (c_start[0] * n_samples + d_x * samples + n_samples // 2) // n_samples
+        samples_y: NDArray[int64] = (c_start[1] * n_samples + d_y * samples + n_samples // 2) // n_samples
+        return not blocked[samples_x, samples_y].any()
+
+    def __is_same_goal(self, path: _Path, goal: tuple[float, float]) -> bool:
+        """is_same_goal
+
+        Returns:
+            bool: True if the goal is within two cells of the one the path was planned to
+        """
+        tolerance: float = 2 * self.__cell_size
+        return (abs(path.goal[0] - goal[0]) <= tolerance) and (abs(path.goal[1] - goal[1]) <= tolerance)
+
+    def __follow(
+        self, blocked: NDArray[bool_], start: tuple[float, float], goal: tuple[float, float], path: _Path
+    ) -> bool:
+        """follow
+
+        Advance the former path and check that it is still valid.
+
+        Returns:
+            bool: True if the path is still free
+        """
+        waypoints: list[tuple[float, float]] = path.waypoints
+        waypoints[-1] = goal
+        # NOTE: Skip the waypoints which are already in sight
+        while (len(waypoints) > 1) and self.__is_free(blocked, start, waypoints[1]):
+            waypoints.pop(0)
+
+        if not self.__is_free(blocked, start, waypoints[0]):
+            return False
+        return all(self.__is_free(blocked, waypoints[i], waypoints[i + 1]) for i in range(len(waypoints) - 1))
+
+    def __plan(self, blocked: NDArray[bool_], start: tuple[float, float], goal: tuple[float, float]) -> Optional[_Path]:
+        """plan
+
+        Returns:
+            Optional[_Path]: New path (without waypoints if there is none); None if the budget of the cycle is spent
+        """
+        if self.__spent >= self.__budget:
+            self.__deferred += 1
+            return None
+
+        started: int = perf_counter_ns()
+        c_start: tuple[int, int] = self.__to_cell(*start)
+        c_goal: tuple[int, int] = self.__to_cell(*goal)
+        path: _Path = _Path(goal, [], self.__frame + self.__retry_frames)
+        # NOTE: A search once started may take up to a whole budget, so a cycle takes at most two budgets
+        if not blocked[c_goal] and (cells := self.__search(blocked, c_start, c_goal, started + self.__budget)):
+            waypoints: list[tuple[float, float]] = self.__smooth(blocked, start, self.__corners(cells))
+            waypoints[-1] = goal
+            path = _Path(goal, waypoints)
+        self.__spent += perf_counter_ns() - started
+        self.__planned += 1
+
+        if not path.waypoints:
+            self.__logger.debug("No path from %s to %s", start, goal)
+        return path
+
+    def __search(  # pylint: disable=R0914
+        self, blocked: NDArray[bool_], start: tuple[int, int], goal: tuple[int, int], deadline: int
+    ) -> Optional[list[tuple[int, int]]]:
+        """search
+
+        A* (8-connected without cutting corners, octile heuristic) on the flattened grid.
+
+        Returns:
+            Optional[list[tuple[int, int]]]: Cells from the next one after the start to the goal;
+                None if unreachable, or out of time
+        """
+        n_y: int = self.__shape[1]
+        flat_blocked: list[bool] = blocked.ravel().tolist()
+        neighbors: list[tuple[int, float, int, int]] = self.__neighbors
+        source: int = start[0] * n_y + start[1]
+        target: int = goal[0] * n_y + goal[1]
+        goal_x, goal_y = goal
+        # NOTE: Slightly inflated heuristic, so that ties are broken toward the goal
+        diagonal: float = (SQRT2 - 2) * 1.001
+
+        costs: dict[int, float] = {source: 0}
+        parents: dict[int, int] = {}
+        queue: list[tuple[float, float, int]] = [(0, 0, source)]
+        expanded: int = 0
+        while queue:
+            _, cost, index = heappop(queue)
+            if index == target:
+                path: list[tuple[int, int]] = []
+                while index != source:
+                    path.append(divmod(index, n_y))
+                    index = parents[index]
+                return path[::-1]
+            if cost > costs[index]:
+                continue
+
+            expanded += 1
+            if not (expanded & 0xFF) and (perf_counter_ns() > deadline):
+                self.__deferred += 1
+                return None
+
+            for offset, step, side_x, side_y in neighbors:
+                neighbor: int = index + offset
+                if flat_blocked[neighbor] or flat_blocked[index + side_x] or flat_blocked[index + side_y]:
+                    continue
+                new_cost: float = cost + step
+                if new_cost < costs.get(neighbor, INF):
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = index
+                    d_x, d_y = divmod(neighbor, n_y)
+                    d_x, d_y = abs(d_x - goal_x), abs(d_y - goal_y)
+                    heuristic: float = 1.001 * (d_x + d_y) + diagonal * (d_x if d_x < d_y else d_y)
+                    heappush(queue, (new_cost + heuristic, new_cost, neighbor))
+        return None
+
+    def __corners(self, cells: list[tuple[int, int]]) -> list[tuple[float, float]]:
+        """corners
+
+        Args:
+            cells (list[tuple[int, int]]): Cells found by the search
+
+        Returns:
+            list[tuple[float, float]]: Centers (mm) of the cells where the path turns, and of the last one
+        """
+        points: list[tuple[float, float]] = []
+        for i in range(len(cells) - 1):
+            (x_0, y_0), (x_1, y_1), (x_2, y_2) = cells[i - 1] if i else cells[0], cells[i], cells[i + 1]
+            if (x_1 - x_0, y_1 - y_0) != (x_2 - x_1, y_2 - y_1):
+                points.append(self.__to_point(x_1, y_1))
+        points.append(self.__to_point(*cells[-1]))
+        return points
+
+    def __smooth(
+        self, blocked: NDArray[bool_], start: tuple[float, float], points: list[tuple[float, float]]
+    ) -> list[tuple[float, float]]:
+        """smooth
+
+        Drop the waypoints which can be cut (string pulling).
+
+        Returns:
+            list[tuple[float, float]]: Waypoints
+        """
+        waypoints: list[tuple[float, float]] = []
+        current: tuple[float, float] = start
+        last: int = len(points) - 1
+        index: int = 0
+        while index < last:
+            # NOTE: Go as far along the path as the sight from the current waypoint reaches
+            if self.__is_free(blocked, current, points[index + 1]):
+                index += 1
+                continue
+            current = points[index]
+            waypoints.append(current)
+            if not self.__is_free(blocked, current, points[index + 1]):
+                index += 1
+        waypoints.append(points[last])
+        return waypoints
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3.10
+
+"""trajectory.py
+
+    This module contains
+        - BangBangTrajectory
+"""
+
+from typing import Optional, Union, cast
+
+from numpy import (
+    absolute,
+    arange,
+    bool_,
+    concatenate,
+    cos,
+    cumsum,
+    float64,
+    full,
+    inf,
+    int64,
+    maximum,
+    minimum,
+    pi,
+    sin,
+    sqrt,
+    stack,
+    tile,
+    where,
+    zeros,
+)
+from numpy.typing import NDArray
+
+from racoon_ai.common import MathUtils as MU
+
+Time = Union[float, NDArray[float64]]
+
+
+class _BangBang1D:  # pylint: disable=R0903
+    """_BangBang1D
+
+    Time-optimal (bang-bang) motions of n points along an axis, from their position and velocity
+    to a rest at the target, under an acceleration and a velocity limit.
+    Each motion is made of four phases of constant acceleration: brake (if moving away, or too fast to stop in time),
+    accelerate (or slow down to the limit), cruise, decelerate.
+
+    Args:
+        start (NDArray[float64]): Positions (n)
+        velocity (NDArray[float64]): Velocities (n)
+        target (NDArray[float64]): Targets (n)
+        max_speed (NDArray[float64] | float): Velocity limits (n, or one for all)
+        max_accel (NDArray[float64] | float): Acceleration limits (n, or one for all)
+
+    Attributes:
+        duration (NDArray[float64]): Time to reach the targets (n)
+    """
+
+    def __init__(  # pylint: disable=R0914
+        self,
+        start: NDArray[float64],
+        velocity: NDArray[float64],
+        target: NDArray[float64],
+        max_speed: Time,
+        max_accel: Time,
+    ) -> None:
+
+        # NOTE: A limit of zero would never reach the target; keep it tiny instead
+        accel: NDArray[float64] = maximum(max_accel, 1e-9)
+        v_max: NDArray[float64] = maximum(max_speed, 1e-9)
+
+        # NOTE: Solved with the target on the positive side (bools as 0/1 rather than `where`, which is slower here)
+        sign: NDArray[float64] = 1 - 2.0 * (target < start)
+        distance: NDArray[float64] = (target - start) * sign
+        speed: NDArray[float64] = velocity * sign
+
+        braking: NDArray[float64] = speed * absolute(speed) / (2 * accel)
+        brake: NDArray[bool_] = (speed < 0) | (braking > distance)
+        t_brake: NDArray[float64] = brake * absolute(speed) / accel
+        rest: NDArray[float64] = distance - brake * braking
+        speed = speed * ~brake
+        direction: NDArray[float64] = 1 - 2.0 * (rest < 0)
+        rest = absolute(rest)
+
+        peak: NDArray[float64] = minimum(sqrt(accel * rest + speed * speed / 2), v_max)
+        t_accel: NDArray[float64] = absolute(peak - speed) / accel
+        t_decel: NDArray[float64] = peak / accel
+        d_phases: NDArray[float64] = (absolute(peak * peak - speed * speed) + peak * peak) / (2 * accel)
+        t_cruise: NDArray[float64] = maximum(rest - d_phases, 0) / maximum(peak, 1e-9)
+
+        self.duration: NDArray[float64] = t_brake + t_accel + t_cruise + t_decel
+
+        # NOTE: Kept to prepare the phases at the first `state` (not needed for the duration)
+        self.__start: NDArray[float64] = start
+        self.__velocity: NDArray[float64] = velocity
+        self.__target: NDArray[float64] = target
+        self.__durations: tuple[NDArray[float64], ...] = (t_brake, t_accel, t_cruise, t_decel)
+        self.__accels: tuple[NDArray[float64], ...] = (
+            (sign * accel * (1 - 2.0 * (velocity * sign >= 0)) * brake).astype(float64, copy=False),
+            sign * direction * accel * (1 - 2.0 * (peak < speed)),
+            zeros(distance.size, dtype=float64),
+            -sign * direction * accel,
+        )
+        self.__starts: Optional[NDArray[float64]] = None
+        self.__phase_accels: NDArray[float64] = zeros((0, 4), dtype=float64)
+        self.__positions: NDArray[float64] = zeros((0, 4), dtype=float64)
+        self.__velocities: NDArray[float64] = zeros((0, 4), dtype=float64)
+
+    def state(self, time: Time) -> tuple[NDArray[float64], NDArray[float64]]:
+        """state
+
+        Args:
+            time (NDArray[float64] | float): Time from the start (n, or one for all)
+
+        Returns:
+            tuple[NDArray[float64], NDArray[float64]]: Positions and velocities (n)
+        """
+        if self.__starts is None:
+            self.__prepare()
+        starts: NDArray[float64] = cast(NDArray[float64], self.__starts)
+        n_points: int = self.duration.size
+        clipped: NDArray[float64] = minimum(maximum(full(n_points, time, dtype=float64), 0), self.duration)
+        phase: NDArray[int64] = (clipped[:, None] >= starts).sum(axis=1) - 1
+        rows: NDArray[int64] = arange(n_points)
+        elapsed: NDArray[float64] = clipped - starts[rows, phase]
+        accel: NDArray[float64] = self.__phase_accels[rows, phase]
+        velocity: NDArray[float64] = self.__velocities[rows, phase] + accel * elapsed
+        position: NDArray[float64] = self.__positions[rows, phase] + (velocity - accel * elapsed / 2) * elapsed
+        arrived: NDArray[bool_] = clipped >= self.duration
+        return where(arrived, self.__target, position), where(arrived, 0, velocity)
+
+    def __prepare(self) -> None:
+        """prepare
+
+        Times, accelerations, positions and velocities at the start of each phase.
+        """
+        n_points: int = self.duration.size
+        durations: NDArray[float64] = stack(self.__durations, axis=1)
+        self.__phase_accels = stack(self.__accels, axis=1)
+        self.__starts = concatenate([zeros((n_points, 1), dtype=float64), cumsum(durations, axis=1)[:, :-1]], axis=1)
+        self.__positions = zeros((n_points, 4), dtype=float64)
+        self.__velocities = zeros((n_points, 4), dtype=float64)
+        self.__positions[:, 0] = self.__start
+        self.__velocities[:, 0] = self.__velocity
+        for k in range(3):
+            t_k: NDArray[float64] = durations[:, k]
+            a_k: NDArray[float64] = self.__phase_accels[:, k]
+            self.__positions[:, k + 1] = self.__positions[:, k] + (self.__velocities[:, k] + a_k * t_k / 2) * t_k
+            self.__velocities[:, k + 1] = self.__velocities[:, k] + a_k * t_k
+
+
+class BangBangTrajectory:  # pylint: disable=R0903
+    """BangBangTrajectory
+
+    Time-optimal trajectories of n robots from their pose and velocity to a rest at their target pose,
+    solved and evaluated at once (closed form, no integration).
+
+    x and y share the limits of the speed and acceleration: the limits are split between the axes
+    (as cos and sin of an angle found by bisection) so that both axes arrive together,
+    which keeps the path close to the straight line. theta is solved on its own (the shorter way round).
+
+    Units are those of the arguments (e.g. m, m/s, m/s^2 and radian).
+
+    Args:
+        start (NDArray[float64]): (n, 3) poses (x, y, theta)
+        velocity (NDArray[float64]): (n, 3) velocities
+        target (NDArray[float64]): (n, 3) target poses
+        max_speed (float): Speed limit
+        max_accel (float): Acceleration limit
+        max_angular_speed (float, optional): Angular speed limit (default: pi)
+        max_angular_accel (float, optional): Angular acceleration limit (default: 4 * pi)
+        iterations (int, optional): Steps of the bisection synchronizing x and y (default: 8)
+
+    Attributes:
+        duration (NDArray[float64]): Time to arrival (n), of the position and of the orientation
+        duration_xy (NDArray[float64]): Time to arrival (n), of the position only
+    """
+
+    def __init__(  # pylint: disable=R0913,R0914
+        self,
+        start: NDArray[float64],
+        velocity: NDArray[float64],
+        target: NDArray[float64],
+        max_speed: float,
+        max_accel: float,
+        *,
+        max_angular_speed: float = pi,
+        max_angular_accel: float = 4 * pi,
+        iterations: int = 8,
+    ) -> None:
+
+        n_bots: int = start.shape[0]
+        start_xy: NDArray[float64] = concatenate([start[:, 0], start[:, 1]])
+        velocity_xy: NDArray[float64] = concatenate([velocity[:, 0], velocity[:, 1]])
+        target_xy: NDArray[float64] = concatenate([target[:, 0], target[:, 1]])
+
+        # NOTE: Bisection on the angle splitting the limits (x is slower as the angle grows, y faster),
+        #       keeping the angle of the earliest arrival seen, as the durations can be steep near the ends
+        low: NDArray[float64] = zeros(n_bots, dtype=float64)
+        high: NDArray[float64] = full(n_bots, pi / 2, dtype=float64)
+        best_angle: NDArray[float64] = full(n_bots, pi / 4, dtype=float64)
+        best_duration: NDArray[float64] = full(n_bots, inf, dtype=float64)
+        for _ in range(iterations):
+            angle: NDArray[float64] = (low + high) / 2
+            ratio: NDArray[float64] = concatenate([cos(angle), sin(angle)])
+            duration: NDArray[float64] = _BangBang1D(
+                start_xy, velocity_xy, target_xy, max_speed * ratio, max_accel * ratio
+            ).duration
+            x_slower: NDArray[bool_] = duration[:n_bots] > duration[n_bots:]
+            high = where(x_slower, angle, high)
+            low = where(x_slower, low, angle)
+            arrival: NDArray[float64] = maximum(duration[:n_bots], duration[n_bots:])
+            better: NDArray[bool_] = arrival < best_duration
+            best_angle = where(better, angle, best_angle)
+            best_duration = minimum(arrival, best_duration)
+
+        # NOTE: x, y and theta solved at once, as the columns of (3, n)
+        turn: NDArray[float64] = MU.radian_normalize_array(target[:, 2] - start[:, 2])
+        angular: NDArray[float64] = full(n_bots, 1, dtype=float64)
+        self.__axes: _BangBang1D = _BangBang1D(
+            concatenate([start_xy, start[:, 2]]),
+            concatenate([velocity_xy, velocity[:, 2]]),
+            concatenate([target_xy, start[:, 2] + turn]),
+            concatenate([max_speed * cos(best_angle), max_speed * sin(best_angle), max_angular_speed * angular]),
+            concatenate([max_accel * cos(best_angle), max_accel * sin(best_angle), max_angular_accel * angular]),
+        )
+
+        durations: NDArray[float64] = self.__axes.duration.reshape(3, n_bots)
+        self.duration_xy: NDArray[float64] = durations[:2].max(axis=0)
+        self.duration: NDArray[float64] = durations.max(axis=0)
+
+    def state(self, time: Time) -> tuple[NDArray[float64], NDArray[float64]]:
+        """state
+
+        Args:
+            time (NDArray[float64] | float): Time from the start (n, or one for all)
+
+        Returns:
+            tuple[NDArray[float64], NDArray[float64]]: (n, 3) poses and (n, 3) velocities
+        """
+        n_bots: int = self.duration.size
+        position, velocity = self.__axes.state(tile(full(n_bots, time, dtype=float64), 3))
+        pose: NDArray[float64] = position.reshape(3, n_bots).T.copy()
+        pose[:, 2] = MU.radian_normalize_array(pose[:, 2])
+        return pose, velocity.reshape(3, n_bots).T
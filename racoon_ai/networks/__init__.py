@@ -3,13 +3,16 @@
 """networks
 
     This module contains the network related classes.
+        - mailbox
         - receiver
         - sender
 """
 
 from . import receiver, sender
+from .mailbox import Mailbox
 
 __all__ = [
+    "Mailbox",
     "receiver",
     "sender",
 ]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3.10
+
+"""mailbox.py
+
+    This module contains
+        - Mailbox
+"""
+
+from threading import Condition
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Mailbox(Generic[T]):
+    """Mailbox
+
+    Thread-safe single-slot mailbox which keeps only the latest item.
+    A `put` on an occupied slot overwrites the older item instead of blocking.
+
+    Attributes:
+        overwritten (int): Number of items overwritten before being taken
+        is_closed (bool): True if the mailbox has been closed
+    """
+
+    def __init__(self) -> None:
+        self.__cond: Condition = Condition()
+        self.__item: Optional[T] = None
+        self.__overwritten: int = 0
+        self.__is_closed: bool = False
+
+    @property
+    def overwritten(self) -> int:
+        """overwritten"""
+        return self.__overwritten
+
+    @property
+    def is_closed(self) -> bool:
+        """is_closed"""
+        return self.__is_closed
+
+    def put(self, item: T) -> Optional[T]:
+        """put
+
+        Args:
+            item (T): The item to store (replaces the pending one if any)
+
+        Returns:
+            Optional[T]: The overwritten item, if any
+        """
+        with self.__cond:
+            displaced: Optional[T] = self.__item
+            if displaced is not None:
+                self.__overwritten += 1
+            self.__item = item
+            self.__cond.notify_all()
+            return displaced
+
+    def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        """get
+
+        Wait for an item and take it out of the slot.
+
+        Args:
+            timeout (float, optional): Seconds to wait (default: None, wait forever)
+
+        Returns:
+            Optional[T]: None if timed out or closed
+        """
+        with self.__cond:
+            if not self.__cond.wait_for(lambda: (self.__item is not None) or self.__is_closed, timeout):
+                return None
+            item: Optional[T] = self.__item
+            self.__item = None
+            return item
+
+    def peek(self) -> Optional[T]:
+        """peek
+
+        Returns:
+            Optional[T]: The pending item without taking it
+        """
+        with self.__cond:
+            return self.__item
+
+    def close(self) -> None:
+        """close
+
+        Wake up all waiters; subsequent `get` calls return immediately.
+        """
+        with self.__cond:
+            self.__is_closed = True
+            self.__cond.notify_all()
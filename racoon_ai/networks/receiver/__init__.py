@@ -2,7 +2,17 @@
 # pylint: disable=C0114
 
 from .mw_receiver import MWReceiver
+from .recorder import PacketRecorder, read_records
+from .replay import PacketReplayer, find_logs
+from .source import PacketSource
+from .supervisor import MWSupervisor
 
 __all__ = [
+    "find_logs",
     "MWReceiver",
+    "MWSupervisor",
+    "PacketRecorder",
+    "PacketReplayer",
+    "PacketSource",
+    "read_records",
 ]
@@ -6,24 +6,52 @@
 """
 
 from logging import getLogger
-from socket import AF_INET, IPPROTO_UDP, SO_REUSEADDR, SOCK_DGRAM, SOL_SOCKET, socket
+from queue import SimpleQueue
+from select import select
+from socket import AF_INET, IPPROTO_UDP, SO_REUSEADDR, SOCK_DGRAM, SOL_SOCKET, MsgFlag, socket
+from threading import Event, Thread
+from time import monotonic
+from typing import Optional
 
-from racoon_ai.models.network import BUFFSIZE, IPNetAddr
+from google.protobuf.message import DecodeError
+
+from racoon_ai.models.network import BUFFSIZE, MAX_BUFFSIZE, IPNetAddr
+from racoon_ai.networks.mailbox import Mailbox
 from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
 
+from .recorder import PacketRecorder
+
+# NOTE: Linux returns the real datagram size with this flag (not available everywhere)
+RECV_FLAGS: int = int(getattr(MsgFlag, "MSG_TRUNC", 0))
+
 
 class MWReceiver(IPNetAddr):  # pylint: disable=R0904
     """VisionReceiver
 
     Args:
-        target_ids (list[int]): Target robot IDs
-        is_real (bool): True if the receiver is for real robot (default: False)
-        is_team_yellow (bool, optional): If true, the team is yellow (default: False)
         host (str, optional): IP or hostname of the server
         port (int, optional): Port number of the vision server
+        use_thread (bool, optional): If true, receive on a background thread (default: False)
+        recorder (PacketRecorder, optional): If given, every valid packet is recorded (closed with the receiver)
+
+    Attributes:
+        buffsize (int): Current size of the receive buffer (grows on demand)
+        dropped (int): Packets drained from the socket without being parsed (thread mode only)
+        overwritten (int): Parsed packets replaced before `recv` took them (thread mode only)
+        truncated (int): Packets lost because they did not fit into the receive buffer
+
+    NOTE:
+        The packet returned by `recv` is reused; it is only valid until the next `recv` call.
     """
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 30011) -> None:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 30011,
+        *,
+        use_thread: bool = False,
+        recorder: Optional[PacketRecorder] = None,
+    ) -> None:
 
         super().__init__(host, port)
 
@@ -34,15 +62,212 @@ class MWReceiver(IPNetAddr):  # pylint: disable=R0904
         self.__sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
         self.__sock.bind((self.host, self.port))
 
+        self.__buf: bytearray = bytearray(BUFFSIZE)
+        self.__view: memoryview = memoryview(self.__buf)
+
+        self.__dropped: int = 0
+        self.__truncated: int = 0
+
+        self.__recorder: Optional[PacketRecorder] = recorder
+
+        self.__mailbox: Mailbox[RacoonMW_Packet] = Mailbox()
+
+        # NOTE: One packet being filled, one waiting in the mailbox, one held by the caller
+        self.__free: SimpleQueue[RacoonMW_Packet] = SimpleQueue()
+        for _ in range(3 if use_thread else 1):
+            self.__free.put(RacoonMW_Packet())
+
+        self.__held: Optional[RacoonMW_Packet] = None
+
+        self.__stop_event: Event = Event()
+
+        self.__thread: Optional[Thread] = None
+
+        if use_thread:
+            self.__sock.setblocking(False)
+            self.__thread = Thread(target=self.__recv_loop, name="MWReceiver", daemon=True)
+            self.__thread.start()
+            self.__logger.info("Receiving on a background thread")
+
     def __del__(self) -> None:
         self.__logger.debug("Destructor called")
-        self.__sock.close()
-        self.__logger.info("Socket closed")
-
-    def recv(self) -> RacoonMW_Packet:
-        """recv"""
-        packet: bytes = self.__sock.recv(BUFFSIZE)
-        proto = RacoonMW_Packet()
-        proto.ParseFromString(packet)
-        self.__logger.debug("Received %s", proto)
+        self.close()
+
+    @property
+    def use_thread(self) -> bool:
+        """use_thread"""
+        return self.__thread is not None
+
+    @property
+    def buffsize(self) -> int:
+        """buffsize"""
+        return len(self.__buf)
+
+    @property
+    def dropped(self) -> int:
+        """dropped"""
+        return self.__dropped
+
+    @property
+    def overwritten(self) -> int:
+        """overwritten"""
+        return self.__mailbox.overwritten
+
+    @property
+    def truncated(self) -> int:
+        """truncated"""
+        return self.__truncated
+
+    def close(self) -> None:
+        """close
+
+        Stop the receive thread (if any) and close the socket.
+        """
+        if self.__thread:
+            self.__stop_event.set()
+            self.__mailbox.close()
+            self.__thread.join(timeout=1)
+            self.__logger.info("Receive thread stopped (dropped: %d, overwritten: %d)", self.dropped, self.overwritten)
+            self.__thread = None
+        if self.__sock.fileno() >= 0:
+            self.__sock.close()
+            self.__logger.info("Socket closed")
+        if self.__recorder:
+            self.__recorder.close()
+
+    def recv(self, timeout: Optional[float] = None) -> RacoonMW_Packet:
+        """recv
+
+        Args:
+            timeout (float, optional): Seconds to wait for a packet (default: None, wait forever)
+
+        Returns:
+            RacoonMW_Packet: The latest packet (in thread mode, blocks until a new one arrives)
+
+        Raises:
+            TimeoutError: If no packet arrived within the timeout
+            ConnectionAbortedError: If the receiver has been closed (thread mode only)
+        """
+        if self.__held is not None:
+            self.__free.put(self.__held)
+            self.__held = None
+
+        proto: Optional[RacoonMW_Packet]
+        if self.__thread:
+            proto = self.__mailbox.get(timeout)
+            if proto is None:
+                if self.__mailbox.is_closed:
+                    raise ConnectionAbortedError("MWReceiver has been closed")
+                raise TimeoutError("No packet received")
+            self.__held = proto
+            return proto
+
+        deadline: Optional[float] = None if (timeout is None) else (monotonic() + timeout)
+        proto = self.__free.get()
+        try:
+            while True:
+                if (deadline is not None) and not select([self.__sock], [], [], max(0.0, deadline - monotonic()))[0]:
+                    raise TimeoutError("No packet received")
+                if self.__parse(proto, self.__recv_into()):
+                    break
+        except TimeoutError:
+            self.__free.put(proto)
+            raise
+        self.__held = proto
         return proto
+
+    def __recv_into(self) -> int:
+        """recv_into
+
+        Receive a datagram into the preallocated buffer, growing it if the datagram did not fit.
+
+        Returns:
+            int: Number of bytes received (0 if the datagram was truncated)
+
+        Raises:
+            BlockingIOError: If no datagram is available on a non-blocking socket
+        """
+        nbytes: int = self.__sock.recv_into(self.__buf, 0, RECV_FLAGS)
+        if (nbytes < len(self.__buf)) or ((nbytes == len(self.__buf)) and RECV_FLAGS):
+            return nbytes
+
+        self.__truncated += 1
+        if len(self.__buf) < MAX_BUFFSIZE:
+            size: int = len(self.__buf)
+            while (size <= nbytes) and (size < MAX_BUFFSIZE):
+                size *= 2
+            self.__buf = bytearray(size)
+            self.__view = memoryview(self.__buf)
+        self.__logger.warning("Packet (%d bytes) truncated, buffer resized to %d bytes", nbytes, len(self.__buf))
+        return 0
+
+    def __recv_loop(self) -> None:
+        """recv_loop
+
+        Drain the socket and hand only the newest packet over to the mailbox (closed when the loop ends).
+        """
+        nbytes: int
+        while not self.__stop_event.is_set():
+            try:
+                if not select([self.__sock], [], [], 0.1)[0]:
+                    continue
+
+                # NOTE: Packets queued in the kernel are already stale; keep the last one only
+                nbytes = 0
+                while True:
+                    try:
+                        newer: int = self.__recv_into()
+                    except BlockingIOError:
+                        break
+                    if nbytes:
+                        self.__dropped += 1
+                    nbytes = newer
+            except (OSError, ValueError) as err:
+                if not self.__stop_event.is_set():
+                    self.__logger.error("Failed to receive packet (%s)", err)
+                break
+
+            if not nbytes:
+                continue
+
+            proto: RacoonMW_Packet = self.__free.get()
+            if not self.__parse(proto, nbytes):
+                self.__free.put(proto)
+                continue
+
+            displaced: Optional[RacoonMW_Packet] = self.__mailbox.put(proto)
+            if displaced is not None:
+                self.__free.put(displaced)
+
+        # NOTE: Wake up the readers if the loop ended on an error (`recv` then raises instead of waiting forever)
+        self.__mailbox.close()
+
+    def __parse(self, proto: RacoonMW_Packet, nbytes: int) -> bool:
+        """parse
+
+        Args:
+            proto (RacoonMW_Packet): Message object to fill (cleared first)
+            nbytes (int): Number of valid bytes in the buffer
+
+        Returns:
+            bool: True if a complete packet was parsed
+        """
+        if not nbytes:
+            return False
+
+        proto.Clear()
+        try:
+            proto.MergeFromString(self.__view[:nbytes])
+        except DecodeError as err:
+            self.__logger.warning("Failed to parse packet (%s)", err)
+            return False
+
+        if not proto.IsInitialized():
+            self.__logger.warning("Incomplete packet received (%d bytes)", nbytes)
+            return False
+
+        if self.__recorder:
+            self.__recorder.write(bytes(self.__view[:nbytes]))
+
+        self.__logger.debug("Received %s", proto)
+        return True
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3.10
+
+"""recorder.py
+
+    This module contains
+        - PacketRecorder
+        - read_records
+
+    File format (little endian):
+        - Header: LOG_MAGIC (8 bytes)
+        - Records: RECORD_HEADER (timestamp [ns, time.monotonic_ns], payload length) followed by the raw packet
+"""
+
+from datetime import datetime
+from logging import getLogger
+from os import makedirs, path
+from queue import Empty, Full, Queue
+from struct import Struct
+from threading import Event, Thread
+from time import monotonic_ns
+from typing import BinaryIO, Iterator, Optional
+
+LOG_MAGIC: bytes = b"RMWLOG\x00\x01"
+
+LOG_SUFFIX: str = ".rmwlog"
+
+RECORD_HEADER: Struct = Struct("<qI")
+
+
+class PacketRecorder:  # pylint: disable=R0902
+    """PacketRecorder
+
+    Append raw packets to rotated binary logs from a background thread.
+    `write` never touches the disk; packets are dropped if the writer falls behind.
+
+    Args:
+        directory (str, optional): Directory of the logs (default: .cache/records)
+        prefix (str, optional): Prefix of the file names (default: racoon-mw)
+        max_bytes (int, optional): Size to rotate the log at (default: 64 MiB)
+        max_queue (int, optional): Packets to hold while the writer is busy (default: 1024)
+
+    Attributes:
+        files (list[str]): Logs written so far (the last one is the current)
+        written (int): Packets written
+        dropped (int): Packets dropped because the queue was full
+    """
+
+    def __init__(
+        self,
+        directory: str = ".cache/records",
+        prefix: str = "racoon-mw",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_queue: int = 1024,
+    ) -> None:
+
+        # NOTE: Set first; `close` (from `__del__`) has nothing to do if `__init__` raised before the thread
+        self.__thread: Optional[Thread] = None
+
+        self.__logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        self.__directory: str = directory
+        self.__prefix: str = prefix
+        self.__max_bytes: int = max_bytes
+        self.__stamp: str = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+        self.__files: list[str] = []
+        self.__written: int = 0
+        self.__dropped: int = 0
+
+        self.__queue: Queue[tuple[int, bytes]] = Queue(max_queue)
+        self.__stop_event: Event = Event()
+
+        makedirs(self.__directory, exist_ok=True)
+        self.__file: BinaryIO = self.__open()
+        self.__size: int = len(LOG_MAGIC)
+
+        thread: Thread = Thread(target=self.__write_loop, name="PacketRecorder", daemon=True)
+        thread.start()
+        self.__thread = thread
+
+    def __del__(self) -> None:
+        self.close()
+
+    @property
+    def files(self) -> list[str]:
+        """files"""
+        return self.__files
+
+    @property
+    def written(self) -> int:
+        """written"""
+        return self.__written
+
+    @property
+    def dropped(self) -> int:
+        """dropped"""
+        return self.__dropped
+
+    def write(self, data: bytes, timestamp: Optional[int] = None) -> bool:
+        """write
+
+        Args:
+            data (bytes): Raw packet (must not be reused by the caller)
+            timestamp (int, optional): Receive time in ns of time.monotonic_ns (default: now)
+
+        Returns:
+            bool: False if the packet was dropped
+        """
+        try:
+            self.__queue.put_nowait((monotonic_ns() if timestamp is None else timestamp, data))
+        except Full:
+            self.__dropped += 1
+            return False
+        return True
+
+    def close(self) -> None:
+        """close
+
+        Flush the queued packets and close the log.
+        """
+        if not self.__thread:
+            return
+        self.__stop_event.set()
+        self.__thread.join(timeout=5)
+        self.__thread = None
+        self.__file.close()
+        self.__logger.info(
+            "Recorded %d packets into %d file(s) (dropped: %d)", self.written, len(self.files), self.dropped
+        )
+
+    def __open(self) -> BinaryIO:
+        """open
+
+        Returns:
+            BinaryIO: The next log file (header written)
+        """
+        file_path: str = path.join(
+            self.__directory, f"{self.__prefix}_{self.__stamp}_{len(self.__files):03d}{LOG_SUFFIX}"
+        )
+        file: BinaryIO = open(file_path, "wb")  # pylint: disable=R1732
+        file.write(LOG_MAGIC)
+        self.__files.append(file_path)
+        self.__logger.info("Recording packets into %s", file_path)
+        return file
+
+    def __write_loop(self) -> None:
+        """write_loop"""
+        timestamp: int
+        data: bytes
+        while not (self.__stop_event.is_set() and self.__queue.empty()):
+            try:
+                timestamp, data = self.__queue.get(timeout=0.1)
+            except Empty:
+                continue
+
+            try:
+                if (self.__size > len(LOG_MAGIC)) and (self.__size + RECORD_HEADER.size + len(data) > self.__max_bytes):
+                    self.__file.close()
+                    self.__file = self.__open()
+                    self.__size = len(LOG_MAGIC)
+                self.__file.write(RECORD_HEADER.pack(timestamp, len(data)))
+                self.__file.write(data)
+            except OSError as err:
+                self.__logger.error("Failed to record packet (%s)", err)
+                break
+            self.__size += RECORD_HEADER.size + len(data)
+            self.__written += 1
+
+
+def read_records(file_path: str) -> Iterator[tuple[int, bytes]]:
+    """read_records
+
+    Args:
+        file_path (str): Log written by PacketRecorder
+
+    Yields:
+        tuple[int, bytes]: Timestamp (ns) and raw packet
+
+    Raises:
+        ValueError: If the file is not a log of PacketRecorder
+    """
+    with open(file_path, "rb") as file:
+        if file.read(len(LOG_MAGIC)) != LOG_MAGIC:
+            raise ValueError(f"{file_path} is not a packet log")
+
+        while header := file.read(RECORD_HEADER.size):
+            if len(header) < RECORD_HEADER.size:
+                getLogger(__name__).warning("Truncated record at the end of %s", file_path)
+                return
+            timestamp, length = RECORD_HEADER.unpack(header)
+            data: bytes = file.read(length)
+            if len(data) < length:
+                getLogger(__name__).warning("Truncated record at the end of %s", file_path)
+                return
+            yield timestamp, data
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3.10
+
+"""replay.py
+
+    This module contains
+        - PacketReplayer
+        - find_logs
+"""
+
+from glob import glob
+from logging import getLogger
+from os import path
+from time import monotonic_ns, sleep
+from typing import Iterator, Optional, Sequence
+
+from google.protobuf.message import DecodeError
+
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
+
+from .recorder import LOG_SUFFIX, read_records
+
+# NOTE: Longest pause (ns) replayed between two packets; longer ones are gaps between sessions
+MAX_GAP: int = int(1e9)
+
+
+def find_logs(target: str) -> list[str]:
+    """find_logs
+
+    Args:
+        target (str): A log file, or a directory of rotated logs
+
+    Returns:
+        list[str]: Logs in the recorded order
+    """
+    if path.isdir(target):
+        return sorted(glob(path.join(target, f"*{LOG_SUFFIX}")))
+    return [target]
+
+
+class PacketReplayer:
+    """PacketReplayer
+
+    PacketSource which serves the packets recorded by PacketRecorder.
+
+    Args:
+        files (Sequence[str]): Logs to replay (in order)
+        speed (float, optional): Playback speed; 1 for real-time, 0 for as fast as possible (default: 1)
+            (a pause longer than a second in the log, e.g. between the sessions of a directory, is skipped)
+        loop (bool, optional): If true, restart from the first log at the end (default: False)
+
+    Attributes:
+        replayed (int): Packets served so far
+        skipped (int): Records which could not be parsed
+
+    NOTE:
+        The packet returned by `recv` is reused; it is only valid until the next `recv` call.
+    """
+
+    def __init__(self, files: Sequence[str], speed: float = 1, loop: bool = False) -> None:
+
+        self.__logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        if not files:
+            raise ValueError("No packet log to replay")
+
+        self.__files: Sequence[str] = files
+        self.__speed: float = speed
+        self.__loop: bool = loop
+
+        self.__proto: RacoonMW_Packet = RacoonMW_Packet()
+        self.__records: Iterator[tuple[int, bytes]] = self.__iter_records()
+        self.__pending: Optional[tuple[int, bytes]] = None
+
+        # NOTE: Time origins of the log and of the wall clock (set by the first packet), and the last timestamp
+        self.__log_origin: Optional[int] = None
+        self.__wall_origin: int = 0
+        self.__last_timestamp: int = 0
+
+        self.__replayed: int = 0
+        self.__skipped: int = 0
+
+        self.__logger.info("Replaying %d file(s) at %s", len(files), (f"x{speed:g}" if speed > 0 else "full speed"))
+
+    @property
+    def replayed(self) -> int:
+        """replayed"""
+        return self.__replayed
+
+    @property
+    def skipped(self) -> int:
+        """skipped"""
+        return self.__skipped
+
+    def recv(self, timeout: Optional[float] = None) -> RacoonMW_Packet:
+        """recv
+
+        Args:
+            timeout (float, optional): Seconds to wait for the next packet (default: None, wait forever)
+
+        Returns:
+            RacoonMW_Packet: The next packet (waits until its time unless played as fast as possible)
+
+        Raises:
+            TimeoutError: If the next packet is not due within the timeout
+            EOFError: If all the logs have been replayed
+        """
+        while (record := self.__pending or next(self.__records, None)) is not None:
+            self.__pending = None
+            timestamp, data = record
+
+            if self.__speed > 0:
+                delay: float = self.__delay(timestamp)
+                if (timeout is not None) and (delay > timeout):
+                    sleep(timeout)
+                    self.__pending = record
+                    raise TimeoutError("No packet due")
+                if delay > 0:
+                    sleep(delay)
+
+            self.__proto.Clear()
+            try:
+                self.__proto.MergeFromString(data)
+            except DecodeError as err:
+                self.__logger.warning("Failed to parse recorded packet (%s)", err)
+                self.__skipped += 1
+                continue
+
+            self.__replayed += 1
+            return self.__proto
+
+        raise EOFError(f"Replayed all the {self.__replayed} packets")
+
+    def __delay(self, timestamp: int) -> float:
+        """delay
+
+        Args:
+            timestamp (int): Recorded time of the packet (ns)
+
+        Returns:
+            float: Seconds until the packet is due
+        """
+        # NOTE: Restart the timing after a jump back (e.g. a loop) or a long gap (e.g. the next session)
+        last, self.__last_timestamp = self.__last_timestamp, timestamp
+        if (self.__log_origin is None) or not 0 <= timestamp - last <= MAX_GAP:
+            self.__log_origin = timestamp
+            self.__wall_origin = monotonic_ns()
+            return 0
+
+        return (self.__wall_origin + (timestamp - self.__log_origin) / self.__speed - monotonic_ns()) / 1e9
+
+    def __iter_records(self) -> Iterator[tuple[int, bytes]]:
+        """iter_records
+
+        Yields:
+            tuple[int, bytes]: Timestamp (ns) and raw packet
+        """
+        while True:
+            for file_path in self.__files:
+                self.__logger.info("Replaying %s", file_path)
+                yield from read_records(file_path)
+            if not self.__loop:
+                return
+            self.__log_origin = None
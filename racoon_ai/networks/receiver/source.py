@@ -0,0 +1,31 @@
+#!/usr/bin/env python3.10
+
+"""source.py
+
+    This module contains
+        - PacketSource
+"""
+
+from typing import Optional, Protocol
+
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
+
+
+class PacketSource(Protocol):  # pylint: disable=R0903
+    """PacketSource
+
+    Anything the Observer can pull RacoonMW_Packet from (e.g. MWReceiver).
+    """
+
+    def recv(self, timeout: Optional[float] = None) -> RacoonMW_Packet:
+        """recv
+
+        Args:
+            timeout (float, optional): Seconds to wait for a packet (default: None, wait forever)
+
+        Returns:
+            RacoonMW_Packet: The next packet (only valid until the next call)
+
+        Raises:
+            TimeoutError: If no packet arrived within the timeout
+        """
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3.10
+
+"""supervisor.py
+
+    This module contains
+        - MWSupervisor
+"""
+
+from logging import getLogger
+from subprocess import Popen, TimeoutExpired
+from time import monotonic
+from typing import Callable, Optional
+
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
+
+from .source import PacketSource
+
+
+class MWSupervisor:  # pylint: disable=R0902
+    """MWSupervisor
+
+    PacketSource which launches RACOON-MW, waits for its first packet and keeps it running:
+    MW is restarted if it exits, does not become ready in time, or stops sending.
+
+    Args:
+        receiver (PacketSource): Source of the packets sent by MW (e.g. MWReceiver)
+        launch (Callable[[], Popen[bytes]]): Function starting MW
+        ready_timeout (float, optional): Seconds for MW to send its first packet (default: 10)
+        stall_timeout (float, optional): Seconds without a packet before MW is restarted (default: 3)
+        check_interval (float, optional): Seconds between the checks of MW while no packet arrives (default: 0.1)
+
+    Attributes:
+        process (Popen[bytes]): Current MW process
+        is_ready (bool): True once the current MW process has sent a packet
+        ready_time (float): Seconds the current MW process took to send its first packet
+        restarts (int): Restarts of MW so far
+    """
+
+    def __init__(
+        self,
+        receiver: PacketSource,
+        launch: Callable[[], "Popen[bytes]"],
+        *,
+        ready_timeout: float = 10,
+        stall_timeout: float = 3,
+        check_interval: float = 0.1,
+    ) -> None:
+
+        self.__logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        self.__receiver: PacketSource = receiver
+        self.__launch: Callable[[], "Popen[bytes]"] = launch
+        self.__ready_timeout: float = ready_timeout
+        self.__stall_timeout: float = stall_timeout
+        self.__check_interval: float = check_interval
+
+        self.__process: "Popen[bytes]" = launch()
+        self.__launched_at: float = monotonic()
+        self.__last_packet_at: float = 0
+        self.__checked_at: float = 0
+        self.__is_ready: bool = False
+        self.__ready_time: float = 0
+        self.__restarts: int = 0
+
+        # NOTE: First packet, taken while waiting for MW; served by the next `recv`
+        self.__pending: Optional[RacoonMW_Packet] = None
+
+    @property
+    def process(self) -> "Popen[bytes]":
+        """process"""
+        return self.__process
+
+    @property
+    def is_ready(self) -> bool:
+        """is_ready"""
+        return self.__is_ready
+
+    @property
+    def ready_time(self) -> float:
+        """ready_time"""
+        return self.__ready_time
+
+    @property
+    def restarts(self) -> int:
+        """restarts"""
+        return self.__restarts
+
+    def wait_ready(self, timeout: Optional[float] = None) -> float:
+        """wait_ready
+
+        Wait for the first packet of MW (restarting it if it fails to start).
+
+        Args:
+            timeout (float, optional): Seconds to wait (default: None, wait forever)
+
+        Returns:
+            float: Seconds MW took to send its first packet
+
+        Raises:
+            TimeoutError: If MW is not ready within the timeout
+        """
+        deadline: Optional[float] = None if (timeout is None) else (monotonic() + timeout)
+        while not self.__is_ready:
+            try:
+                self.__pending = self.__recv(self.__check_interval)
+            except TimeoutError as err:
+                if (deadline is not None) and (monotonic() > deadline):
+                    raise TimeoutError(f"MW not ready within {timeout} s") from err
+        return self.__ready_time
+
+    def recv(self, timeout: Optional[float] = None) -> RacoonMW_Packet:
+        """recv
+
+        Args:
+            timeout (float, optional): Seconds to wait for a packet (default: None, wait forever)
+
+        Returns:
+            RacoonMW_Packet: The next packet (only valid until the next call)
+
+        Raises:
+            TimeoutError: If no packet arrived within the timeout
+        """
+        if (proto := self.__pending) is not None:
+            self.__pending = None
+            return proto
+
+        if timeout is not None:
+            return self.__recv(timeout)
+
+        while True:
+            try:
+                return self.__recv(self.__check_interval)
+            except TimeoutError:
+                continue
+
+    def restart(self) -> None:
+        """restart"""
+        self.__stop()
+        self.__process = self.__launch()
+        self.__launched_at = monotonic()
+        self.__is_ready = False
+        self.__restarts += 1
+        self.__logger.info("MW restarted (%d restart(s) so far)", self.__restarts)
+
+    def close(self) -> None:
+        """close"""
+        self.__stop()
+
+    def __recv(self, timeout: float) -> RacoonMW_Packet:
+        """recv
+
+        Args:
+            timeout (float): Seconds to wait for a packet
+
+        Returns:
+            RacoonMW_Packet: The next packet
+
+        Raises:
+            TimeoutError: If no packet arrived within the timeout (MW is checked before raising)
+        """
+        try:
+            proto: RacoonMW_Packet = self.__receiver.recv(timeout)
+        except TimeoutError:
+            self.__check()
+            raise
+
+        self.__last_packet_at = monotonic()
+        if not self.__is_ready:
+            self.__is_ready = True
+            self.__ready_time = self.__last_packet_at - self.__launched_at
+            self.__logger.info("MW ready after %.2f s", self.__ready_time)
+        return proto
+
+    def __check(self) -> None:
+        """check
+
+        Restart MW if it has exited, or has not sent a packet for too long.
+        """
+        now: float = monotonic()
+        if now - self.__checked_at < self.__check_interval:
+            return
+        self.__checked_at = now
+
+        if (code := self.__process.poll()) is not None:
+            self.__logger.error("MW exited (code: %d), restarting", code)
+        elif not self.__is_ready and (now - self.__launched_at > self.__ready_timeout):
+            self.__logger.error("MW sent nothing for %.1f s after the launch, restarting", now - self.__launched_at)
+        elif self.__is_ready and (now - self.__last_packet_at > self.__stall_timeout):
+            self.__logger.error("MW sent nothing for %.1f s, restarting", now - self.__last_packet_at)
+        else:
+            return
+        self.restart()
+
+    def __stop(self) -> None:
+        """stop"""
+        if self.__process.poll() is not None:
+            return
+        self.__logger.info("Killing MW...")
+        self.__process.kill()
+        try:
+            self.__process.wait(timeout=1)
+        except TimeoutExpired:
+            self.__logger.warning("MW (pid: %d) did not exit", self.__process.pid)
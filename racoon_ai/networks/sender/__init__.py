@@ -4,7 +4,11 @@
 from configparser import ConfigParser
 from logging import Logger
 
+from .async_sender import AsyncSender
+from .command_packet import CommandPacket
 from .command_sender import CommandSender
+from .fanout import UdpFanout
+from .transmitter import RadioTransmitter
 
 
 def create_sender(
@@ -21,15 +25,60 @@ def create_sender(
     Returns:
         CommandSender
     """
+    use_sendmmsg: bool = config.getboolean("command_sender", "use_sendmmsg", fallback=False)
+
+    # NOTE: Transmitter of the latest commands at a fixed rate (disabled if 0)
+    radio_rate: float = config.getfloat("command_sender", "radio_rate", fallback=0)
+    stale_after: float = config.getfloat("command_sender", "stale_after", fallback=0.2)
+    extrapolate: float = config.getfloat("command_sender", "extrapolate", fallback=0)
+
+    # NOTE: Stop at the end and reset of the IMU at the start: duration (s) and rate (Hz)
+    stop: tuple[float, float] = (
+        config.getfloat("command_sender", "stop_duration", fallback=0.2),
+        config.getfloat("command_sender", "stop_rate", fallback=100),
+    )
+    imu_reset: tuple[float, float] = (
+        config.getfloat("command_sender", "imu_reset_duration", fallback=0.1),
+        config.getfloat("command_sender", "imu_reset_rate", fallback=100),
+    )
+
     if (is_real) or not config.getboolean("command_sender", "use_custom_addr", fallback=False):
-        return CommandSender(target_ids, is_real, is_team_yellow)
+        # NOTE: Real robots get only their own command, unless disabled
+        trim_real: bool = config.getboolean("command_sender", "trim_real", fallback=True)
+        return CommandSender(
+            target_ids,
+            is_real,
+            is_team_yellow,
+            trim_real=trim_real,
+            use_sendmmsg=use_sendmmsg,
+            radio_rate=radio_rate,
+            stale_after=stale_after,
+            extrapolate=extrapolate,
+            stop=stop,
+            imu_reset=imu_reset,
+        )
     target_host: str = config.get("command_sender", "host") or "localhost"
     target_port: int = int(config.get("command_sender", "port") or 20011)
     logger.info("Using custom address for target: %s:%d", target_host, target_port)
-    return CommandSender(target_ids, is_team_yellow=is_team_yellow, host=target_host, port=target_port)
+    return CommandSender(
+        target_ids,
+        is_team_yellow=is_team_yellow,
+        host=target_host,
+        port=target_port,
+        use_sendmmsg=use_sendmmsg,
+        radio_rate=radio_rate,
+        stale_after=stale_after,
+        extrapolate=extrapolate,
+        stop=stop,
+        imu_reset=imu_reset,
+    )
 
 
 __all__ = [
+    "AsyncSender",
+    "CommandPacket",
     "CommandSender",
+    "RadioTransmitter",
+    "UdpFanout",
     "create_sender",
 ]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3.10
+
+"""async_sender.py
+
+    This module contains
+        - AsyncSender
+"""
+
+from logging import Logger, getLogger
+from threading import Thread
+from typing import Callable, Optional
+
+from racoon_ai.models.robot import SimCommands
+from racoon_ai.networks.mailbox import Mailbox
+
+from .guard import try_send
+
+
+class AsyncSender:
+    """AsyncSender
+
+    Send stage of the pipeline: serializes and transmits the commands on a background thread.
+    `put` only hands the commands over (the latest ones win), so the caller never waits on the socket.
+
+    Args:
+        send (Callable[[SimCommands], None]): Function sending the commands (e.g. CommandSender.send)
+
+    Attributes:
+        sent (int): Commands sent
+        overwritten (int): Commands replaced before being sent (i.e. the send stage fell behind)
+    """
+
+    def __init__(self, send: Callable[[SimCommands], None]) -> None:
+
+        self.__logger: Logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        self.__send: Callable[[SimCommands], None] = send
+        self.__mailbox: Mailbox[SimCommands] = Mailbox()
+        self.__sent: int = 0
+
+        thread: Thread = Thread(target=self.__send_loop, name="AsyncSender", daemon=True)
+        thread.start()
+        self.__thread: Optional[Thread] = thread
+        self.__logger.info("Sending on a background thread")
+
+    def __del__(self) -> None:
+        self.close()
+
+    @property
+    def sent(self) -> int:
+        """sent"""
+        return self.__sent
+
+    @property
+    def overwritten(self) -> int:
+        """overwritten"""
+        return self.__mailbox.overwritten
+
+    def put(self, sim_cmds: SimCommands) -> None:
+        """put
+
+        Args:
+            sim_cmds (SimCommands): Commands to send (must not be modified afterwards)
+        """
+        self.__mailbox.put(sim_cmds)
+
+    def close(self) -> None:
+        """close
+
+        Send the pending commands (if any) and stop the thread.
+        """
+        if not self.__thread:
+            return
+        self.__mailbox.close()
+        self.__thread.join(timeout=1)
+        self.__thread = None
+        self.__logger.info("Send thread stopped (sent: %d, overwritten: %d)", self.sent, self.overwritten)
+
+    def __send_loop(self) -> None:
+        """send_loop"""
+        while (sim_cmds := self.__mailbox.get()) is not None:
+            if try_send(self.__send, sim_cmds, self.__logger):
+                self.__sent += 1
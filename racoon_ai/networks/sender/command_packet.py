@@ -0,0 +1,103 @@
+#!/usr/bin/env python3.10
+
+"""command_packet.py
+
+    This module contains
+        - CommandPacket
+"""
+
+from racoon_ai.models.robot import RobotCommand, SimCommands
+from racoon_ai.proto.pb_gen.grSim_Commands_pb2 import grSim_Commands, grSim_Robot_Command
+from racoon_ai.proto.pb_gen.grSim_Packet_pb2 import grSim_Packet
+
+
+class CommandPacket:
+    """CommandPacket
+
+    A grSim_Packet of the commands reused from a send to the next.
+
+    Each robot id keeps its slot (a grSim_Robot_Command of the packet), whose fields are updated in place;
+    the slots are only laid out again when the robot ids (or their order) change.
+    The bytes are the same as those of a packet built anew from the commands.
+
+    `serialize_one` keeps a single slot instead: a packet per robot (e.g. to send each robot only its command)
+    is then a CommandPacket per robot id, laid out once.
+
+    Attributes:
+        layouts (int): Times the slots were laid out
+    """
+
+    def __init__(self) -> None:
+
+        self.__packet: grSim_Packet = grSim_Packet()
+        self.__commands: grSim_Commands = self.__packet.commands
+        self.__robot_ids: tuple[int, ...] = ()
+        self.__slots: list[grSim_Robot_Command] = []
+        self.__layouts: int = 0
+
+    @property
+    def layouts(self) -> int:
+        """layouts"""
+        return self.__layouts
+
+    @property
+    def packet(self) -> grSim_Packet:
+        """packet
+
+        Returns:
+            grSim_Packet: Packet of the last commands (reused, do not keep)
+        """
+        return self.__packet
+
+    def serialize(self, sim_cmds: SimCommands) -> bytes:
+        """serialize
+
+        Args:
+            sim_cmds (SimCommands): Commands to send
+
+        Returns:
+            bytes: Serialized grSim_Packet
+        """
+        self.__commands.timestamp = sim_cmds.timestamp
+        self.__commands.isteamyellow = sim_cmds.isteamyellow
+
+        robot_ids: tuple[int, ...] = tuple(cmd.robot_id for cmd in sim_cmds.robot_commands)
+        if robot_ids != self.__robot_ids:
+            self.__layout(robot_ids)
+
+        for robot_command, slot in zip(sim_cmds.robot_commands, self.__slots):
+            robot_command.write_proto(slot)
+
+        packet: bytes = self.__packet.SerializeToString()
+        return packet
+
+    def serialize_one(self, sim_cmds: SimCommands, robot_command: RobotCommand) -> bytes:
+        """serialize_one
+
+        Args:
+            sim_cmds (SimCommands): Commands to send (for the timestamp and the team)
+            robot_command (RobotCommand): The only command of the packet
+
+        Returns:
+            bytes: Serialized grSim_Packet
+        """
+        self.__commands.timestamp = sim_cmds.timestamp
+        self.__commands.isteamyellow = sim_cmds.isteamyellow
+
+        if (robot_command.robot_id,) != self.__robot_ids:
+            self.__layout((robot_command.robot_id,))
+
+        robot_command.write_proto(self.__slots[0])
+        packet: bytes = self.__packet.SerializeToString()
+        return packet
+
+    def __layout(self, robot_ids: tuple[int, ...]) -> None:
+        """layout
+
+        Args:
+            robot_ids (tuple[int, ...]): Robot ids in the order of the commands
+        """
+        self.__commands.ClearField("robot_commands")
+        self.__slots = [self.__commands.robot_commands.add() for _ in robot_ids]
+        self.__robot_ids = robot_ids
+        self.__layouts += 1
@@ -5,16 +5,17 @@
     This module is for the CommandSender class.
 """
 
-from logging import Logger, getLogger
-from socket import AF_INET, IP_MULTICAST_TTL, IPPROTO_IP, IPPROTO_UDP, SOCK_DGRAM
-from socket import error as socket_error
-from socket import socket
+from logging import DEBUG, Logger, getLogger
+from socket import AF_INET, IP_MULTICAST_TTL, IPPROTO_IP, IPPROTO_UDP, SOCK_DGRAM, socket
 from time import perf_counter, sleep
+from typing import Optional
 
 from racoon_ai.models.network import IPNetAddr
 from racoon_ai.models.robot import RobotCommand, SimCommands
-from racoon_ai.proto.pb_gen.grSim_Commands_pb2 import grSim_Commands
-from racoon_ai.proto.pb_gen.grSim_Packet_pb2 import grSim_Packet
+
+from .command_packet import CommandPacket
+from .fanout import UdpFanout
+from .transmitter import RadioTransmitter
 
 
 class CommandSender:
@@ -28,6 +29,20 @@ class CommandSender:
             Defaults to `224.5.23.2`.
         port (int, optional): Port number of the target.
             Defaults to `20011`.
+        trim_real (bool, optional): True to send each real robot only its own command
+            (the full packet is still sent to all for the other ids, e.g. 254 and 255). Defaults to True.
+        use_sendmmsg (bool, optional): True to send the datagrams of a cycle in a single sendmmsg(2)
+            where available. Defaults to False.
+        radio_rate (float, optional): Rate to send the latest commands at from a background thread (Hz),
+            instead of sending them as they come. Defaults to 0 (disabled).
+        stale_after (float, optional): Age of the latest commands to send a stop instead (s),
+            with `radio_rate`. Defaults to 0.2.
+        extrapolate (float, optional): Horizon of the extrapolation of the velocities (s),
+            with `radio_rate`. Defaults to 0 (disabled).
+        stop (tuple[float, float], optional): Duration (s) and rate (Hz) of the stop sent at the end.
+            Defaults to (0.2, 100).
+        imu_reset (tuple[float, float], optional): Duration (s) and rate (Hz) of the reset of the IMU
+            sent at the start, to real robots. Defaults to (0.1, 100).
 
     TODO:
         Implement a method to change the address and port on the fly.
@@ -41,10 +56,27 @@ class CommandSender:
         *,
         host: str = "224.5.23.2",
         port: int = 20011,
+        trim_real: bool = True,
+        use_sendmmsg: bool = False,
+        radio_rate: float = 0,
+        stale_after: float = 0.2,
+        extrapolate: float = 0,
+        stop: tuple[float, float] = (0.2, 100),
+        imu_reset: tuple[float, float] = (0.1, 100),
     ) -> None:
 
+        # NOTE: Set last; `__del__` has nothing to tear down if `__init__` raised before
+        self.__is_ready: bool = False
+
         self.__logger: Logger = getLogger(__name__)
 
+        if stop[1] <= 0 or imu_reset[1] <= 0:
+            raise ValueError(f"Rates must be positive: stop={stop[1]}, imu_reset={imu_reset[1]}")
+
+        # NOTE: Duration (s) and rate (Hz) of the stop at the end and of the reset of the IMU at the start
+        self.__stop_burst: tuple[float, float] = stop
+        self.__imu_reset_burst: tuple[float, float] = imu_reset
+
         self.__is_real: bool = is_real
 
         self.__is_team_yellow: bool = is_team_yellow
@@ -53,24 +85,71 @@ class CommandSender:
 
         self.__sock = socket(AF_INET, SOCK_DGRAM, IPPROTO_UDP)
 
-        self.__dists: set[IPNetAddr]
+        self.__packet: CommandPacket = CommandPacket()
+
+        # NOTE: Index of the destination and packet of each real robot, to send it only its command
+        self.__robot_indices: dict[int, int] = {}
+        self.__robot_packets: dict[int, CommandPacket] = {}
+
+        dists: list[IPNetAddr]
+        if self.__is_real and self.__target_ids:
+            robot_ids: list[int] = sorted(self.__target_ids)
+            dists = [IPNetAddr(f"192.168.0.1{robot_id:02d}", port, mod_name=__name__) for robot_id in robot_ids]
+            self.__robot_indices = {robot_id: index for index, robot_id in enumerate(robot_ids)}
+            if trim_real:
+                self.__robot_packets = {robot_id: CommandPacket() for robot_id in robot_ids}
+                self.__logger.info("Sending each robot only its command")
+        else:
+            dists = [IPNetAddr(host, port, mod_name=__name__)]
+            self.__sock.setsockopt(IPPROTO_IP, IP_MULTICAST_TTL, 2)
+
+        self.__dists: set[IPNetAddr] = set(dists)
+        self.__fanout: UdpFanout = UdpFanout(self.__sock, dists, batch=use_sendmmsg)
+        if self.__fanout.batched:
+            self.__logger.info("Sending with sendmmsg")
 
         if self.__is_real and self.__target_ids:
-            host_ips: set[str] = {f"192.168.0.1{robot_id:02d}" for robot_id in self.__target_ids}
-            self.__dists = {IPNetAddr(host, port, mod_name=__name__) for host in host_ips}
             self.__imu_reset()
             sleep(0.1)
-            return
 
-        self.__dists = {IPNetAddr(host, port, mod_name=__name__)}
-        self.__sock.setsockopt(IPPROTO_IP, IP_MULTICAST_TTL, 2)
+        self.__transmitter: Optional[RadioTransmitter] = None
+        if radio_rate > 0:
+            self.__transmitter = RadioTransmitter(
+                self.__transmit, radio_rate, stale_after=stale_after, extrapolate=extrapolate
+            )
+
+        self.__is_ready = True
 
     def __del__(self) -> None:
+        if not self.__is_ready:
+            return
         self.__logger.debug("Destructor called")
+        if self.__transmitter:
+            self.__transmitter.close()
         self.__stop_robots()
         self.__sock.close()
+        errors: dict[IPNetAddr, int] = {dist: count for dist, count in self.__fanout.errors.items() if count}
+        self.__logger.info("Sent %d datagrams (failed: %s)", self.__fanout.sent, errors or "none")
         self.__logger.info("Socket closed")
 
+    @property
+    def is_transmitting(self) -> bool:
+        """is_transmitting
+
+        Returns:
+            bool: True if the commands are sent at a fixed rate from a background thread (`send` never waits)
+        """
+        return self.__transmitter is not None
+
+    @property
+    def errors(self) -> dict[IPNetAddr, int]:
+        """errors
+
+        Returns:
+            dict[IPNetAddr, int]: Datagrams failed per destination
+        """
+        return self.__fanout.errors
+
     @property
     def dists(self) -> set[IPNetAddr]:
         """dists
@@ -85,32 +164,76 @@ class CommandSender:
         送信実行
         :return: None
         """
-        send_data = grSim_Commands(
-            timestamp=sim_cmds.timestamp,
-            isteamyellow=sim_cmds.isteamyellow,
-            robot_commands=sim_cmds.to_proto(),
-        )
+        if self.__transmitter:
+            self.__transmitter.put(sim_cmds)
+            return
+        self.__transmit(sim_cmds)
 
-        send_packet = grSim_Packet(commands=send_data)
-        self.__logger.debug("Sending packet %s", send_packet)
+    def __transmit(self, sim_cmds: SimCommands) -> int:
+        """transmit
 
-        packet: bytes = send_packet.SerializeToString()
-        self.__logger.debug("Sending packet: %s", packet)
+        Serialize and send the commands now.
 
-        for dist in set(self.dists):
-            self.__logger.debug(
-                "Sending to %s:%d (%s)",
-                dist.host,
-                dist.port,
-                ("real" if self.__is_real else "sim"),
-            )
+        Args:
+            sim_cmds (SimCommands): Commands to send
+
+        Returns:
+            int: Datagrams handed to the socket
+        """
+        if self.__robot_packets and all(cmd.robot_id in self.__robot_packets for cmd in sim_cmds.robot_commands):
+            return self.__send_each(sim_cmds)
+
+        packet: bytes = self.__packet.serialize(sim_cmds)
+        if self.__logger.isEnabledFor(DEBUG):
+            self.__logger.debug("Sending packet %s", self.__packet.packet)
+            self.__logger.debug("Sending packet: %s", packet)
+
+        return self.__fanout.send_all(packet)
+
+    def __send_each(self, sim_cmds: SimCommands) -> int:
+        """send_each
+
+        Send each robot a packet with only its command.
+
+        Args:
+            sim_cmds (SimCommands): Commands to send (all for robots of the targets)
+
+        Returns:
+            int: Datagrams handed to the socket
+        """
+        return self.__fanout.send(
+            [
+                (self.__robot_indices[cmd.robot_id], self.__robot_packets[cmd.robot_id].serialize_one(sim_cmds, cmd))
+                for cmd in sim_cmds.robot_commands
+            ]
+        )
+
+    def __burst(self, sim_cmds: SimCommands, duration: float, rate: float) -> str:
+        """burst
 
-            try:
-                self.__sock.sendto(packet, (dist.host, dist.port))
-            except socket_error as err:
-                self.__logger.error("Failed to send packet to %s:%d\t(%s)", dist.host, dist.port, err.strerror)
+        Send the same commands repeatedly at a fixed rate for a fixed duration (at least once).
 
-    def __imu_reset(self, count: int = 10) -> None:
+        Args:
+            sim_cmds (SimCommands): Commands to send
+            duration (float): Duration (s)
+            rate (float): Sends per second
+
+        Returns:
+            str: Summary of the datagrams delivered to the socket
+        """
+        count: int = max(1, round(duration * rate))
+        failed: int = sum(self.__fanout.errors.values())
+        delivered: int = 0
+        start: float = perf_counter()
+        for i in range(count):
+            if (wait := start + i / rate - perf_counter()) > 0:
+                sleep(wait)
+            delivered += self.__transmit(sim_cmds)
+        elapsed: float = perf_counter() - start
+        failed = sum(self.__fanout.errors.values()) - failed
+        return f"{delivered}/{delivered + failed} datagrams delivered in {elapsed:.3f} s ({count} at {rate:.0f} Hz)"
+
+    def __imu_reset(self) -> None:
         """reset_imu
 
         Send reset IMU command to all robots.
@@ -120,13 +243,9 @@ class CommandSender:
             isteamyellow=self.__is_team_yellow,
             robot_commands=[RobotCommand(254)],
         )
+        self.__logger.info("Sent reset IMU: %s", self.__burst(commands, *self.__imu_reset_burst))
 
-        start: float = perf_counter()
-        for _ in range(count):
-            self.send(commands)
-        self.__logger.info("Sent reset IMU for %.3f seconds", perf_counter() - start)
-
-    def __stop_robots(self, count: int = int(1e4)) -> None:
+    def __stop_robots(self) -> None:
         """stop_robots
 
         Send stop command to all robots.
@@ -140,8 +259,4 @@ class CommandSender:
             isteamyellow=self.__is_team_yellow,
             robot_commands=[RobotCommand(i) for i in id_set],
         )
-
-        start: float = perf_counter()
-        for _ in range(count):
-            self.send(commands)
-        self.__logger.info("Sent stop for %.3f seconds", perf_counter() - start)
+        self.__logger.info("Sent stop: %s", self.__burst(commands, *self.__stop_burst))
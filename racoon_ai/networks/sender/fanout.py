@@ -0,0 +1,253 @@
+#!/usr/bin/env python3.10
+
+"""fanout.py
+
+    This module contains
+        - UdpFanout
+"""
+
+from ctypes import (
+    CDLL,
+    POINTER,
+    Structure,
+    addressof,
+    c_char_p,
+    c_int,
+    c_size_t,
+    c_ubyte,
+    c_uint16,
+    c_uint32,
+    c_void_p,
+    pointer,
+    sizeof,
+)
+from ctypes.util import find_library
+from logging import Logger, getLogger
+from socket import AF_INET, gethostbyname, htons, inet_aton, socket
+from typing import Any, Callable, Optional, Sequence
+
+from racoon_ai.models.network import IPNetAddr
+
+
+class _SockAddrIn(Structure):  # pylint: disable=R0903
+    """struct sockaddr_in"""
+
+    _fields_ = [("family", c_uint16), ("port", c_uint16), ("addr", c_ubyte * 4), ("zero", c_ubyte * 8)]
+
+
+class _IOVec(Structure):  # pylint: disable=R0903
+    """struct iovec"""
+
+    _fields_ = [("base", c_char_p), ("len", c_size_t)]
+
+
+class _MsgHdr(Structure):  # pylint: disable=R0903
+    """struct msghdr"""
+
+    _fields_ = [
+        ("name", c_void_p),
+        ("namelen", c_uint32),
+        ("iov", POINTER(_IOVec)),
+        ("iovlen", c_size_t),
+        ("control", c_void_p),
+        ("controllen", c_size_t),
+        ("flags", c_int),
+    ]
+
+
+class _MMsgHdr(Structure):  # pylint: disable=R0903
+    """struct mmsghdr"""
+
+    _fields_ = [("hdr", _MsgHdr), ("len", c_uint32)]
+
+
+def _load_sendmmsg() -> Optional[Callable[..., int]]:
+    """load_sendmmsg
+
+    Returns:
+        Optional[Callable[..., int]]: sendmmsg(2) of the libc, None if the platform has none
+    """
+    name: Optional[str] = find_library("c")
+    if not name:
+        return None
+    try:
+        func: Any = getattr(CDLL(name, use_errno=True), "sendmmsg")
+    except (AttributeError, OSError):
+        return None
+    # NOTE: The messages are passed by address, to resume after a failure
+    func.argtypes = [c_int, c_void_p, c_uint32, c_int]
+    func.restype = c_int
+    sendmmsg: Callable[..., int] = func
+    return sendmmsg
+
+
+def _resolve(host: str) -> str:
+    """resolve
+
+    Returns:
+        str: IPv4 address of the host (the host itself if it cannot be resolved now)
+    """
+    try:
+        return gethostbyname(host)
+    except OSError:
+        return host
+
+
+class UdpFanout:  # pylint: disable=R0902
+    """UdpFanout
+
+    Sends the datagrams of a cycle to a fixed list of destinations, without blocking nor logging on the way:
+    the failures (including a full socket buffer) are counted per destination instead.
+
+    The addresses are resolved once. The datagrams of a call go out in a loop of `sendto`,
+    or with `batch` in a single sendmmsg(2) where the platform has it (Linux, IPv4 only).
+
+    Args:
+        sock (socket): UDP socket (made non-blocking)
+        dists (Sequence[IPNetAddr]): Destinations, in the order of their indices
+        batch (bool, optional): Use sendmmsg if available (default: False)
+
+    Attributes:
+        batched (bool): True if sendmmsg is in use
+        sent (int): Datagrams handed to the socket
+        errors (dict[IPNetAddr, int]): Datagrams failed per destination
+    """
+
+    def __init__(self, sock: socket, dists: Sequence[IPNetAddr], *, batch: bool = False) -> None:
+
+        self.__logger: Logger = getLogger(__name__)
+
+        self.__sock: socket = sock
+        self.__sock.setblocking(False)
+        self.__dists: tuple[IPNetAddr, ...] = tuple(dists)
+        self.__addrs: tuple[tuple[str, int], ...] = tuple((_resolve(dist.host), dist.port) for dist in self.__dists)
+        self.__all: tuple[int, ...] = tuple(range(len(self.__dists)))
+        self.__sent: int = 0
+        self.__errors: list[int] = [0] * len(self.__dists)
+
+        self.__sendmmsg: Optional[Callable[..., int]] = _load_sendmmsg() if batch else None
+        if batch and self.__sendmmsg is None:
+            self.__logger.warning("sendmmsg is not available; sending in a loop")
+        if self.__sendmmsg is not None:
+            self.__prepare_batch()
+
+    @property
+    def batched(self) -> bool:
+        """batched"""
+        return self.__sendmmsg is not None
+
+    @property
+    def sent(self) -> int:
+        """sent"""
+        return self.__sent
+
+    @property
+    def errors(self) -> dict[IPNetAddr, int]:
+        """errors"""
+        return dict(zip(self.__dists, self.__errors))
+
+    def send_all(self, packet: bytes) -> int:
+        """send_all
+
+        Args:
+            packet (bytes): Datagram for every destination
+
+        Returns:
+            int: Datagrams handed to the socket
+        """
+        return self.send([(index, packet) for index in self.__all])
+
+    def send(self, datagrams: Sequence[tuple[int, bytes]]) -> int:
+        """send
+
+        Args:
+            datagrams (Sequence[tuple[int, bytes]]): Index of the destination and datagram
+
+        Returns:
+            int: Datagrams handed to the socket
+        """
+        sent: int = self.__send_batch(datagrams) if self.__sendmmsg is not None else self.__send_loop(datagrams)
+        self.__sent += sent
+        return sent
+
+    def __send_loop(self, datagrams: Sequence[tuple[int, bytes]]) -> int:
+        """send_loop"""
+        sendto = self.__sock.sendto
+        addrs: tuple[tuple[str, int], ...] = self.__addrs
+        sent: int = 0
+        for index, packet in datagrams:
+            try:
+                sendto(packet, addrs[index])
+            except OSError:
+                self.__errors[index] += 1
+                continue
+            sent += 1
+        return sent
+
+    def __prepare_batch(self) -> None:
+        """prepare_batch
+
+        Address and vector of each message of sendmmsg, filled once.
+        """
+        n_dists: int = len(self.__dists)
+        self.__names: Any = (_SockAddrIn * n_dists)()
+        self.__iovs: Any = (_IOVec * n_dists)()
+        self.__msgs: Any = (_MMsgHdr * n_dists)()
+        try:
+            for index, (host, port) in enumerate(self.__addrs):
+                self.__names[index].family = AF_INET
+                self.__names[index].port = htons(port)
+                # NOTE: Copied as integers (bytes would stop at the first NUL)
+                self.__names[index].addr[:] = list(inet_aton(host))
+        except OSError as err:
+            self.__logger.warning("Failed to resolve the destinations for sendmmsg (%s); sending in a loop", err)
+            self.__sendmmsg = None
+            return
+        self.__name_ptrs: tuple[int, ...] = tuple(addressof(name) for name in self.__names)
+        self.__msgs_ptr: int = addressof(self.__msgs)
+        for index in range(n_dists):
+            self.__msgs[index].hdr.namelen = sizeof(_SockAddrIn)
+            self.__msgs[index].hdr.iov = pointer(self.__iovs[index])
+            self.__msgs[index].hdr.iovlen = 1
+
+    def __send_batch(self, datagrams: Sequence[tuple[int, bytes]]) -> int:
+        """send_batch
+
+        The messages hold one datagram per destination; more datagrams (e.g. two for a destination)
+        go in chunks of that size.
+        """
+        capacity: int = len(self.__msgs)
+        sent: int = 0
+        for start in range(0, len(datagrams), capacity):
+            sent += self.__send_chunk(datagrams[start : start + capacity])
+        return sent
+
+    def __send_chunk(self, datagrams: Sequence[tuple[int, bytes]]) -> int:
+        """send_chunk
+
+        Args:
+            datagrams (Sequence[tuple[int, bytes]]): At most as many datagrams as destinations
+
+        Returns:
+            int: Datagrams handed to the socket
+        """
+        sendmmsg: Callable[..., int] = self.__sendmmsg  # type: ignore[assignment]
+        count: int = len(datagrams)
+        for slot, (index, packet) in enumerate(datagrams):
+            self.__msgs[slot].hdr.name = self.__name_ptrs[index]
+            self.__iovs[slot].base = packet
+            self.__iovs[slot].len = len(packet)
+
+        # NOTE: sendmmsg stops at the first failure (counted), the rest goes in the next call
+        fileno: int = self.__sock.fileno()
+        sent: int = 0
+        done: int = 0
+        while done < count:
+            result: int = sendmmsg(fileno, self.__msgs_ptr + done * sizeof(_MMsgHdr), count - done, 0)
+            if result < 0:
+                self.__errors[datagrams[done][0]] += 1
+                done += 1
+                continue
+            sent += result
+            done += result
+        return sent
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3.10
+
+"""guard.py
+
+    This module contains
+        - try_send
+"""
+
+from logging import Logger
+from typing import Callable
+
+from racoon_ai.models.robot import SimCommands
+
+
+def try_send(send: Callable[[SimCommands], object], sim_cmds: SimCommands, logger: Logger) -> bool:
+    """try_send
+
+    Send the commands from a background thread, which must keep running if a send fails.
+
+    Args:
+        send (Callable[[SimCommands], object]): Function sending the commands
+        sim_cmds (SimCommands): Commands to send
+        logger (Logger): Logger of the failures
+
+    Returns:
+        bool: True if sent
+    """
+    try:
+        send(sim_cmds)
+    except Exception as err:  # pylint: disable=W0703
+        # NOTE: Keep the thread alive; the next commands may go through
+        logger.error("Failed to send commands (%s)", err)
+        return False
+    return True
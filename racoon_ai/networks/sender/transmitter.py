@@ -0,0 +1,201 @@
+#!/usr/bin/env python3.10
+
+"""transmitter.py
+
+    This module contains
+        - RadioTransmitter
+"""
+
+from copy import copy
+from logging import Logger, getLogger
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Callable, Optional
+
+from racoon_ai.models.robot import RobotCommand, SimCommands
+
+from .guard import try_send
+
+
+class RadioTransmitter:  # pylint: disable=R0902
+    """RadioTransmitter
+
+    Sends the latest commands at a fixed rate on a background thread, whatever the rate of the vision:
+    the robots get a steady stream even if the frames come irregularly or a cycle stalls.
+
+    Commands older than `stale_after` are replaced by a stop of the same robots (watchdog),
+    until new commands come. With `extrapolate`, the velocities are extrapolated from the last two commands
+    for up to that many seconds after the last one (then held).
+
+    Args:
+        send (Callable[[SimCommands], object]): Function sending the commands (e.g. to the socket)
+        rate (float): Sends per second
+        stale_after (float, optional): Age of the commands to stop the robots (s) (default: 0.2)
+        extrapolate (float, optional): Horizon of the extrapolation of the velocities (s) (default: 0, disabled)
+
+    Attributes:
+        sent (int): Commands sent
+        stopped (int): Stops sent because the commands were stale
+        missed (int): Ticks skipped because a send overran
+    """
+
+    def __init__(
+        self,
+        send: Callable[[SimCommands], object],
+        rate: float,
+        *,
+        stale_after: float = 0.2,
+        extrapolate: float = 0,
+    ) -> None:
+
+        self.__logger: Logger = getLogger(__name__)
+        self.__logger.debug("Initializing...")
+
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+
+        self.__send: Callable[[SimCommands], object] = send
+        self.__period: float = 1 / rate
+        self.__stale_after: float = stale_after
+        self.__extrapolate: float = extrapolate
+
+        # NOTE: The latest commands and their time, and the ones before them (for the extrapolation)
+        self.__lock: Lock = Lock()
+        self.__latest: Optional[tuple[float, SimCommands]] = None
+        self.__previous: Optional[tuple[float, SimCommands]] = None
+        self.__stop_cmds: Optional[SimCommands] = None
+
+        self.__sent: int = 0
+        self.__stopped: int = 0
+        self.__missed: int = 0
+
+        self.__closing: Event = Event()
+        thread: Thread = Thread(target=self.__transmit_loop, name="RadioTransmitter", daemon=True)
+        thread.start()
+        self.__thread: Optional[Thread] = thread
+        self.__logger.info(
+            "Transmitting at %.1f Hz (stop after %.3f s, extrapolate for %.3f s)", rate, stale_after, extrapolate
+        )
+
+    def __del__(self) -> None:
+        self.close()
+
+    @property
+    def sent(self) -> int:
+        """sent"""
+        return self.__sent
+
+    @property
+    def stopped(self) -> int:
+        """stopped"""
+        return self.__stopped
+
+    @property
+    def missed(self) -> int:
+        """missed"""
+        return self.__missed
+
+    def put(self, sim_cmds: SimCommands) -> None:
+        """put
+
+        Args:
+            sim_cmds (SimCommands): Commands to send from now on (must not be modified afterwards)
+        """
+        with self.__lock:
+            self.__previous = self.__latest
+            self.__latest = (perf_counter(), sim_cmds)
+
+    def close(self) -> None:
+        """close
+
+        Stop the thread.
+        """
+        if not self.__thread:
+            return
+        self.__closing.set()
+        self.__thread.join(timeout=1)
+        self.__thread = None
+        self.__logger.info(
+            "Transmitter stopped (sent: %d, stopped: %d, missed: %d)", self.sent, self.stopped, self.missed
+        )
+
+    def __transmit_loop(self) -> None:
+        """transmit_loop
+
+        Paced on absolute deadlines; a send which overruns skips the ticks it missed.
+        """
+        deadline: float = perf_counter()
+        while not self.__closing.wait(max(0, deadline - perf_counter())):
+            now: float = perf_counter()
+            if now > deadline + self.__period:
+                missed: int = int((now - deadline) / self.__period)
+                deadline += missed * self.__period
+                self.__missed += missed
+            deadline += self.__period
+
+            if (sim_cmds := self.__commands(now)) is None:
+                continue
+            if try_send(self.__send, sim_cmds, self.__logger):
+                self.__sent += 1
+
+    def __commands(self, now: float) -> Optional[SimCommands]:
+        """commands
+
+        Args:
+            now (float): Time of the tick
+
+        Returns:
+            Optional[SimCommands]: Commands to send at the tick (None if none came yet)
+        """
+        with self.__lock:
+            latest, previous = self.__latest, self.__previous
+        if latest is None:
+            return None
+
+        received, sim_cmds = latest
+        age: float = now - received
+        if age > self.__stale_after:
+            if self.__stop_cmds is None:
+                self.__logger.warning("No commands for %.3f s, stopping the robots", age)
+                self.__stop_cmds = SimCommands(
+                    sim_cmds.isteamyellow, [RobotCommand(cmd.robot_id) for cmd in sim_cmds.robot_commands]
+                )
+            self.__stopped += 1
+            return self.__stop_cmds
+
+        if self.__stop_cmds is not None:
+            self.__logger.info("Commands resumed")
+            self.__stop_cmds = None
+
+        if self.__extrapolate <= 0 or previous is None:
+            return sim_cmds
+        return self.__extrapolated(
+            sim_cmds, previous[1], min(age, self.__extrapolate) / max(received - previous[0], 1e-3)
+        )
+
+    @staticmethod
+    def __extrapolated(sim_cmds: SimCommands, previous: SimCommands, ratio: float) -> SimCommands:
+        """extrapolated
+
+        Args:
+            sim_cmds (SimCommands): Latest commands
+            previous (SimCommands): Commands before them
+            ratio (float): Time since the latest over the time between the two
+
+        Returns:
+            SimCommands: Copy of the latest commands with the velocities extrapolated
+        """
+        robot_commands: list[RobotCommand] = []
+        for cmd in sim_cmds.robot_commands:
+            if (before := previous.get_robot_command(cmd.robot_id)) is None:
+                robot_commands.append(cmd)
+                continue
+            extrapolated: RobotCommand = copy(cmd)
+            extrapolated.vel_fwd += (cmd.vel_fwd - before.vel_fwd) * ratio
+            extrapolated.vel_sway += (cmd.vel_sway - before.vel_sway) * ratio
+            extrapolated.vel_angular += (cmd.vel_angular - before.vel_angular) * ratio
+            robot_commands.append(extrapolated)
+
+        extrapolated_cmds: SimCommands = SimCommands(sim_cmds.isteamyellow, robot_commands)
+        extrapolated_cmds.timestamp = sim_cmds.timestamp
+        return extrapolated_cmds
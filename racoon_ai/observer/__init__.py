@@ -4,23 +4,25 @@
 
 from configparser import ConfigParser
 from logging import Logger
+from typing import Optional
+
+from racoon_ai.networks.receiver import MWReceiver, PacketRecorder, PacketReplayer, PacketSource, find_logs
 
 from .observer import Observer
 
 
-def create_observer(config: ConfigParser, logger: Logger) -> Observer:
-    """create_receiver
+def create_observer(config: ConfigParser, logger: Logger, receiver: Optional[PacketSource] = None) -> Observer:
+    """create_observer
 
-    This function is for creating a MWReceiver.
+    This function is for creating an Observer.
 
     Args:
         config: ConfigParser
         logger: Logger
-        target_ids: list[int]
-        is_team_yellow: bool
+        receiver: Optional[PacketSource] (defaults: create_receiver)
 
     Returns:
-        MWReceiver
+        Observer
     """
     # List of target robot ids
     target_ids: set[int] = {int(i) for i in config.get("commons", "targetIds").split(",")}
@@ -43,16 +45,56 @@ def create_observer(config: ConfigParser, logger: Logger) -> Observer:
     is_team_yellow: bool = config.getboolean("commons", "isTeamYellow", fallback=False)
     logger.info("Team: %s", ("Yellow" if is_team_yellow else "Blue"))
 
+    if receiver is None:
+        receiver = create_receiver(config, logger)
+
+    return Observer(target_ids, imu_ids, is_real, is_team_yellow, receiver=receiver)
+
+
+def create_receiver(config: ConfigParser, logger: Logger) -> PacketSource:
+    """create_receiver
+
+    This function is for creating the source of the packets (MWReceiver, or PacketReplayer on replay).
+
+    Args:
+        config: ConfigParser
+        logger: Logger
+
+    Returns:
+        PacketSource
+    """
+    # Replay the recorded packets instead of receiving from MW
+    if replay := config.get("mw_receiver", "replay", fallback=""):
+        speed: float = config.getfloat("mw_receiver", "replay_speed", fallback=1.0)
+        loop: bool = config.getboolean("mw_receiver", "replay_loop", fallback=False)
+        logger.info("Replay: %s (speed: %s, loop: %s)", replay, speed, loop)
+        return PacketReplayer(find_logs(replay), speed, loop)
+
+    # Flag if receive packets on a background thread
+    # (always on with the pipeline or the fixed rate, which must get the latest packet, not the oldest queued)
+    use_pipeline: bool = config.getboolean("pipeline", "enabled", fallback=False)
+    use_fixed_rate: bool = config.getfloat("scheduler", "rate", fallback=0) > 0
+    use_recv_thread: bool = (
+        use_pipeline or use_fixed_rate or config.getboolean("mw_receiver", "use_thread", fallback=False)
+    )
+    logger.info("Receive thread: %s", ("Enabled" if use_recv_thread else "Disabled"))
+
+    # Record the received packets
+    recorder: Optional[PacketRecorder] = None
+    if config.getboolean("mw_receiver", "record", fallback=False):
+        recorder = PacketRecorder(config.get("mw_receiver", "record_dir", fallback="") or ".cache/records")
+
     if not config.getboolean("mw_receiver", "use_custom_addr", fallback=False):
-        return Observer(target_ids, imu_ids, is_real, is_team_yellow)
+        return MWReceiver(use_thread=use_recv_thread, recorder=recorder)
 
     mw_host: str = config.get("mw_receiver", "host") or "localhost"
     mw_port: int = int(config.get("mw_receiver", "port") or 30011)
     logger.info("Using custom address for MW: %s:%d", mw_host, mw_port)
-    return Observer(target_ids, imu_ids, is_real, is_team_yellow, host=mw_host, port=mw_port)
+    return MWReceiver(mw_host, mw_port, use_thread=use_recv_thread, recorder=recorder)
 
 
 __all__ = [
     "create_observer",
+    "create_receiver",
     "Observer",
 ]
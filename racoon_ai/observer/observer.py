@@ -10,12 +10,15 @@
 from logging import getLogger
 from typing import Optional
 
+from numpy import arange, dot, int64, left_shift
+from numpy.typing import NDArray
+
 from racoon_ai.models.ball import Ball
 from racoon_ai.models.geometry import Geometry
 from racoon_ai.models.referee import Referee
-from racoon_ai.models.robot import Robot
-from racoon_ai.networks.receiver.mw_receiver import MWReceiver
-from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet, Robot_Infos
+from racoon_ai.models.robot import Robot, RobotStates
+from racoon_ai.networks.receiver import MWReceiver, PacketRecorder, PacketSource
+from racoon_ai.proto.pb_gen.to_racoonai_pb2 import RacoonMW_Packet
 
 
 class Observer:  # pylint: disable=R0904
@@ -27,6 +30,9 @@ class Observer:  # pylint: disable=R0904
         is_team_yellow (bool, optional): If true, the team is yellow (default: False)
         host (str, optional): IP or hostname of the server
         port (int, optional): Port number of the vision server
+        use_recv_thread (bool, optional): If true, receive packets on a background thread (default: False)
+        receiver (PacketSource, optional): Source of the packets (default: MWReceiver bound to host:port)
+        recorder (PacketRecorder, optional): Recorder of the packets received by the default MWReceiver
     """
 
     def __init__(
@@ -38,9 +44,16 @@ class Observer:  # pylint: disable=R0904
         *,
         host: str = "127.0.0.1",
         port: int = 30011,
+        use_recv_thread: bool = False,
+        receiver: Optional[PacketSource] = None,
+        recorder: Optional[PacketRecorder] = None,
     ) -> None:
 
-        self.__mw_receiver: MWReceiver = MWReceiver(host, port)
+        self.__mw_receiver: PacketSource = (
+            receiver
+            if (receiver is not None)
+            else MWReceiver(host, port, use_thread=use_recv_thread, recorder=recorder)
+        )
 
         self.__logger = getLogger(__name__)
         self.__logger.debug("Initializing...")
@@ -55,10 +68,31 @@ class Observer:  # pylint: disable=R0904
         self.__is_real: bool = is_real
         self.__is_team_yellow: bool = is_team_yellow
 
+        self.__our_states: RobotStates = RobotStates(16)
+        self.__enemy_states: RobotStates = RobotStates(16)
+
         self.__our_robots: list[Robot] = [
-            Robot(i, is_imu_enabled=(self.is_real and (i in self.imu_enabled_ids))) for i in range(16)
+            Robot(i, is_imu_enabled=(self.is_real and (i in self.imu_enabled_ids)), states=self.__our_states)
+            for i in range(self.__our_states.size)
+        ]
+        self.__enemy_robots: list[Robot] = [
+            Robot(i, states=self.__enemy_states) for i in range(self.__enemy_states.size)
         ]
-        self.__enemy_robots: list[Robot] = [Robot(i) for i in range(16)]
+
+        self.__id_bits: NDArray[int64] = left_shift(1, arange(self.__our_states.size, dtype=int64))
+        self.__all_ids_mask: int = (1 << self.__our_states.size) - 1
+        self.__our_visible_mask: int = 0
+        self.__our_online_mask: int = 0
+        self.__enemy_visible_mask: int = 0
+
+        # NOTE: Computed once per packet in `main`, shared by every caller until the next packet
+        self.__frame: int = 0
+        self.__our_available_mask: int = -1
+        self.__enemy_available_mask: int = -1
+        self.__our_available_ids: tuple[int, ...] = ()
+        self.__enemy_available_ids: tuple[int, ...] = ()
+        self.__our_robots_available: frozenset[Robot] = frozenset()
+        self.__enemy_robots_available: frozenset[Robot] = frozenset()
 
         self.__sec_per_frame: float
         self.__n_camras: int
@@ -73,9 +107,20 @@ class Observer:  # pylint: disable=R0904
         self.__logger.debug("Destructor called")
         del self.__mw_receiver
 
-    def main(self) -> None:
-        """main"""
-        proto: RacoonMW_Packet = self.__mw_receiver.recv()
+    def main(self, timeout: Optional[float] = None) -> bool:
+        """main
+
+        Args:
+            timeout (float, optional): Seconds to wait for a packet (default: None, wait forever)
+
+        Returns:
+            bool: False if no packet arrived within the timeout (the state is left as is)
+        """
+        proto: RacoonMW_Packet
+        try:
+            proto = self.__mw_receiver.recv(timeout)
+        except TimeoutError:
+            return False
 
         self.__sec_per_frame = proto.info.secperframe
 
@@ -98,25 +143,20 @@ class Observer:  # pylint: disable=R0904
         self.referee.update(proto.referee)
         self.__logger.debug("Referee: %s", self.referee)
 
-        bot: Optional[Robot]
-        proto_bot: Robot_Infos
-        for proto_bot in proto.our_robots:
-            bot = self.get_our_by_id(proto_bot.robot_id, False, False)
-            if not bot:
-                self.__logger.warning("Our robot %d could not be set", proto_bot.robot_id)
-                continue
-            bot.update(proto_bot, self.sec_per_frame)
-            self.__logger.debug(bot)
-            del bot
-
-        for proto_bot in proto.enemy_robots:
-            bot = self.get_enemy_by_id(proto_bot.robot_id, False)
-            if not bot:
-                self.__logger.warning("Enemy robot %d could not be set", proto_bot.robot_id)
-                continue
-            bot.update(proto_bot, self.sec_per_frame)
-            self.__logger.debug(bot)
-            del bot
+        robot_id: int
+        for robot_id in self.__our_states.update(proto.our_robots, self.sec_per_frame):
+            self.__logger.warning("Our robot %d could not be set", robot_id)
+
+        for robot_id in self.__enemy_states.update(proto.enemy_robots, self.sec_per_frame):
+            self.__logger.warning("Enemy robot %d could not be set", robot_id)
+
+        self.__update_masks()
+        self.__update_available()
+        self.__frame += 1
+
+        self.__logger.debug("Our robots: %s", self.__our_states)
+        self.__logger.debug("Enemy robots: %s", self.__enemy_states)
+        return True
 
     @property
     def ball(self) -> Ball:
@@ -191,13 +231,31 @@ class Observer:  # pylint: disable=R0904
         return self.__our_robots
 
     @property
-    def our_robots_available(self) -> set[Robot]:
+    def our_states(self) -> RobotStates:
+        """our_states
+
+        Returns:
+            RobotStates: Array-backed states of our robots (indexed by robot id)
+        """
+        return self.__our_states
+
+    @property
+    def our_robots_available(self) -> frozenset[Robot]:
         """our_robot_available
 
         Returns:
-            set[Robot]: Available robots (i.e. is_online and is_visible)
+            frozenset[Robot]: Available robots (i.e. is_online and is_visible), cached for the current frame
+        """
+        return self.__our_robots_available
+
+    @property
+    def our_available_ids(self) -> tuple[int, ...]:
+        """our_available_ids
+
+        Returns:
+            tuple[int, ...]: Sorted ids of `our_robots_available`
         """
-        return set(bot for bot in (self.get_our_by_id(bid, True, True) for bid in self.target_ids) if bot)
+        return self.__our_available_ids
 
     @property
     def enemy_robots(self) -> list[Robot]:
@@ -209,15 +267,40 @@ class Observer:  # pylint: disable=R0904
         return self.__enemy_robots
 
     @property
-    def enemy_robots_available(self) -> set[Robot]:
+    def enemy_states(self) -> RobotStates:
+        """enemy_states
+
+        Returns:
+            RobotStates: Array-backed states of enemy robots (indexed by robot id)
+        """
+        return self.__enemy_states
+
+    @property
+    def enemy_robots_available(self) -> frozenset[Robot]:
         """enemy_robots_available
 
         Returns:
-            set[Robot]: Available robots (i.e. is_visible)
+            frozenset[Robot]: Available robots (i.e. is_visible), cached for the current frame
         """
-        return set(
-            bot for bot in (self.get_enemy_by_id(bid, True) for bid in range(self.num_of_enemy_vision_robots)) if bot
-        )
+        return self.__enemy_robots_available
+
+    @property
+    def enemy_available_ids(self) -> tuple[int, ...]:
+        """enemy_available_ids
+
+        Returns:
+            tuple[int, ...]: Sorted ids of `enemy_robots_available`
+        """
+        return self.__enemy_available_ids
+
+    @property
+    def frame(self) -> int:
+        """frame
+
+        Returns:
+            int: Number of packets processed so far
+        """
+        return self.__frame
 
     def get_our_by_id(self, robot_id: int, only_online: bool = False, only_visible: bool = True) -> Optional[Robot]:
         """get_our_by_id
@@ -230,12 +313,14 @@ class Observer:  # pylint: disable=R0904
         Returns:
             Optional[Robot]: None if not found
         """
-        return self.__binary_search(
-            robot_id,
-            maximum=len(self.__our_robots),
-            only_online=only_online,
-            only_visible=only_visible,
-        )
+        mask: int = self.__all_ids_mask
+        if only_online:
+            mask &= self.__our_online_mask
+        if only_visible:
+            mask &= self.__our_visible_mask
+        if (robot_id < 0) or not mask >> robot_id & 1:
+            return None
+        return self.__our_robots[robot_id]
 
     def get_enemy_by_id(self, enemy_id: int, only_visible: bool = True) -> Optional[Robot]:
         """get_enemy_by_id
@@ -247,71 +332,90 @@ class Observer:  # pylint: disable=R0904
         Returns:
             Optional[Robot]: None if not found
         """
-        return self.__binary_search(
-            enemy_id,
-            maximum=len(self.__enemy_robots),
-            search_enemy=True,
-            only_online=False,
-            only_visible=only_visible,
-        )
+        mask: int = self.__enemy_visible_mask if only_visible else self.__all_ids_mask
+        if (enemy_id < 0) or not mask >> enemy_id & 1:
+            return None
+        return self.__enemy_robots[enemy_id]
 
-    def __binary_search(
-        self,
-        target_id: int,
-        minimum: int = 0,
-        maximum: int = 12,
-        search_enemy: bool = False,
-        only_online: bool = False,
-        only_visible: bool = True,
-    ) -> Optional[Robot]:
-        """__binary_search
+    @property
+    def our_visible_mask(self) -> int:
+        """our_visible_mask
 
-        Args:
-            target_id (int): Target robot id
-            minimum (int): Minimum index of the list (default: 0)
-            maximum (int): Maximum index (default: 12)
-            search_enemy (bool, optional): If true, search enemy (default: False)
-            only_online (bool, optional): If True, only online robots are returned (default: False)
-            only_visible (bool, optional): If True, only visible robots are returned (default: True)
+        Returns:
+            int: Bitmask of visible robot ids (bit `i` is set if our robot `i` is visible)
+        """
+        return self.__our_visible_mask
+
+    @property
+    def our_online_mask(self) -> int:
+        """our_online_mask
 
         Returns:
-            Optional[Robot]
-        """
-        self.__logger.debug(
-            "Search robot (only_online: %s, only_visible: %s, search_enemy: %s): target=%d, min=%d, max=%d",
-            only_online,
-            only_visible,
-            search_enemy,
-            target_id,
-            minimum,
-            maximum,
-        )
+            int: Bitmask of online robot ids (bit `i` is set if our robot `i` is online)
+        """
+        return self.__our_online_mask
 
-        if maximum < minimum:
-            return None
+    @property
+    def enemy_visible_mask(self) -> int:
+        """enemy_visible_mask
 
-        bots: list[Robot] = self.our_robots if (not search_enemy) else self.enemy_robots
-        mid = (minimum + maximum) // 2
+        Returns:
+            int: Bitmask of visible enemy ids (bit `i` is set if enemy robot `i` is visible)
+        """
+        return self.__enemy_visible_mask
 
-        if mid == target_id:
-            # NOTE: Equivalent to `(not search_enemy) and (not (mid in self.__target_ids))`
-            if not ((search_enemy) or (target_id in self.__target_ids)):
-                self.__logger.info("Robot %d is not in our target ids", target_id)
+    def __update_masks(self) -> None:
+        """update_masks
 
-            bot: Robot = bots[mid]
-            if only_online and (not bot.is_online):
-                self.__logger.info("Robot id %d is offline", mid)
-                return None
-            if only_visible and (not bot.is_visible):
-                self.__logger.info("Robot id %d is not on stage", mid)
-                return None
+        Recompute the per-frame bitmasks, logging the robots whose status changed.
+        """
+        our_visible: int = int(dot(self.__our_states.is_visible, self.__id_bits))
+        our_online: int = int(dot(self.__our_states.is_online, self.__id_bits))
+        enemy_visible: int = int(dot(self.__enemy_states.is_visible, self.__id_bits))
+
+        if changed := our_online ^ self.__our_online_mask:
+            self.__log_changes("Robot", "online", "offline", changed, our_online)
+        if changed := our_visible ^ self.__our_visible_mask:
+            self.__log_changes("Robot", "on stage", "not on stage", changed, our_visible)
+        if changed := enemy_visible ^ self.__enemy_visible_mask:
+            self.__log_changes("Enemy", "on stage", "not on stage", changed, enemy_visible)
 
-            self.__logger.debug("Bot: %s", bot)
-            return bot
+        self.__our_visible_mask = our_visible
+        self.__our_online_mask = our_online
+        self.__enemy_visible_mask = enemy_visible
 
-        if mid < target_id:
-            return self.__binary_search(target_id, (mid + 1), maximum, search_enemy, only_online, only_visible)
-        return self.__binary_search(target_id, minimum, (mid - 1), search_enemy, only_online, only_visible)
+    def __update_available(self) -> None:
+        """update_available
+
+        Rebuild the available robots of the frame (only if the bitmasks changed).
+        """
+        target_mask: int = sum(1 << i for i in self.__target_ids if 0 <= i < self.__our_states.size)
+        our_mask: int = target_mask & self.__our_online_mask & self.__our_visible_mask
+        if our_mask != self.__our_available_mask:
+            self.__our_available_mask = our_mask
+            self.__our_available_ids = tuple(i for i in range(our_mask.bit_length()) if (our_mask >> i) & 1)
+            self.__our_robots_available = frozenset(self.__our_robots[i] for i in self.__our_available_ids)
+
+        num_of_enemies: int = min(max(self.__num_of_enemy_robots, 0), self.__enemy_states.size)
+        enemy_mask: int = ((1 << num_of_enemies) - 1) & self.__enemy_visible_mask
+        if enemy_mask != self.__enemy_available_mask:
+            self.__enemy_available_mask = enemy_mask
+            self.__enemy_available_ids = tuple(i for i in range(enemy_mask.bit_length()) if (enemy_mask >> i) & 1)
+            self.__enemy_robots_available = frozenset(self.__enemy_robots[i] for i in self.__enemy_available_ids)
+
+    def __log_changes(self, name: str, set_msg: str, unset_msg: str, changed: int, mask: int) -> None:
+        """log_changes
+
+        Args:
+            name (str): Name of the team to log
+            set_msg (str): Message when the bit is set
+            unset_msg (str): Message when the bit is unset
+            changed (int): Bitmask of the changed ids
+            mask (int): Current bitmask
+        """
+        for robot_id in range(changed.bit_length()):
+            if (changed >> robot_id) & 1:
+                self.__logger.info("%s id %d is %s", name, robot_id, (set_msg if (mask >> robot_id) & 1 else unset_msg))
 
     @property
     def sec_per_frame(self) -> float:
@@ -60,17 +60,9 @@ class OutOfPlay(StrategyBase):
 
         self.send_cmds = []
 
-        target_bot_set: set[Robot] = set()
-        if not without_attacker:
-            target_bot_set = self.observer.our_robots_available
-
-        else:
-            for bot in self.observer.our_robots_available:
-                if not bot:
-                    continue
-                if bot.robot_id == self.__subrole.our_attacker_id:
-                    continue
-                target_bot_set.add(bot)
+        target_bot_set: frozenset[Robot] = self.observer.our_robots_available
+        if without_attacker:
+            target_bot_set = frozenset(bot for bot in target_bot_set if bot.robot_id != self.__subrole.our_attacker_id)
 
         cmds: list[RobotCommand] = reset_all_imu(target_bot_set)
         self.send_cmds += cmds
@@ -190,7 +182,7 @@ class OutOfPlay(StrategyBase):
         )
 
         for bot in self.observer.our_robots_available:
-            cmd = self.controls.pid(target_pose, bot)
+            cmd = self.controls.move(target_pose, bot)
             cmd = self.controls.avoid_enemy(cmd, bot, target_pose)
             self.send_cmds += [cmd]
             target_pose.x += 500 * self.observer.attack_direction
@@ -230,7 +222,7 @@ class OutOfPlay(StrategyBase):
                         self.observer.geometry.field_width / 2 * (1 - 0.5 * (i + 1)),
                         MU.radian(self.__their_goal, self.__goal),
                     )
-                    cmd = self.controls.pid(target_pose, bot)
+                    cmd = self.controls.move(target_pose, bot)
                     cmd = self.controls.avoid_ball(cmd, bot, target_pose)
                 cmd = self.controls.avoid_enemy(cmd, bot, target_pose)
                 cmd = self.controls.speed_limiter(cmd)
@@ -252,7 +244,7 @@ class OutOfPlay(StrategyBase):
                 bot.y,
                 0,
             )
-            cmd: RobotCommand = self.controls.pid(target_pose, bot)
+            cmd: RobotCommand = self.controls.move(target_pose, bot)
             cmd = self.controls.avoid_ball(cmd, bot, target_pose)
             cmd = self.controls.avoid_enemy(cmd, bot, target_pose)
             cmd = self.controls.speed_limiter(cmd)
@@ -31,6 +31,8 @@ class Strategy:
 
         self.__controls: Controls = controls
 
+        self.__role: Role = role
+
         self.__subrole: SubRole = SubRole(observer, role)
 
         self.__defense: Defense = Defense(observer, role, self.__subrole, self.__controls)
@@ -71,3 +73,19 @@ class Strategy:
     def update_subrole(self) -> None:
         """update_subrole"""
         self.__subrole.main()
+        self.__controls.update(self.__assignments())
+
+    def __assignments(self) -> dict[int, str]:
+        """assignments
+
+        Returns:
+            dict[int, str]: Role of each of our robots (to reset the PID state on a change)
+        """
+        assignments: dict[int, str] = dict.fromkeys(self.__role.offense_id_list, "offense")
+        assignments.update(dict.fromkeys(self.__role.defense_id_list, "defense"))
+        assignments[self.__role.keeper_id] = "keeper"
+        assignments[self.__subrole.receiver_id] = "receiver"
+        assignments[self.__subrole.our_attacker_id] = "attacker"
+        # NOTE: -1 stands for no robot
+        assignments.pop(-1, None)
+        return assignments